@@ -1,14 +1,15 @@
 # r: pyshp
 
 import Rhino.Geometry as geo
-import shapefile
 import os
 from typing import List, Tuple, Any, Optional
 
 import utils
-import importlib
 
-importlib.reload(utils)
+from lauslecture import runtime
+
+# 개발 모드(LAUS_DEV=1)에서만 utils 새로고침
+runtime.reload_if_dev(utils)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,18 @@
 # r: pyshp
 
 import Rhino.Geometry as geo
-import shapefile
 import os
 from typing import List, Tuple, Any, Optional
-import ghpythonlib.components as ghcomp
 import utils
 from utils import Lot, Road, Parcel
-import importlib
 
-importlib.reload(utils)
+from lauslecture import runtime
+
+# 개발 모드(LAUS_DEV=1)에서만 utils 새로고침
+runtime.reload_if_dev(utils)
+
+# Clipper 오프셋을 쓸 때만 그래스호퍼 컴포넌트 로드
+ghcomp = runtime.lazy_import("ghpythonlib.components")
 
 
 
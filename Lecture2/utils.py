@@ -1,10 +1,19 @@
 # r: pyshp
 
 import Rhino.Geometry as geo
-import shapefile
 import os
+import sys
 from typing import List, Tuple, Any, Optional
-import ghpythonlib.components as ghcomp
+
+# 공용 패키지(lauslecture) 경로 등록
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from lauslecture import runtime  # noqa: E402
+
+# 무거운 모듈은 실제로 사용할 때 import
+shapefile = runtime.lazy_import("shapefile")
 
 
 class Parcel:
@@ -82,7 +91,13 @@ class Lot(Parcel):
 
 
 def read_shp_file(file_path: str) -> Tuple[List[Any], List[Any], List[str]]:
-    """shapefile을 읽어서 shapes와 records를 반환"""
+    """shapefile을 읽어서 shapes와 records를 반환 (파일이 그대로면 이전 결과 재사용)"""
+    return runtime.cached_file(
+        "Lecture2.shp", [file_path], lambda: _read_shp_file(file_path)
+    )
+
+
+def _read_shp_file(file_path: str) -> Tuple[List[Any], List[Any], List[str]]:
     try:
         sf = shapefile.Reader(file_path, encoding="utf-8")
     except:
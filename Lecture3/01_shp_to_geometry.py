@@ -1,12 +1,15 @@
 # -*- coding:utf-8 -*-
 from typing import List, Tuple, Optional
-import ghpythonlib.components as ghcomp  # ignore
 import os
 import Rhino.Geometry as geo  # ignore
 import utils
-import importlib
 
-importlib.reload(utils)
+from lauslecture import runtime, timing
+
+# 개발 모드(LAUS_DEV=1)에서만 utils 새로고침
+runtime.reload_if_dev(utils)
+
+ghcomp = runtime.lazy_import("ghpythonlib.components")
 
 #########################
 # bsh960flash@snu.ac.kr #
@@ -15,26 +18,21 @@ importlib.reload(utils)
 # Contour Divide Resolution(Higher value means more points in terrain mesh)
 RESOLUTION = 4
 
+# 단계별 시간 기록 JSON 저장 경로 (None이면 저장하지 않음)
+TRACE_PATH = None  # type: Optional[str]
+
 # paths -> parameter of the component in grasshopper that is the path to the zip files
 
 zip_paths = [os.path.join(os.path.dirname(__file__), "37705092.zip")]
 
 # Main workflow
-# Read shapefiles from zip
-contour_shapes = utils.read_shapefiles_from_zip(
-    zip_paths, ["N1L_F0010000", "N3L_F0010000"]
-)
-building_shapes = utils.read_shapefiles_from_zip(
-    zip_paths, ["N1A_B0010000", "N3A_B0010000"]
-)
-road_region_shapes = utils.read_shapefiles_from_zip(zip_paths, ["N3A_A0010000"])
-road_centerline_shapes = utils.read_shapefiles_from_zip(zip_paths, ["N3L_A0020000"])
-
-# Extract data using utils functions
-contour_data = utils.extract_data_from_shapefiles(contour_shapes)
-building_data = utils.extract_data_from_shapefiles(building_shapes)
-road_region_data = utils.extract_data_from_shapefiles(road_region_shapes)
-road_centerline_data = utils.extract_data_from_shapefiles(road_centerline_shapes)
+timing.reset()
+
+# Read shapefiles from zip (ZIP 파일이 바뀌지 않으면 이전 solve의 결과 재사용)
+contour_data = utils.load_shp_data(zip_paths, ["N1L_F0010000", "N3L_F0010000"])
+building_data = utils.load_shp_data(zip_paths, ["N1A_B0010000", "N3A_B0010000"])
+road_region_data = utils.load_shp_data(zip_paths, ["N3A_A0010000"])
+road_centerline_data = utils.load_shp_data(zip_paths, ["N3L_A0020000"])
 
 # Process contour using utils functions
 contour_geometry_records = list(zip(contour_data.geometry, contour_data.records))
@@ -42,7 +40,8 @@ contour_curves = utils.create_contour_curves(contour_geometry_records)
 
 # Process terrain
 mesh_points = utils.create_points_for_mesh(contour_curves, RESOLUTION)
-terrain_mesh = ghcomp.DelaunayMesh(mesh_points)
+with timing.stage("delaunay"):
+    terrain_mesh = ghcomp.DelaunayMesh(mesh_points)
 
 # Process buildings using utils functions
 building_geometry_records = list(zip(building_data.geometry, building_data.records))
@@ -51,3 +50,7 @@ building_breps = utils.create_building_breps(building_geometry_records, terrain_
 # Process road
 road_region_curves = [data[0] for data in road_region_data.geometry]
 road_centerline_curves = [data[0] for data in road_centerline_data.geometry]
+
+print(timing.summary())
+if TRACE_PATH:
+    timing.dump_json(TRACE_PATH)
@@ -1,21 +1,32 @@
-import ghpythonlib.components as ghcomp
 import Rhino.Geometry as geo
-import time
 import utils
-import importlib
 
-importlib.reload(utils)
+from lauslecture import runtime, timing
+
+# 개발 모드(LAUS_DEV=1)에서만 utils 새로고침
+runtime.reload_if_dev(utils)
+
+ghcomp = runtime.lazy_import("ghpythonlib.components")
+
+# Isovist 설정
+RADIUS = 50.0  # 시야 반경
+RAY_COUNT = 100  # 고정 시야선 개수 (ADAPTIVE = False 일 때)
+ADAPTIVE = True  # 적응형 시야선 세분화 사용 여부
+INITIAL_RAY_COUNT = 16  # 적응형 초기 시야선 개수
+DIST_THRESHOLD = 1.0  # 인접 시야선 거리 차이가 이보다 크면 세분화
+AREA_TOL = 0.5  # 구간별 면적 오차 허용치 (m2)
+MAX_RAY_COUNT = 360  # 분석점당 최대 시야선 개수
+TRACE_PATH = None  # 단계별 시간 기록 JSON 저장 경로 (None이면 저장하지 않음)
 
 # ## input = path_crv, obstacles,
 # terrain_mesh = None  # geo.Mesh
 # path_crv = None  # geo.Curve
 # obstacles = None  # List[geo.Brep]
 
-print("Start processing...")
-start_time = time.time()
-print("Processing time: {:.2f} seconds".format(time.time() - start_time))
+timing.reset()
 
-points_on_path = ghcomp.DivideLength(path_crv, 50.0).points
+with timing.stage("path_divide"):
+    points_on_path = ghcomp.DivideLength(path_crv, 50.0).points
 
 
 def get_nearby_breps(obstacles, point, radius=50.0, tol=1.0):
@@ -36,23 +47,42 @@ def get_nearby_breps(obstacles, point, radius=50.0, tol=1.0):
 isovist_regions = []
 for pt in points_on_path:
     # 지형에 분석 점 투영
-    pt_on_mesh = utils.get_projected_pt_on_mesh(pt, terrain_mesh)
+    with timing.stage("terrain_projection"):
+        pt_on_mesh = utils.get_projected_pt_on_mesh(pt, terrain_mesh)
     # 투영된 점을 사람 눈높이 만큼 올리기
     pt_on_mesh.Z += 1.6  # Assuming eye level is 1.6 meters above the terrain
 
-    nearby_obstacles = get_nearby_breps(obstacles, pt_on_mesh, radius=50.0)
+    with timing.stage("obstacle_filter"):
+        nearby_obstacles = get_nearby_breps(obstacles, pt_on_mesh, radius=RADIUS)
+
+    if ADAPTIVE:
+        # 거리 변화가 큰 구간(장애물 모서리)만 시야선을 세분화
+        obstacle_mesh = utils.create_obstacle_mesh(nearby_obstacles)
+        iso_region = utils.get_isovist_region(
+            pt_on_mesh,
+            obstacle_mesh,
+            RADIUS,
+            INITIAL_RAY_COUNT,
+            DIST_THRESHOLD,
+            AREA_TOL,
+            MAX_RAY_COUNT,
+        )
+        isovist_regions.append(iso_region)
+        continue
+
     plane = geo.Plane(pt_on_mesh, geo.Vector3d.ZAxis)
-    isovist = ghcomp.IsoVist(
-        plane,
-        100,  # count
-        50.0,  # radius
-        nearby_obstacles,  # obstacles: list of Breps and/or Meshes
-    )
+    with timing.stage("isovist"):
+        isovist = ghcomp.IsoVist(
+            plane,
+            RAY_COUNT,  # count
+            RADIUS,  # radius
+            nearby_obstacles,  # obstacles: list of Breps and/or Meshes
+        )
 
     iso_points = list(isovist.points)
     iso_region = geo.PolylineCurve(iso_points + [iso_points[0]])  # Close the polyline
     isovist_regions.append(iso_region)
 
-print(
-    "Finished processing. Total time: {:.2f} seconds".format(time.time() - start_time)
-)
+print(timing.summary())
+if TRACE_PATH:
+    timing.dump_json(TRACE_PATH)
@@ -1,11 +1,22 @@
 # r: pyshp
 
 import Rhino.Geometry as geo
-import shapefile
 import os
+import sys
+import math
 import zipfile
 from typing import List, Tuple, Any, Optional
-import ghpythonlib.components as ghcomp
+
+# 공용 패키지(lauslecture) 경로 등록
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from lauslecture import runtime, timing  # noqa: E402
+from lauslecture.isovist import refine_isovist_rays, get_isovist_area  # noqa: E402
+
+# 무거운 모듈은 실제로 사용할 때 import
+shapefile = runtime.lazy_import("shapefile")
 
 
 class Parcel:
@@ -301,7 +312,9 @@ def parse_geometry(shape: Any, shape_type: str) -> List[Any]:
     return []
 
 
-def read_shapefile_from_reader(sf: shapefile.Reader, encoding: str = "utf-8") -> Tuple:
+def read_shapefile_from_reader(
+    sf: "shapefile.Reader", encoding: str = "utf-8"
+) -> Tuple:
     """shapefile.Reader 객체에서 데이터 읽기"""
     result_geom = []
     result_fields = []
@@ -343,6 +356,7 @@ def read_shapefile_from_reader(sf: shapefile.Reader, encoding: str = "utf-8") ->
 # ================ Contour 처리 함수들 ================
 
 
+@timing.timed("contour_build")
 def create_contour_curves(
     contour_geometry_records: List[Tuple],
 ) -> List[geo.PolylineCurve]:
@@ -364,6 +378,7 @@ def create_contour_curves(
     return contour_crvs
 
 
+@timing.timed("mesh_points")
 def create_points_for_mesh(
     contour_curves: List[geo.Curve], resolution: float
 ) -> List[geo.Point3d]:
@@ -380,13 +395,15 @@ def create_points_for_mesh(
 # ================ Building 처리 함수들 ================
 
 
+@timing.timed("building_projection")
 def create_building_breps(
     building_geometry_records: List[Tuple], mesh_terrain: geo.Mesh
 ) -> List[geo.Brep]:
     """건물 geometry와 record로부터 Brep 생성"""
     breps = []
     for geom, record in building_geometry_records:
-        base_curve = geom[0]
+        # 캐시된 원본 커브가 이동되지 않도록 복사본 사용
+        base_curve = geom[0].DuplicateCurve()
         height = record[5] * 3.5
         vertices = get_vertices(base_curve)
 
@@ -400,12 +417,60 @@ def create_building_breps(
     return breps
 
 
+# ================ Isovist 함수들 ================
+
+
+@timing.timed("obstacle_mesh")
+def create_obstacle_mesh(obstacles: List[geo.Brep]) -> geo.Mesh:
+    """장애물 Brep들을 광선 계산용 단일 메시로 변환"""
+    obstacle_mesh = geo.Mesh()
+    for brep in obstacles:
+        meshes = geo.Mesh.CreateFromBrep(brep, geo.MeshingParameters.FastRenderMesh)
+        for mesh in meshes or []:
+            obstacle_mesh.Append(mesh)
+    return obstacle_mesh
+
+
+@timing.timed("isovist")
+def get_isovist_region(
+    pt: geo.Point3d,
+    obstacle_mesh: geo.Mesh,
+    radius: float = 50.0,
+    initial_count: int = 16,
+    dist_threshold: float = 1.0,
+    area_tol: float = 0.5,
+    max_count: int = 360,
+) -> geo.PolylineCurve:
+    """적응형 시야선으로 isovist 영역 커브를 생성"""
+    has_obstacle = obstacle_mesh.Vertices.Count > 0
+
+    def cast_ray(angle: float) -> float:
+        if not has_obstacle:
+            return radius
+        ray = geo.Ray3d(pt, geo.Vector3d(math.cos(angle), math.sin(angle), 0))
+        t = geo.Intersect.Intersection.MeshRay(obstacle_mesh, ray)
+        # 단위 벡터 방향이므로 t가 곧 거리
+        if t < 0 or t > radius:
+            return radius
+        return t
+
+    rays = refine_isovist_rays(
+        cast_ray, initial_count, dist_threshold, area_tol, max_count
+    )
+    iso_points = [
+        geo.Point3d(pt.X + dist * math.cos(angle), pt.Y + dist * math.sin(angle), pt.Z)
+        for angle, dist in rays
+    ]
+    return geo.PolylineCurve(iso_points + [iso_points[0]])
+
+
 # ================ ZIP/Shapefile 처리 함수들 ================
 
 
+@timing.timed("zip_read")
 def read_shapefiles_from_zip(
     zip_paths: List[str], file_prefixes: List[str]
-) -> List[shapefile.Reader]:
+) -> List["shapefile.Reader"]:
     """ZIP 파일들에서 shapefile 읽기"""
     readers = []
     zip_files = [zipfile.ZipFile(zip_path, "r") for zip_path in zip_paths]
@@ -466,7 +531,8 @@ class ShpData:
         self.records = records
 
 
-def extract_data_from_shapefiles(shapefiles: List[shapefile.Reader]) -> ShpData:
+@timing.timed("shp_parse")
+def extract_data_from_shapefiles(shapefiles: List["shapefile.Reader"]) -> ShpData:
     """여러 shapefile에서 데이터 추출하여 ShpData로 통합"""
     all_geometry = []
     all_fields = []
@@ -484,3 +550,15 @@ def extract_data_from_shapefiles(shapefiles: List[shapefile.Reader]) -> ShpData:
         all_records.extend(result[4])
 
     return ShpData(shape_type, all_geometry, all_fields, all_field_names, all_records)
+
+
+def load_shp_data(zip_paths: List[str], file_prefixes: List[str]) -> ShpData:
+    """ZIP 파일들에서 ShpData 로드 (ZIP 파일이 그대로면 이전 결과 재사용)"""
+
+    def load() -> ShpData:
+        readers = read_shapefiles_from_zip(zip_paths, file_prefixes)
+        return extract_data_from_shapefiles(readers)
+
+    return runtime.cached_file(
+        "Lecture3.shp_data", zip_paths, load, extra=tuple(file_prefixes)
+    )
@@ -1,22 +1,39 @@
+# r: numpy
 ### 자주식 지상 주차장 레이아웃 자동화 스크립트
 
 from operator import ge
 from typing import List, Tuple, Any, Optional
+import numpy as np
 import Rhino.Geometry as geo
-import ghpythonlib.components as ghcomp
 import scriptcontext as sc
 
 import utils
-import importlib
+from lauslecture import planar, runtime
+from lauslecture.parking import cache, filters, overlap, rules, search, stalls
 
-importlib.reload(utils)
+# 개발 모드(LAUS_DEV=1)에서만 utils 새로고침
+runtime.reload_if_dev(utils)
 
 
-# Constants
-CELL_WIDTH = 2.5  # meters
-CELL_LENGTH = 5.0  # meters
-ROAD_WIDTH = 6.0  # meters
-TOL = 0.01  # 허용 오차
+# 주차장 설계 규칙 (주차칸 형식, 주차 각도 0/45/60/90, 차로 폭, 형식별 최소 대수)
+# 예: rules.ParkingRules(rules.STANDARD, angle=60, extra_types=[rules.ACCESSIBLE.with_min_count(2)])
+RULES = rules.ParkingRules(rules.STANDARD, angle=90)
+
+# Constants (RULES에서 결정)
+CELL_WIDTH = RULES.width  # meters
+CELL_LENGTH = RULES.length  # meters
+ROW_DEPTH = RULES.row_depth  # 주차칸 열 깊이 (직각 주차면 CELL_LENGTH)
+ROAD_WIDTH = RULES.aisle_width  # meters
+TOL = RULES.tol  # 허용 오차
+
+# 외부/내부 셀이 겹칠 때 남길 쪽 ("outside" 또는 "inside"), 형식 배정 셀이 항상 우선
+OVERLAP_PRIORITY = "outside"
+
+# 배치 최적화 탐색 (축 x 패턴 위상 x 차로 위치)
+OPTIMIZE = False
+ANGLE_STEP = 5.0  # 각도 스윕 간격 (도), 0이면 영역의 변 방향만 사용
+PHASE_COUNT = 4  # 패턴 시작 여백 후보 개수
+WORKERS = 1  # 병렬 평가 스레드 수
 
 # # 그래스호퍼 인풋을 위한 임시 변수
 # target_region = geo.Curve()
@@ -29,226 +46,214 @@ def get_axis_from_region(region: geo.Curve) -> geo.Plane:
     :param region: 주차장 영역 (PolylineCurve)
     :return: 축 (Plane)
     """
-    # 모든 변을 기준으로 바운딩 박스를 생성하여 최소 바운딩 박스를 구하여 해당 변을 축으로 설정
-
-    min_bbox = None
-    for segment in utils.explode_curve(region):
-        # segment를 기준으로 regigon의 바운딩 박스를 구함
-        x_vec = segment.TangentAt(0)
-        y_vec = geo.Vector3d(-x_vec.Y, x_vec.X, 0)
-        plane_from_seg = geo.Plane(segment.PointAtStart, x_vec, y_vec)
-        bbox = region.GetBoundingBox(plane_from_seg)
+    # 모든 변 방향 중 바운딩 박스 면적이 최소인 변을 축으로 설정
+    # (볼록 껍질 + rotating calipers로 변마다 바운딩 박스를 만들지 않는다)
+    vertices = utils.get_vertices_array(region)
+    index = planar.get_min_bbox_edge([tuple(pt) for pt in vertices])
+    if index is None:
+        # 면적을 잴 수 없는 영역은 기존처럼 첫 번째 변을 축으로 (변이 없으면 World XY)
+        if not region.SpanCount:
+            return geo.Plane.WorldXY
+        index = 0
+
+    start = region.PointAt(region.SpanDomain(index)[0])
+    end = region.PointAt(region.SpanDomain(index)[1])
+    x_vec = end - start
+    x_vec.Unitize()
+    y_vec = geo.Vector3d(-x_vec.Y, x_vec.X, 0)
+    return geo.Plane(start, x_vec, y_vec)
 
-        if min_bbox is None:
-            min_bbox = bbox
-            axis = plane_from_seg
 
-        if min_bbox.Area < bbox.Area:
-            continue
+def get_cached_axis(region: geo.Curve, region_key: str) -> geo.Plane:
+    """영역이 그대로면 이전 solve의 축을 재사용"""
+    return cache.get_geometry(region_key, "axis", lambda: get_axis_from_region(region))
 
-        min_bbox = bbox
-        axis = plane_from_seg
 
-    return axis
+def get_cached_offset_regions(
+    region: geo.Curve, region_key: str, distance: float
+) -> List[geo.Curve]:
+    """영역과 offset 거리가 그대로면 이전 solve의 안쪽 offset 영역을 재사용"""
+    return cache.get_geometry(
+        region_key,
+        ("offset", distance),
+        lambda: utils.offset_regions_inward(region, distance),
+    )
 
 
 def generate_pattern_list(l) -> List[float]:
     """
     주차장 셀의 패턴 리스트 생성
     """
-    if l < 5:
-        return []
-
-    pattern, pattern_sum = [], 0
-    values = [5, 5, 6]
-    i = 0
-    while pattern_sum + values[i % 3] <= l:
-        val = values[i % 3]
-        pattern.append(val)
-        pattern_sum += val
-        i += 1
+    return stalls.get_pattern_list(l, RULES.pattern)
 
-    edge = (l - pattern_sum) / 2
-    return [edge] + pattern + [edge]
 
-
-def get_cells_from_inside_region(region: geo.Curve, axis: geo.Plane) -> List[geo.Curve]:
+def get_cells_from_inside_region(region: geo.Curve, axis: geo.Plane) -> np.ndarray:
     """
     내부 영역에서 셀을 생성
     :param region: 내부 영역 (PolylineCurve)
-    :return: 셀 리스트 (list of PolylineCurve)
+    :return: 셀 꼭짓점 배열 (N, 4, 2)
     """
-    bbox_region = utils.get_bounding_box_crv(region, axis)
-    bbox_segs = utils.explode_curve(bbox_region)
-    bbox_segs = sorted(bbox_segs, key=lambda seg: seg.GetLength())
-    short_seg, long_seg = bbox_segs[0], bbox_segs[-1]
-
-    vec = -utils.get_outside_perp_vec_from_pt(short_seg.PointAt(0.5), bbox_region)
-    length_to_move = 0
-    cells = []
-    pattern = generate_pattern_list(long_seg.GetLength())
-    for moved_length in pattern:
-        length_to_move += moved_length
-        seg_for_cell = utils.move_curve(short_seg, vec * length_to_move)
-        if 5 - TOL < moved_length < 5 + TOL:
-            cells += get_cells_from_segement(seg_for_cell, -vec)
-
-    return cells
+    return stalls.get_stalls_from_inside_ring(
+        utils.get_vertices_array(region),
+        np.array([axis.Origin.X, axis.Origin.Y]),
+        np.array([axis.XAxis.X, axis.XAxis.Y]),
+        CELL_WIDTH,
+        CELL_LENGTH,
+        RULES.pattern,
+        angle=RULES.angle,
+    )
 
 
 def get_cells_from_inside(
     target_region: geo.Curve,
-) -> List[geo.Curve]:
+    region_key: str,
+) -> Tuple[np.ndarray, List[str]]:
     """
     내부 영역에서 셀을 생성
     :param target_region: 전체 영역 (PolylineCurve)
-    :return: 셀 리스트 (list of PolylineCurve)
+    :param region_key: 영역 캐시 키
+    :return: 셀 꼭짓점 배열 (N, 4, 2), 최적화 모드의 후보 배치 순위
     """
 
     # 1. 축 생성
-    axis = get_axis_from_region(target_region)
+    axis = get_cached_axis(target_region, region_key)
 
-    # 2. 전체 영역을 CELL_LENGTH + ROAD_WIDTH 만큼 안쪽으로 offset
-    inside_regions = utils.offset_regions_inward(
-        target_region, CELL_LENGTH + ROAD_WIDTH
+    # 2. 전체 영역을 ROW_DEPTH + ROAD_WIDTH 만큼 안쪽으로 offset
+    inside_regions = get_cached_offset_regions(
+        target_region, region_key, ROW_DEPTH + ROAD_WIDTH
     )
 
     if not inside_regions:
-        return []
+        return stalls.EMPTY_STALLS, []
+
+    # 3. 최적화 모드: 후보 배치를 탐색하여 주차칸이 가장 많은 배치 사용
+    if OPTIMIZE:
+        result = search.search_layouts(
+            [utils.get_vertices_array(region) for region in inside_regions],
+            CELL_WIDTH,
+            CELL_LENGTH,
+            RULES.pattern,
+            axis_ring=utils.get_vertices_array(target_region),
+            angle_step=ANGLE_STEP,
+            phase_count=PHASE_COUNT,
+            workers=WORKERS,
+            executor="thread",
+            tol=TOL,
+            angle=RULES.angle,
+        )
+        ranking = [str(c) for c in result.ranked if not c.pruned]
+        return (result.best.stalls if result.best else stalls.EMPTY_STALLS), ranking
 
-    # 3. 내부 영역에서 셀 생성
-    cells = []
-    for region in inside_regions:
-        cells.extend(get_cells_from_inside_region(region, axis))
+    # 4. 내부 영역에서 셀 생성
+    cells = np.concatenate(
+        [get_cells_from_inside_region(region, axis) for region in inside_regions]
+    )
 
-    # 4. 내부 영역을 벗어난 셀 필터링
+    # 5. 내부 영역을 벗어난 셀 필터링
     cells = filter_cells_inside_region(cells, inside_regions)
 
-    return cells
-
-
-def get_cell_rectangle(
-    base_pt: geo.Point3d,
-    x_vec: geo.Vector3d,
-    y_vec: geo.Vector3d,
-    x_dist: float,
-    y_dist: float,
-) -> geo.PolylineCurve:
-    # 원본 변수가 수정되지 않도록 새 객체 생성하여 사용
-    x_vec = geo.Vector3d(x_vec)
-    y_vec = geo.Vector3d(y_vec)
-    x_vec.Unitize()
-    y_vec.Unitize()
-    pt_b = base_pt + (y_vec * y_dist)
-    pt_c = base_pt + (y_vec * y_dist) + (x_vec * x_dist)
-    pt_d = base_pt + (x_vec * x_dist)
-    return geo.PolylineCurve([base_pt, pt_b, pt_c, pt_d, base_pt])
-
-
-def get_cells_from_segement(segment: geo.Curve, vec: geo.Vector3d) -> List[geo.Curve]:
-    """
-    segment를 기준으로 셀을 생성
-    :param segment: segment (LineCurve)
-    :param vec: Cell의 생성 방향 벡터 (Vector3d)
-    :return: 셀 리스트 (list of PolylineCurve)
-    """
-
-    cells = []
-    segment_length = segment.GetLength()
-    num_cells = int(segment_length // (CELL_WIDTH))
-    if num_cells < 1:
-        return cells
-
-    pts_for_cell = utils.get_pt_by_length(segment, CELL_WIDTH, True)
-
-    cell_count = 0
-    for pt in pts_for_cell:
-        if cell_count >= num_cells:
-            break
-        cell = get_cell_rectangle(
-            pt, vec, segment.TangentAtStart, CELL_LENGTH, CELL_WIDTH
-        )
-        cell_count += 1
-        cells.append(cell)
-
-    return cells
+    return cells, []
 
 
 def get_cells_from_outside(
     target_region: geo.Curve,
-    entrance_pt: geo.Point3d,
-) -> List[geo.Curve]:
+    region_key: str,
+) -> np.ndarray:
     """
-    주차 가능 영역의 외각을 둘러싸는 셀을 생성
+    주차 가능 영역의 외각을 둘러싸는 셀을 생성 (진입부 필터 전)
     :param target_region: 외부 영역 (PolylineCurve)
-    :return: 셀 리스트 (list of PolylineCurve)
+    :param region_key: 영역 캐시 키
+    :return: 셀 꼭짓점 배열 (N, 4, 2)
     """
-    # 1. 주차가능 영역의 외부영역을 주차칸의 길이 + 도로폭 만큼 안쪽으로 offset
-    cells = []
-    offset_regions = utils.offset_regions_inward(target_region, CELL_LENGTH)
-
-    # 2. offset된 영역의 세그먼트를 기준으로 셀 생성
-    for offset_region in offset_regions:
-        for segment in utils.explode_curve(offset_region):
-            # segment를 기준으로 배치가능한 최대 셀 개수 측정
-            segment_length = segment.GetLength()
-            num_cells = int(segment_length // (CELL_LENGTH))
-            if num_cells < 1:
-                continue
-            # segment를 기준으로 셀 생성
-            center_pt = segment.PointAt(0.5)
-            cell_vec = utils.get_outside_perp_vec_from_pt(center_pt, offset_region)
-            cells_from_seg = get_cells_from_segement(segment, cell_vec)
-
-            cells.extend(cells_from_seg)
+    # 1. 주차가능 영역의 외부영역을 주차칸 열 깊이만큼 안쪽으로 offset
+    offset_regions = get_cached_offset_regions(target_region, region_key, ROW_DEPTH)
+
+    # 2. offset된 영역의 세그먼트를 기준으로 바깥쪽을 향한 셀 생성
+    return stalls.get_stalls_from_outside(
+        [utils.get_vertices_array(region) for region in offset_regions],
+        CELL_WIDTH,
+        CELL_LENGTH,
+        RULES.angle,
+    )
 
-    # 3. 진입로 확보를 위한 셀 필터링
-    cells = filter_cells_at_entrance(cells, entrance_pt, target_region)
 
-    return cells
+def get_cells_before_entrance(
+    target_region: geo.Curve, region_key: str
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """진입부 필터 전까지의 셀 (외부 셀, 내부 셀, 후보 배치 순위)"""
+    cells_from_outside = get_cells_from_outside(target_region, region_key)
+    cells_from_inside, ranking = get_cells_from_inside(target_region, region_key)
+    return cells_from_outside, cells_from_inside, ranking
 
 
 def filter_cells_at_entrance(
-    cells: List[geo.Curve],
+    cells: np.ndarray,
     entrance_pt: geo.Point3d,
     target_region: geo.Curve,
-) -> List[geo.Curve]:
+) -> np.ndarray:
     """진입로 확보를 위한 셀 필터링
-    :param cells: 셀 리스트 (list of PolylineCurve)
+    :param cells: 셀 꼭짓점 배열 (N, 4, 2)
     :param entrance_pt: 진입점 (Point3d)
     :param target_region: 전체 영역 (PolylineCurve)
-    :return: 필터링된 셀 리스트 (list of PolylineCurve)
+    :return: 필터링된 셀 꼭짓점 배열
     """
-    filtered_cells = []
-    for cell in cells:
-        # entrance_pt와의 거리가 2.5M 이하인 셀 제거
-        pt_on_region = target_region.PointAt(target_region.ClosestPoint(entrance_pt)[1])
-        if utils.get_dist_between_pt_and_crv(pt_on_region, cell) > CELL_WIDTH:
-            filtered_cells.append(cell)
+    # 진입점을 영역 경계에 한 번만 투영
+    pt_on_region = target_region.PointAt(target_region.ClosestPoint(entrance_pt)[1])
 
-    return filtered_cells
+    # entrance_pt와의 거리가 2.5M 이하인 셀 제거 (진입점 주변 셀만 검사)
+    keep = filters.get_entrance_mask(
+        cells, np.array([pt_on_region.X, pt_on_region.Y]), CELL_WIDTH
+    )
+    return cells[keep]
 
 
 def filter_cells_inside_region(
-    cells: List[geo.Curve], inside_regions: List[geo.Curve]
-) -> List[geo.Curve]:
+    cells: np.ndarray, inside_regions: List[geo.Curve]
+) -> np.ndarray:
     """내부 영역에 맞게 셀 필터링
-    :param cells: 셀 리스트 (list of PolylineCurve)
+    :param cells: 셀 꼭짓점 배열 (N, 4, 2)
     :param inside_regions: 내부 영역 리스트 (list of PolylineCurve)
-    :return: 필터링된 셀 리스트 (list of PolylineCurve)
+    :return: 필터링된 셀 꼭짓점 배열
     """
-    filtered_cells = []
-    for cell in cells:
-        if any(utils.is_region_inside_region(cell, ir) for ir in inside_regions):
-            filtered_cells.append(cell)
-    return filtered_cells
-
-
-# 1. 외부 영역에서 셀 생성
-cells_from_outside = get_cells_from_outside(target_region, entrance_pt)
-
-# 2. 내부 영역에서 셀 생성
-cells_from_inside = get_cells_from_inside(target_region)
-
-# 최종 셀 리스트 생성
-cells = cells_from_outside + cells_from_inside
+    # 모든 셀 꼭짓점을 한 번에 winding number + 변 교차 검사
+    inside_rings = [utils.get_vertices_array(region) for region in inside_regions]
+    return cells[filters.get_inside_mask(cells, inside_rings, TOL)]
+
+
+# 영역과 파라미터가 그대로면 이전 solve의 셀을 재사용하고 진입부 필터만 다시 실행
+region_key = cache.get_region_key(utils.get_vertices_array(target_region))
+params = RULES.key + (OPTIMIZE, ANGLE_STEP, PHASE_COUNT)
+
+# 1. 외부/내부 영역에서 셀 생성 (최적화 모드에서 평가된 후보 배치 순위 포함)
+raw_cells_from_outside, cells_from_inside, layout_ranking = cache.get_stalls(
+    region_key, params, lambda: get_cells_before_entrance(target_region, region_key)
+)
+
+# 2. 진입로 확보를 위한 외부 셀 필터링
+cells_from_outside = filter_cells_at_entrance(
+    raw_cells_from_outside, entrance_pt, target_region
+)
+
+# 3. 진입점에 가까운 셀부터 형식 배정 (장애인전용 등 최소 대수)
+all_cells, type_ids = rules.assign_stall_types(
+    np.concatenate([cells_from_outside, cells_from_inside]),
+    RULES,
+    np.array([entrance_pt.X, entrance_pt.Y]),
+)
+
+# 4. 겹치는 셀 정리 (sweep-and-prune + SAT, 우선순위가 낮은 셀 제거)
+is_outside = np.arange(len(all_cells)) < len(cells_from_outside)
+preferred = is_outside if OVERLAP_PRIORITY == "outside" else ~is_outside
+keep = overlap.resolve_overlaps(all_cells, (type_ids > 0) * 2 + preferred, TOL)
+all_cells, type_ids = all_cells[keep], type_ids[keep]
+
+# 5. 규칙 검증
+validation = rules.validate(
+    all_cells, RULES, utils.get_vertices_array(target_region), type_ids
+)
+rule_report = validation.summary()
+
+# 최종 셀 리스트 생성 (출력할 때만 커브로 변환)
+z = target_region.PointAtStart.Z
+cells = utils.corners_to_curves(all_cells, z)
+invalid_cells = utils.corners_to_curves(all_cells[~validation.valid], z)
@@ -1,9 +1,22 @@
+# r: numpy
 from typing import List, Tuple, Any, Optional, Union
+import numpy as np
 import Rhino.Geometry as geo
 import Rhino
 import functools
+import os
+import sys
 
-import ghpythonlib.components as ghcomp
+# 공용 패키지(lauslecture) 경로 등록
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from lauslecture import offsetting, runtime  # noqa: E402
+from lauslecture.backends import rhino as rhino_backend  # noqa: E402
+
+# 그래스호퍼 컴포넌트는 Clipper 등을 실제로 호출할 때 로드
+ghcomp = runtime.lazy_import("ghpythonlib.components")
 
 TOL = 0.01  # 기본 허용 오차
 DIST_TOL = 0.01
@@ -168,7 +181,9 @@ def offset_regions_inward(
 
     if not dist:
         return regions
-    return Offset().polyline_offset(regions, dist, miter).holes
+    if isinstance(regions, geo.Curve):
+        regions = [regions]
+    return Offset().polyline_offset_batch([regions], [dist], miter)[0].holes
 
 
 def offset_regions_outward(
@@ -184,8 +199,14 @@ def offset_regions_outward(
     """
     if isinstance(regions, geo.Curve):
         regions = [regions]
+    if not dist or not regions:
+        return list(regions)
 
-    return [offset_region_outward(region, dist, miter) for region in regions]
+    # 영역마다 따로 offset 하되 Clipper는 한 번만 호출
+    results = Offset().polyline_offset_batch(
+        [[region] for region in regions], [dist] * len(regions), miter
+    )
+    return [result.contour[0] for result in results]
 
 
 def offset_region_outward(
@@ -205,7 +226,7 @@ def offset_region_outward(
         return region
     if not isinstance(region, geo.Curve):
         raise ValueError("region must be curve")
-    return Offset().polyline_offset(region, dist, miter).contour[0]
+    return Offset().polyline_offset_batch([[region]], [dist], miter)[0].contour[0]
 
 
 def get_outside_perp_vec_from_pt(pt: geo.Point3d, region: geo.Curve) -> geo.Vector3d:
@@ -249,6 +270,23 @@ def get_bounding_box_crv(curve: geo.Curve, plane: geo.Plane) -> geo.PolylineCurv
     return geo.PolylineCurve(corners + [corners[0]])
 
 
+def get_vertices_array(crv: geo.Curve) -> np.ndarray:
+    """폴리라인 커브의 꼭짓점을 (K, 2) 배열로 변환 (닫힌 커브는 시작점 반복 없음)"""
+    vertices = [crv.PointAt(crv.SpanDomain(i)[0]) for i in range(crv.SpanCount)]
+    if not crv.IsClosed:
+        vertices.append(crv.PointAtEnd)
+    return np.array([(pt.X, pt.Y) for pt in vertices])
+
+
+def corners_to_curves(corners: np.ndarray, z: float = 0.0) -> List[geo.PolylineCurve]:
+    """(N, 4, 2) 꼭짓점 배열을 닫힌 PolylineCurve 리스트로 변환 (출력 전용)"""
+    curves = []
+    for quad in corners.tolist():
+        pts = [geo.Point3d(x, y, z) for x, y in quad]
+        curves.append(geo.PolylineCurve(pts + [pts[0]]))
+    return curves
+
+
 def convert_io_to_list(func):
     """인풋과 아웃풋을 리스트로 만들어주는 데코레이터"""
 
@@ -273,12 +311,98 @@ def convert_io_to_list(func):
     return wrapper
 
 
+def get_curve_key(crv: geo.Curve, precision: int = 6) -> tuple:
+    """커브 꼭짓점 좌표로 만든 캐시 키 (같은 형상이면 같은 키)"""
+    pts = [crv.PointAt(crv.SpanDomain(i)[0]) for i in range(crv.SpanCount)]
+    pts.append(crv.PointAtEnd)
+    return offsetting.get_points_key(((pt.X, pt.Y, pt.Z) for pt in pts), precision)
+
+
 class Offset:
+    # (커브 키들, 거리, miter, fillet) -> 결과, solve가 반복되어도 유지
+    CACHE_NAMESPACE = "Lecture4.offset"
+    CACHE_SIZE = 256
+
     class _PolylineOffsetResult:
         def __init__(self):
             self.contour: Optional[List[geo.Curve]] = None
             self.holes: Optional[List[geo.Curve]] = None
 
+        def duplicate(self) -> "Offset._PolylineOffsetResult":
+            copied = Offset._PolylineOffsetResult()
+            copied.contour = [crv.DuplicateCurve() for crv in self.contour]
+            copied.holes = [crv.DuplicateCurve() for crv in self.holes]
+            return copied
+
+    def polyline_offset_batch(
+        self,
+        crv_groups: List[List[geo.Curve]],
+        dists: List[float],
+        miter: int = BIGNUM,
+        closed_fillet: int = 2,
+        open_fillet: int = 2,
+        tol: float = Rhino.RhinoMath.ZeroTolerance,
+    ) -> List[_PolylineOffsetResult]:
+        """여러 커브 묶음을 각자의 거리로 offset (Clipper 호출은 한 번)
+
+        같은 묶음/거리/옵션의 결과는 메모해 두었다가 복사본을 돌려준다.
+        Args:
+            crv_groups: offset할 커브 묶음 리스트 (묶음 안의 커브는 함께 offset)
+            dists: 묶음별 offset 거리 (crv_groups와 같은 길이)
+
+        Returns:
+            입력 순서대로 묶음별 _PolylineOffsetResult
+        """
+        if len(crv_groups) != len(dists):
+            raise ValueError("crv_groups and dists must have the same length")
+
+        keys = [
+            (
+                tuple(get_curve_key(crv) for crv in crvs),
+                dist,
+                miter,
+                closed_fillet,
+                open_fillet,
+            )
+            for crvs, dist in zip(crv_groups, dists)
+        ]
+        # 메모에 없는 묶음만 모아서 한 번에 계산
+        return offsetting.memoize_batch(
+            Offset.CACHE_NAMESPACE,
+            keys,
+            lambda missing: self._polyline_offset_tree(
+                [crv_groups[i] for i in missing],
+                [dists[i] for i in missing],
+                miter,
+                closed_fillet,
+                open_fillet,
+                tol,
+            ),
+            Offset._PolylineOffsetResult.duplicate,
+            Offset.CACHE_SIZE,
+        )
+
+    def _polyline_offset_tree(
+        self,
+        crv_groups: List[List[geo.Curve]],
+        dists: List[float],
+        miter: int,
+        closed_fillet: int,
+        open_fillet: int,
+        tol: float,
+    ) -> List[_PolylineOffsetResult]:
+        """묶음별 PolylineOffset 결과 (Clipper 호출은 backends.rhino에서 한 번)"""
+        contours, holes = rhino_backend.polyline_offset_groups(
+            crv_groups, dists, miter, closed_fillet, open_fillet, tol
+        )
+        results = []
+        for contour, hole in zip(contours, holes):
+            offset_result = Offset._PolylineOffsetResult()
+            offset_result.contour = contour
+            offset_result.holes = hole
+            results.append(offset_result)
+        return results
+
     @convert_io_to_list
     def polyline_offset(
         self,
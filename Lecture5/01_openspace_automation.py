@@ -7,79 +7,60 @@ except ImportError:
 import Rhino.Geometry as geo  # type: ignore
 import scriptcontext as sc  # type: ignore
 import Rhino  # type: ignore
-import ghpythonlib.components as ghcomp  # type: ignore
 import utils
 
-# 모듈 새로고침
-import importlib
+from lauslecture import planar, runtime
+from lauslecture.openspace import requirement as openspace_rules
 
-importlib.reload(utils)
+# 개발 모드(LAUS_DEV=1)에서만 utils 새로고침
+runtime.reload_if_dev(utils)
+
+ghcomp = runtime.lazy_import("ghpythonlib.components")
 
 
 class Lot:
     def __init__(self, region: geo.Curve, district_use: str) -> None:
         self.region = region
+        self.shape = utils.Region(region)  # 면적 등 기하 속성 캐시
         self.district_use = district_use
-        self.area = geo.AreaMassProperties.Compute(region).Area
+        self.area = self.shape.area
 
 
 class Road:
     def __init__(self, curve: geo.Curve) -> None:
         self.curve = curve
+        self.shape = utils.Region(curve)
 
 
 class Building:
     def __init__(self, regions: List[geo.Curve], floor_count: int, use: str) -> None:
         self.regions = regions
-        self.floor_area = sum(
-            geo.AreaMassProperties.Compute(region).Area for region in regions
-        )
+        self.shapes = [utils.Region(region) for region in regions]
+        self.floor_area = sum(shape.area for shape in self.shapes)
         self.floor_count = floor_count
         self.total_area = self.floor_area * floor_count
         self.use = use
 
 
 class OpenspaceRequirement:
-    """공개공지 설치 조건"""
+    """공개공지 설치 조건 (기준은 lauslecture.openspace.requirement와 공유)"""
 
-    MIN_AREA = 90.0  # type: float
-    MIN_DEPTH = 9.0  # type: float
-    AREA_RATIO = 0.1  # type: float
+    MIN_AREA = openspace_rules.MIN_AREA  # type: float
+    MIN_DEPTH = openspace_rules.MIN_DEPTH  # type: float
+    AREA_RATIO = openspace_rules.AREA_RATIO  # type: float
     # 최대 넓이 도로변과 4분의1이상 접할 것
-    ROAD_ADJUST_RATIO = 0.25  # type: float
+    ROAD_ADJUST_RATIO = openspace_rules.ROAD_ADJUST_RATIO  # type: float
 
     def __init__(self, lot: Lot, building: Building) -> None:
         self.area = 0  # type: float
         self._get_target_information(lot, building)
 
     def _get_target_information(self, lot: Lot, building: Building) -> None:
-        # 공개공지 설치 조건
-        # 1. 대지의 용도 조건
-        if lot.district_use not in (
-            "일반주거지역",
-            "준주거지역",
-            "상업지역",
-            "준공업지역",
-        ):
-            return
-        # 2. 건축물의 용도 조건
-        if building.use not in (
-            "문화시설",
-            "집회시설",
-            "종교시설",
-            "판매시설",
-            "운수시설",
-            "업무시설",
-            "숙박시설",
-        ):
-            return
-
-        # 3. 건축물의 연면적 조건
-        if building.total_area < 5000:
-            return
-
+        # 대지 용도, 건축물 용도, 연면적 조건을 만족하면
         # 공개공지 면적 = 대지면적의 10%이상(최소 90m2)
-        self.area = max(lot.area * self.AREA_RATIO, self.MIN_AREA)
+        self.area = openspace_rules.get_required_area(
+            lot.area, lot.district_use, building.use, building.total_area
+        )
 
 
 class OepnspaceGenerator:
@@ -96,9 +77,24 @@ class OepnspaceGenerator:
         self.building = building
         self.parking_region = parking_region
         self.requirement = requirement
+        self._road_frontages = None  # type: Optional[List[float]]
+
+    def get_road_frontages(self) -> List[float]:
+        """도로별 대지 접도 길이 (대지와 도로에만 의존하므로 한 번만 계산)"""
+        if self._road_frontages is None:
+            self._road_frontages = [
+                utils.get_overlap_length(self.lot.region, road.curve)
+                for road in self.roads
+            ]
+        return self._road_frontages
 
     def get_openspace(self) -> List[geo.Curve]:
         # 공개공지 생성 로직
+        # 각 단계는 utils.Region을 주고받아 면적 등을 영역마다 한 번만 계산한다
+        # 0. 설치 대상이 아니면 기하 연산 없이 종료
+        if self.requirement.area <= 0:
+            return []
+
         # 1. 후보 지역 생성
         candidates = self.get_candidate_regions()
 
@@ -113,57 +109,89 @@ class OepnspaceGenerator:
 
         openspace_regions = self.filter_openspace_regions(openspace_regions)
 
-        return openspace_regions
+        return [region.curve for region in openspace_regions]
 
-    def filter_openspace_regions(self, regions: List[geo.Curve]) -> List[geo.Curve]:
+    def filter_openspace_regions(
+        self, regions: List[utils.Region]
+    ) -> List[utils.Region]:
         """공개공지 영역 필터링"""
         filtered_regions = []
         for region in regions:
             # 공개공지 최소 조건을 만족하는지 확인
-            if not region.IsValid:
+            if not region.curve.IsValid:
                 continue
-            if geo.AreaMassProperties.Compute(region).Area < self.requirement.MIN_AREA:
+            if region.area < self.requirement.MIN_AREA:
                 continue
             filtered_regions.append(region)
 
         return filtered_regions
 
-    def get_candidate_regions(self) -> List[geo.Curve]:
+    def get_candidate_regions(self) -> List[utils.Region]:
         """공개공지 최소 조건을 만족하는 영역 생성"""
-        # 최소 폭 조거늘 만족하는 영역 확보
-        # 오프셋 in and out 을 통해 확보
-        inward_regions = utils.offset_regions_inward(
-            [self.lot.region, self.parking_region] + self.building.regions,
-            self.requirement.MIN_DEPTH / 2,
+        depth = self.requirement.MIN_DEPTH
+        return self.get_candidate_regions_by_depth([depth])[depth]
+
+    def get_candidate_regions_by_depth(
+        self, depths: List[float]
+    ) -> Dict[float, List[utils.Region]]:
+        """여러 최소 폭(깊이)에 대한 후보 영역을 한 번에 생성
+
+        깊이마다 depth / 2 만큼 안쪽으로 offset 한 뒤 다시 바깥쪽으로 offset 한다.
+        안쪽 offset은 작은 거리의 결과에서 이어서 계산하고 거리별로 캐시하며,
+        바깥쪽 offset은 모든 깊이를 Clipper 한 번으로 계산한다.
+        복원된 영역에서 건물과 주차 영역을 뺀 조각들이 후보가 된다.
+        """
+        # 최소 폭 조건을 만족하는 영역 확보
+        family = utils.InwardOffsetFamily(
+            [self.lot.region, self.parking_region] + self.building.regions
         )
-
-        # 빌딩영역과 교차가 있는 경우 필터링 geo.Curve.PlanarCurveCollision 사용
-        filtered_inward_regions = []
-        for region in inward_regions:
-            if any(
-                utils.has_region_intersection(region, other_region)
-                for other_region in self.building.regions
-            ):
-                continue
-            filtered_inward_regions.append(region)
-
-        candidate_regions = utils.offset_regions_outward(
-            filtered_inward_regions, self.requirement.MIN_DEPTH / 2
+        inward_by_dist = family.get([depth / 2 for depth in depths])
+
+        # 빌딩영역과 교차가 있는 경우 필터링 (바운딩박스 트리 + 폴리곤 교차 검사)
+        building_index = utils.RegionIndex(self.building.shapes)
+        regions = []  # type: List[geo.Curve]
+        region_depths = []  # type: List[float]
+        for depth in depths:
+            for region in inward_by_dist[depth / 2]:
+                if building_index.intersects(utils.Region(region)):
+                    continue
+                regions.append(region)
+                region_depths.append(depth)
+
+        candidates = {
+            depth: [] for depth in depths
+        }  # type: Dict[float, List[utils.Region]]
+        if not regions:
+            return candidates
+
+        results = utils.Offset().polyline_offset_batch(
+            [[region] for region in regions], [depth / 2 for depth in region_depths]
         )
+        # 바깥쪽으로 복원하면서 건물, 주차 영역에 다시 들어간 부분을 뺀다
+        occupied = [self.parking_region] + self.building.regions
+        differences = utils.get_region_difference(
+            [result.contour[0] for result in results], occupied
+        )
+        for depth, pieces in zip(region_depths, differences):
+            candidates[depth].extend(utils.Region(piece) for piece in pieces)
+        return candidates
 
-        return candidate_regions
-
-    def filter_candidate_regions(self, candidates: List[geo.Curve]) -> List[geo.Curve]:
+    def filter_candidate_regions(
+        self, candidates: List[utils.Region]
+    ) -> List[utils.Region]:
         """후보 지역 필터링"""
 
-        def is_road_adjacent(candidate: geo.Curve) -> bool:
+        road_frontages = self.get_road_frontages()
+
+        def is_road_adjacent(candidate: utils.Region) -> bool:
             # 도로와 후보 지역의 접촉 여부 확인
-            for road in self.roads:
+            candidate_bbox = planar.inflate_bbox(candidate.bbox, utils.TOL)
+            for road, lot_overlap_length in zip(self.roads, road_frontages):
+                # 바운딩박스가 떨어져 있으면 겹치는 길이는 0
+                if not planar.bbox_intersects(candidate_bbox, road.shape.bbox):
+                    continue
                 candidate_overlap_length = utils.get_overlap_length(
-                    candidate, road.curve
-                )
-                lot_overlap_length = utils.get_overlap_length(
-                    self.lot.region, road.curve
+                    candidate.curve, road.curve
                 )
                 if (
                     candidate_overlap_length
@@ -178,44 +206,68 @@ class OepnspaceGenerator:
 
         # 공개공지 면적 조건 필터링
         filtered_candidates = filter(
-            lambda x: geo.AreaMassProperties.Compute(x).Area
-            >= self.requirement.MIN_AREA,
+            lambda x: x.area >= self.requirement.MIN_AREA,
             filtered_candidates,
         )
 
         return list(filtered_candidates)
 
-    def sort_candidate_regions(self, candidates: List[geo.Curve]) -> List[geo.Curve]:
+    def sort_candidate_regions(
+        self, candidates: List[utils.Region]
+    ) -> List[utils.Region]:
         # 후보 지역 정렬 로직
         sorted_candidates = sorted(
             candidates,
-            key=lambda x: geo.AreaMassProperties.Compute(x).Area,
+            key=lambda x: x.area,
             reverse=True,
         )
         return sorted_candidates
 
-    def adjust_candidate_regions(self, candidates: List[geo.Curve]) -> List[geo.Curve]:
+    def adjust_candidate_regions(
+        self, candidates: List[utils.Region]
+    ) -> List[utils.Region]:
         # 후보 지역 조정 로직
-        def reduce_region(region: geo.Curve, target_area: float) -> geo.Curve:
+        road_curves = [road.curve for road in self.roads]
+
+        def reduce_region(region: utils.Region, target_area: float) -> utils.Region:
             # 후보 지역을 목표 면적에 맞게 조정
-            region = region.Duplicate()
-            area = geo.AreaMassProperties.Compute(region).Area
-            if area <= target_area:
-                return region
-            scale_factor = (target_area / area) ** 0.5
-            center_of_scale = utils.get_overlap_crv(region, self.lot.region)[0].PointAt(
-                0.5
+            if region.area <= target_area:
+                return utils.Region(region.curve.Duplicate())
+
+            # 가장 긴 접도 변과 평행한 직선으로 잘라 접도 길이와 최소 깊이를 유지
+            frontage = utils.get_longest_overlap_segment(region.curve, road_curves)
+            if frontage is not None and region.vertices:
+                trimmed = planar.trim_ring_from_edge(
+                    region.vertices,
+                    frontage[0],
+                    frontage[1],
+                    target_area,
+                    self.requirement.MIN_DEPTH,
+                    utils.AREA_TOL,
+                )
+                if trimmed:
+                    z = region.curve.PointAtStart.Z
+                    return utils.Region(
+                        utils.to_polyline_curve(trimmed, z, closed=True)
+                    )
+
+            # 폴리라인이 아니면 대지 경계와 겹치는 구간의 중점을 기준으로 축소
+            scale_factor = (target_area / region.area) ** 0.5
+            center_of_scale = utils.get_overlap_crv(region.curve, self.lot.region)[
+                0
+            ].PointAt(0.5)
+            return utils.Region(
+                ghcomp.Scale(region.curve, center_of_scale, scale_factor).geometry
             )
-            return ghcomp.Scale(region, center_of_scale, scale_factor).geometry
 
         adjusted_candidates = []
         total_area = 0.0
         # 후보 영역을 목표 면적에 도달할때 까지 확보
         for candidate in candidates:
-            area = geo.AreaMassProperties.Compute(candidate).Area
+            area = candidate.area
             if total_area + area > self.requirement.area:
                 candidate = reduce_region(candidate, self.requirement.area - total_area)
-                area = geo.AreaMassProperties.Compute(candidate).Area
+                area = candidate.area
 
             adjusted_candidates.append(candidate)
             total_area += area
@@ -240,9 +292,7 @@ openspace_generator = OepnspaceGenerator(
 
 openspace_regions = openspace_generator.get_openspace()
 
-openspace_area = sum(
-    geo.AreaMassProperties.Compute(region).Area for region in openspace_regions
-)
+openspace_area = sum(utils.Region(region).area for region in openspace_regions)
 print(f"Total Openspace Area: {openspace_area} m2")
 print(f"Lot Area: {lot.area} m2")
 print(f"Building Area: {building.total_area} m2")
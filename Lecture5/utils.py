@@ -4,10 +4,30 @@ try:
 except ImportError:
     pass
 import functools
+import math
+import os
+import sys
 
 import Rhino
 import Rhino.Geometry as geo  # ignore
-import ghpythonlib.components as ghcomp  # ignore
+
+# 공용 패키지(lauslecture) 경로 등록
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+from lauslecture import (  # noqa: E402
+    clipping,
+    offsetting,
+    overlap,
+    planar,
+    runtime,
+    spatial,
+)
+from lauslecture.backends import rhino as rhino_backend  # noqa: E402
+
+# 그래스호퍼 컴포넌트는 Clipper 등을 실제로 호출할 때 로드
+ghcomp = runtime.lazy_import("ghpythonlib.components")
 
 BIGNUM = 10000000
 
@@ -18,6 +38,38 @@ OP_TOL = 0.00001
 CLIPPER_TOL = 0.0000000001
 
 
+def get_polyline_vertices(crv: geo.Curve) -> Optional[List[Tuple[float, float]]]:
+    """폴리라인 커브의 꼭짓점 (닫힌 커브는 닫는 점 제외), 폴리라인이 아니면 None"""
+    is_polyline, polyline = crv.TryGetPolyline()
+    if not is_polyline:
+        return None
+    pts = [(pt.X, pt.Y) for pt in polyline]
+    if len(pts) > 1 and pts[0] == pts[-1]:
+        pts = pts[:-1]
+    return pts
+
+
+def to_polyline_curve(
+    pts: List[Tuple[float, float]], z: float = 0.0, closed: bool = False
+) -> geo.PolylineCurve:
+    """(x, y) 꼭짓점들로 높이 z의 폴리라인 커브를 만든다"""
+    points = [geo.Point3d(x, y, z) for x, y in pts]
+    if closed and points:
+        points.append(points[0])
+    return geo.PolylineCurve(points)
+
+
+def _get_polyline_overlaps(
+    crv_a: geo.Curve, crv_b: geo.Curve
+) -> Optional[Tuple[List[List[Tuple[float, float]]], float]]:
+    """두 커브가 모두 폴리라인이면 lauslecture.overlap으로 겹침 구간과 길이를 구한다"""
+    pts_a = get_polyline_vertices(crv_a)
+    pts_b = get_polyline_vertices(crv_b) if pts_a else None
+    if not pts_a or not pts_b:
+        return None
+    return overlap.get_overlaps(pts_a, pts_b, crv_a.IsClosed, crv_b.IsClosed, TOL)
+
+
 def get_overlap_crv(crv_a: geo.Curve, crv_b: geo.Curve) -> List[geo.Curve]:
     """두 커브의 겹치는 구간을 구한다.
     Args:
@@ -27,6 +79,12 @@ def get_overlap_crv(crv_a: geo.Curve, crv_b: geo.Curve) -> List[geo.Curve]:
     Returns:
         crv_a를 기준으로 crv_b와 겹치는 부분 커브
     """
+    result = _get_polyline_overlaps(crv_a, crv_b)
+    if result is not None:
+        z = crv_a.PointAtStart.Z
+        return [to_polyline_curve(pts, z) for pts in result[0]]
+
+    # 폴리라인이 아닌 커브는 그래스호퍼 컴포넌트로 계산
     # 두 커브가 교차조차 없으면 겹치는 부분이 없다.
     if not geo.Curve.PlanarCurveCollision(crv_a, crv_b, geo.Plane.WorldXY, TOL):
         return []
@@ -63,6 +121,10 @@ def get_overlap_length(crv_a: geo.Curve, crv_b: geo.Curve) -> float:
     Returns:
         crv_a를 기준으로 crv_b와 겹치는 부분 길이
     """
+    result = _get_polyline_overlaps(crv_a, crv_b)
+    if result is not None:
+        return result[1]
+
     overlap_crvs = get_overlap_crv(crv_a, crv_b)
     if not overlap_crvs:
         return 0.0
@@ -73,6 +135,24 @@ def get_overlap_length(crv_a: geo.Curve, crv_b: geo.Curve) -> float:
     return length
 
 
+def get_longest_overlap_segment(
+    crv: geo.Curve, others: List[geo.Curve]
+) -> Optional[Tuple[Tuple[float, float], Tuple[float, float]]]:
+    """crv가 others와 겹치는 구간 중 가장 긴 직선 구간 (폴리라인끼리만 계산, 없으면 None)"""
+    longest = None
+    longest_length = 0.0
+    for other in others:
+        result = _get_polyline_overlaps(crv, other)
+        if result is None:
+            continue
+        for pts in result[0]:
+            for a, b in planar.get_segments(pts, closed=False):
+                length = math.dist(a, b)
+                if length > longest_length:
+                    longest, longest_length = (a, b), length
+    return longest
+
+
 def is_intersection_with_other_crvs(crv: geo.Curve, crvs: List[geo.Curve]) -> bool:
     return any(
         geo.Curve.PlanarCurveCollision(crv, other_crv, geo.Plane.WorldXY, OP_TOL)
@@ -101,6 +181,58 @@ def has_region_intersection(
     return True
 
 
+def _get_region_vertices(region: geo.Curve) -> List[Tuple[float, float]]:
+    """영역 커브의 꼭짓점 (폴리라인이 아니면 TOL 이내로 폴리라인 근사)"""
+    pts = get_polyline_vertices(region)
+    if pts is None:
+        polyline = region.ToPolyline(TOL, math.radians(1), 0, 0)
+        pts = get_polyline_vertices(polyline) or []
+    return pts
+
+
+def get_region_difference(
+    regions: List[geo.Curve], others: List[geo.Curve]
+) -> List[List[geo.Curve]]:
+    """regions 각 영역에서 others를 뺀 조각 커브들 (입력 순서대로)
+
+    others를 한 번 합친 뒤 lauslecture.clipping으로 모든 영역을 한 번에 뺀다.
+    구멍이 생긴 조각은 커브 하나로 나타낼 수 없으므로 제외한다.
+    꼭짓점을 얻지 못한 커브가 있으면 Rhino Curve.CreateBooleanDifference로 계산한다.
+    """
+    if not others:
+        return [[region.DuplicateCurve()] for region in regions]
+    other_rings = [_get_region_vertices(other) for other in others]
+    if not all(other_rings):
+        return [
+            list(geo.Curve.CreateBooleanDifference(region, others, TOL) or [])
+            for region in regions
+        ]
+
+    # 서로 겹치는 영역이 even-odd 규칙으로 빠지지 않도록 먼저 합친다
+    clip = clipping.to_rings(clipping.union_all([[ring] for ring in other_rings]))
+    rings = [_get_region_vertices(region) for region in regions]
+    results = clipping.boolean_batch(
+        [([ring], clip) for ring in rings if ring], clipping.DIFFERENCE
+    )
+    pieces = iter(results)
+    differences = []  # type: List[List[geo.Curve]]
+    for region, ring in zip(regions, rings):
+        if not ring:
+            differences.append(
+                list(geo.Curve.CreateBooleanDifference(region, others, TOL) or [])
+            )
+            continue
+        z = region.PointAtStart.Z
+        differences.append(
+            [
+                to_polyline_curve(polygon.outer, z, closed=True)
+                for polygon in next(pieces)
+                if not polygon.holes
+            ]
+        )
+    return differences
+
+
 def offset_regions_inward(
     regions: Union[geo.Curve, List[geo.Curve]], dist: float, miter: int = BIGNUM
 ) -> List[geo.Curve]:
@@ -116,7 +248,9 @@ def offset_regions_inward(
 
     if not dist:
         return regions
-    return Offset().polyline_offset(regions, dist, miter).holes
+    if isinstance(regions, geo.Curve):
+        regions = [regions]
+    return Offset().polyline_offset_batch([regions], [dist], miter)[0].holes
 
 
 def offset_regions_outward(
@@ -132,8 +266,14 @@ def offset_regions_outward(
     """
     if isinstance(regions, geo.Curve):
         regions = [regions]
+    if not dist or not regions:
+        return list(regions)
 
-    return [offset_region_outward(region, dist, miter) for region in regions]
+    # 영역마다 따로 offset 하되 Clipper는 한 번만 호출
+    results = Offset().polyline_offset_batch(
+        [[region] for region in regions], [dist] * len(regions), miter
+    )
+    return [result.contour[0] for result in results]
 
 
 def offset_region_outward(
@@ -153,7 +293,24 @@ def offset_region_outward(
         return region
     if not isinstance(region, geo.Curve):
         raise ValueError("region must be curve")
-    return Offset().polyline_offset(region, dist, miter).contour[0]
+    return Offset().polyline_offset_batch([[region]], [dist], miter)[0].contour[0]
+
+
+class InwardOffsetFamily(offsetting.InwardOffsetFamily):
+    """같은 영역 묶음을 여러 거리로 안쪽 offset 한 결과 모음 (Rhino 커브용)"""
+
+    CACHE_NAMESPACE = "Lecture5.offset_family"
+
+    def __init__(self, regions: List[geo.Curve], miter: int = BIGNUM) -> None:
+        self.miter = miter
+        key = (tuple(get_curve_key(crv) for crv in regions), miter)
+        super().__init__(regions, key)
+
+    def offset(self, curves: List[geo.Curve], dist: float) -> List[geo.Curve]:
+        return offset_regions_inward(curves, dist, self.miter)
+
+    def copy(self, curve: geo.Curve) -> geo.Curve:
+        return curve.DuplicateCurve()
 
 
 def convert_io_to_list(func):
@@ -180,12 +337,98 @@ def convert_io_to_list(func):
     return wrapper
 
 
+def get_curve_key(crv: geo.Curve, precision: int = 6) -> tuple:
+    """커브 꼭짓점 좌표로 만든 캐시 키 (같은 형상이면 같은 키)"""
+    pts = [crv.PointAt(crv.SpanDomain(i)[0]) for i in range(crv.SpanCount)]
+    pts.append(crv.PointAtEnd)
+    return offsetting.get_points_key(((pt.X, pt.Y, pt.Z) for pt in pts), precision)
+
+
 class Offset:
+    # (커브 키들, 거리, miter, fillet) -> 결과, solve가 반복되어도 유지
+    CACHE_NAMESPACE = "Lecture5.offset"
+    CACHE_SIZE = 256
+
     class _PolylineOffsetResult:
         def __init__(self):
             self.contour: Optional[List[geo.Curve]] = None
             self.holes: Optional[List[geo.Curve]] = None
 
+        def duplicate(self) -> "Offset._PolylineOffsetResult":
+            copied = Offset._PolylineOffsetResult()
+            copied.contour = [crv.DuplicateCurve() for crv in self.contour]
+            copied.holes = [crv.DuplicateCurve() for crv in self.holes]
+            return copied
+
+    def polyline_offset_batch(
+        self,
+        crv_groups: List[List[geo.Curve]],
+        dists: List[float],
+        miter: int = BIGNUM,
+        closed_fillet: int = 2,
+        open_fillet: int = 2,
+        tol: float = Rhino.RhinoMath.ZeroTolerance,
+    ) -> List[_PolylineOffsetResult]:
+        """여러 커브 묶음을 각자의 거리로 offset (Clipper 호출은 한 번)
+
+        같은 묶음/거리/옵션의 결과는 메모해 두었다가 복사본을 돌려준다.
+        Args:
+            crv_groups: offset할 커브 묶음 리스트 (묶음 안의 커브는 함께 offset)
+            dists: 묶음별 offset 거리 (crv_groups와 같은 길이)
+
+        Returns:
+            입력 순서대로 묶음별 _PolylineOffsetResult
+        """
+        if len(crv_groups) != len(dists):
+            raise ValueError("crv_groups and dists must have the same length")
+
+        keys = [
+            (
+                tuple(get_curve_key(crv) for crv in crvs),
+                dist,
+                miter,
+                closed_fillet,
+                open_fillet,
+            )
+            for crvs, dist in zip(crv_groups, dists)
+        ]
+        # 메모에 없는 묶음만 모아서 한 번에 계산
+        return offsetting.memoize_batch(
+            Offset.CACHE_NAMESPACE,
+            keys,
+            lambda missing: self._polyline_offset_tree(
+                [crv_groups[i] for i in missing],
+                [dists[i] for i in missing],
+                miter,
+                closed_fillet,
+                open_fillet,
+                tol,
+            ),
+            Offset._PolylineOffsetResult.duplicate,
+            Offset.CACHE_SIZE,
+        )
+
+    def _polyline_offset_tree(
+        self,
+        crv_groups: List[List[geo.Curve]],
+        dists: List[float],
+        miter: int,
+        closed_fillet: int,
+        open_fillet: int,
+        tol: float,
+    ) -> List[_PolylineOffsetResult]:
+        """묶음별 PolylineOffset 결과 (Clipper 호출은 backends.rhino에서 한 번)"""
+        contours, holes = rhino_backend.polyline_offset_groups(
+            crv_groups, dists, miter, closed_fillet, open_fillet, tol
+        )
+        results = []
+        for contour, hole in zip(contours, holes):
+            offset_result = Offset._PolylineOffsetResult()
+            offset_result.contour = contour
+            offset_result.holes = hole
+            results.append(offset_result)
+        return results
+
     @convert_io_to_list
     def polyline_offset(
         self,
@@ -225,3 +468,101 @@ class Offset:
         for name in ("contour", "holes"):
             setattr(polyline_offset_result, name, result[name])
         return polyline_offset_result
+
+
+class Region:
+    """닫힌 영역 커브와 면적/중심/바운딩박스/둘레 캐시
+
+    폴리라인이면 꼭짓점에서 shoelace 공식으로 한 번만 계산하고,
+    폴리라인이 아니면 AreaMassProperties로 한 번만 계산한다.
+    """
+
+    def __init__(self, curve: geo.Curve) -> None:
+        self.curve = curve
+        self._vertices = None  # type: Optional[List[Tuple[float, float]]]
+        self._area = None  # type: Optional[float]
+        self._centroid = None  # type: Optional[geo.Point3d]
+        self._bbox = None  # type: Optional[Tuple[float, float, float, float]]
+        self._perimeter = None  # type: Optional[float]
+
+    @property
+    def vertices(self) -> Optional[List[Tuple[float, float]]]:
+        """폴리라인 꼭짓점 (닫는 점 제외), 폴리라인이 아니면 None"""
+        if self._vertices is None:
+            self._vertices = get_polyline_vertices(self.curve) or []
+        return self._vertices or None
+
+    @property
+    def area(self) -> float:
+        if self._area is None:
+            if self.vertices:
+                self._area = planar.get_area(self.vertices)
+            else:
+                self._area = geo.AreaMassProperties.Compute(self.curve).Area
+        return self._area
+
+    @property
+    def centroid(self) -> geo.Point3d:
+        if self._centroid is None:
+            if self.vertices:
+                x, y = planar.get_centroid(self.vertices)
+                self._centroid = geo.Point3d(x, y, self.curve.PointAtStart.Z)
+            else:
+                self._centroid = geo.AreaMassProperties.Compute(self.curve).Centroid
+        return self._centroid
+
+    @property
+    def bbox(self) -> Tuple[float, float, float, float]:
+        """(min_x, min_y, max_x, max_y)"""
+        if self._bbox is None:
+            if self.vertices:
+                self._bbox = planar.get_bbox(self.vertices)
+            else:
+                box = self.curve.GetBoundingBox(True)
+                self._bbox = (box.Min.X, box.Min.Y, box.Max.X, box.Max.Y)
+        return self._bbox
+
+    @property
+    def perimeter(self) -> float:
+        if self._perimeter is None:
+            if self.vertices:
+                self._perimeter = planar.get_perimeter(self.vertices)
+            else:
+                self._perimeter = self.curve.GetLength()
+        return self._perimeter
+
+    def __repr__(self) -> str:
+        return "Region(area={:.2f})".format(self.area)
+
+
+class RegionIndex:
+    """영역들의 교차 검사 인덱스
+
+    broad phase: 바운딩박스 트리로 바운딩박스가 겹치는 영역만 고른다.
+    narrow phase: 둘 다 폴리라인이면 planar.rings_intersect, 아니면 has_region_intersection.
+    """
+
+    def __init__(self, regions: List[Region], tol: float = TOL) -> None:
+        self.regions = regions
+        self.tol = tol
+        self.tree = spatial.BBoxTree(region.bbox for region in regions)
+
+    def _intersects(self, region: Region, other: Region) -> bool:
+        if region.vertices and other.vertices:
+            return planar.rings_intersect(region.vertices, other.vertices, self.tol)
+        return has_region_intersection(region.curve, other.curve, self.tol)
+
+    def query(self, region: Region) -> List[int]:
+        """region과 교차하는 영역 번호들"""
+        return [
+            i
+            for i in self.tree.query(planar.inflate_bbox(region.bbox, self.tol))
+            if self._intersects(region, self.regions[i])
+        ]
+
+    def intersects(self, region: Region) -> bool:
+        """region이 어느 영역과든 교차하는지 확인"""
+        return any(
+            self._intersects(region, self.regions[i])
+            for i in self.tree.query(planar.inflate_bbox(region.bbox, self.tol))
+        )
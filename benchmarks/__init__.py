@@ -0,0 +1 @@
+"""Rhino 없이 실행 가능한 파이프라인 벤치마크 모음 (python -m benchmarks.run)"""
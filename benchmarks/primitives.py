@@ -0,0 +1,219 @@
+"""기하 기본 타입 생성 비용 벤치마크 (메모리 할당량, 객체 수, 시간)
+
+같은 선분/다각형 배열을 세 가지 방식으로 만든다.
+    dict:  __slots__ 없는 일반 클래스 (요소마다 __dict__가 생긴다)
+    slots: lauslecture.primitives의 Point, Segment, Ring
+    array: lauslecture.primitives.SegmentArray 또는 (N, K, 2) 배열 (요소 객체를 만들지 않음,
+           SegmentArray는 입력 배열의 view라 추가 할당이 거의 없다)
+
+stall_mask 케이스는 feasibility.get_clear_stall_mask의 주차칸 검사 루프를 잰다.
+    tuple: 후보 주차칸마다 tolist로 꼭짓점 튜플 리스트를 만드는 이전 방식
+    slots: 후보 주차칸을 primitives.rings_from_array로 한 번에 바꾸는 현재 방식
+
+사용 예:
+    python -m benchmarks.primitives --count 100000
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lauslecture import feasibility, planar, primitives
+
+STALL_WIDTH = 2.5
+STALL_LENGTH = 5.0
+OBSTACLE_COUNT = 50
+OBSTACLE_SIZE = 30.0
+
+
+class _DictPoint:
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+class _DictSegment:
+    def __init__(self, a: _DictPoint, b: _DictPoint) -> None:
+        self.a = a
+        self.b = b
+
+
+class _DictRing:
+    def __init__(self, points: List[_DictPoint]) -> None:
+        self.points = points
+
+
+def build_dict_segments(segments: np.ndarray):
+    return [
+        _DictSegment(_DictPoint(ax, ay), _DictPoint(bx, by))
+        for (ax, ay), (bx, by) in segments.tolist()
+    ]
+
+
+def build_slots_segments(segments: np.ndarray):
+    return primitives.segments_from_array(segments)
+
+
+def build_array_segments(segments: np.ndarray):
+    return primitives.SegmentArray.from_array(segments)
+
+
+def build_dict_rings(rings: np.ndarray):
+    return [_DictRing([_DictPoint(x, y) for x, y in ring]) for ring in rings.tolist()]
+
+
+def build_slots_rings(rings: np.ndarray):
+    return primitives.rings_from_array(rings)
+
+
+def build_array_rings(rings: np.ndarray):
+    return rings.copy()
+
+
+def create_stall_data(count: int, rng: np.random.Generator):
+    """격자로 놓인 주차칸 (N, 4, 2)와 그 위에 흩어진 사각형 장애물들"""
+    cols = max(int(np.sqrt(count)), 1)
+    index = np.arange(count)
+    origins = np.stack(
+        [(index % cols) * STALL_WIDTH, (index // cols) * STALL_LENGTH], axis=1
+    )
+    quad = np.array(
+        [(0, 0), (STALL_WIDTH, 0), (STALL_WIDTH, STALL_LENGTH), (0, STALL_LENGTH)]
+    )
+    corners = origins[:, None, :] + quad[None, :, :]
+    extent = origins.max(axis=0) + (STALL_WIDTH, STALL_LENGTH)
+    size = OBSTACLE_SIZE
+    obstacles = [
+        [(x, y), (x + size, y), (x + size, y + size), (x, y + size)]
+        for x, y in rng.uniform((0, 0), extent, (OBSTACLE_COUNT, 2)).tolist()
+    ]
+    return corners, obstacles
+
+
+def tuple_stall_mask(data) -> np.ndarray:
+    """get_clear_stall_mask와 같은 검사를 후보 주차칸마다 tolist로 변환하며 수행"""
+    corners, obstacles = data
+    tol = feasibility.TOL
+    keep = np.ones(len(corners), dtype=bool)
+    centers = corners.mean(axis=1, keepdims=True)
+    offsets = corners - centers
+    norms = np.linalg.norm(offsets, axis=-1, keepdims=True)
+    shrunk = centers + offsets * np.maximum(norms - tol, 0) / np.where(
+        norms == 0, 1, norms
+    )
+    mins = shrunk.min(axis=1)
+    maxs = shrunk.max(axis=1)
+    for obstacle in obstacles:
+        x0, y0, x1, y1 = planar.get_bbox(obstacle)
+        near = np.flatnonzero(
+            keep
+            & (mins[:, 0] <= x1)
+            & (maxs[:, 0] >= x0)
+            & (mins[:, 1] <= y1)
+            & (maxs[:, 1] >= y0)
+        )
+        for i in near:
+            quad = [tuple(pt) for pt in shrunk[i].tolist()]
+            if planar.rings_intersect(quad, obstacle, 0.0):
+                keep[i] = False
+    return keep
+
+
+def slots_stall_mask(data) -> np.ndarray:
+    return feasibility.get_clear_stall_mask(*data)
+
+
+CASES = {
+    "segments": (
+        lambda count, rng: rng.uniform(0, 1000, (count, 2, 2)),
+        {
+            "dict": build_dict_segments,
+            "slots": build_slots_segments,
+            "array": build_array_segments,
+        },
+    ),
+    "rings": (
+        lambda count, rng: rng.uniform(0, 1000, (count, 4, 2)),
+        {
+            "dict": build_dict_rings,
+            "slots": build_slots_rings,
+            "array": build_array_rings,
+        },
+    ),
+    "stall_mask": (
+        create_stall_data,
+        {
+            "tuple": tuple_stall_mask,
+            "slots": slots_stall_mask,
+        },
+    ),
+}  # type: Dict[str, Tuple[Callable, Dict[str, Callable]]]
+
+
+def measure(func: Callable, data: Any, repeat: int) -> Tuple[float, int, int, int]:
+    """(최소 시간, 결과가 차지하는 바이트, 할당 블록 수, 실행 중 최대 할당 바이트)"""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(data)
+        best = min(best, time.perf_counter() - start)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = func(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del result
+    return best, size, blocks, peak
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--case", action="append", choices=sorted(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    print(
+        "{:<10s} {:<6s} {:>9s} {:>11s} {:>11s} {:>9s} {:>9s}".format(
+            "case", "kind", "time(s)", "MB", "blocks", "peak MB", "vs first"
+        )
+    )
+    print("-" * 71)
+    for case in args.case or list(CASES):
+        create_data, builders = CASES[case]
+        data = create_data(args.count, rng)
+        baseline = None
+        for kind, func in builders.items():
+            seconds, size, blocks, peak = measure(func, data, args.repeat)
+            baseline = baseline or size
+            print(
+                "{:<10s} {:<6s} {:>9.3f} {:>11.2f} {:>11d} {:>9.2f} {:>8.1f}%".format(
+                    case,
+                    kind,
+                    seconds,
+                    size / 1e6,
+                    blocks,
+                    peak / 1e6,
+                    size / baseline * 100,
+                )
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""Lecture2/Lecture3 파이프라인 벤치마크 실행기
+
+사용 예:
+    python -m benchmarks.run --scale 1k
+    python -m benchmarks.run --scale 10k --case landlocked --case isovist --repeat 3
+
+결과는 benchmarks/results/history.jsonl 에 커밋 해시와 함께 누적되며,
+같은 규모/케이스의 직전 기록과 비교한 변화율을 출력한다.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from benchmarks import synthetic
+from lauslecture import backends, isovist, parcels, planar, terrain
+
+HISTORY_PATH = os.path.join(os.path.dirname(__file__), "results", "history.jsonl")
+ISOVIST_SPACING = 50.0  # 보행 경로 분석점 간격
+ISOVIST_RADIUS = 50.0
+
+
+def run_landlocked(city: synthetic.City) -> int:
+    return len(parcels.find_landlocked_lots(city.lots, city.roads))
+
+
+def run_flag_lots(city: synthetic.City) -> int:
+    return len(parcels.find_flag_lots(city.lots, city.roads))
+
+
+def run_mesh_points(city: synthetic.City) -> int:
+    return len(terrain.create_points_for_mesh(city.contours, 4.0))
+
+
+def run_isovist(city: synthetic.City) -> int:
+    segments, index = isovist.create_obstacle_index(city.buildings, ISOVIST_RADIUS)
+    ray_count = 0
+    for pt in planar.divide_by_length(city.path, ISOVIST_SPACING, True):
+        ray_count += len(isovist.get_isovist(pt, segments, index, ISOVIST_RADIUS))
+    return ray_count
+
+
+CASES = {
+    "landlocked": run_landlocked,
+    "flag_lots": run_flag_lots,
+    "mesh_points": run_mesh_points,
+    "isovist": run_isovist,
+}  # type: Dict[str, Callable[[synthetic.City], int]]
+
+
+def get_commit() -> Optional[str]:
+    """현재 git 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=os.path.dirname(__file__),
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_case(func: Callable[[synthetic.City], int], city: synthetic.City, repeat: int):
+    """repeat번 실행하여 최소 시간과 결과값을 반환"""
+    best = float("inf")
+    result = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(city)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def load_history(path: str) -> List[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(path: str, entries: List[dict]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def get_previous(history: List[dict], scale: str, case: str) -> Optional[dict]:
+    for entry in reversed(history):
+        if entry["scale"] == scale and entry["case"] == case:
+            return entry
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(synthetic.SCALES), default="1k")
+    parser.add_argument("--case", action="append", choices=sorted(CASES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--backend", choices=sorted(backends.BACKEND_MODULES), default="python"
+    )
+    parser.add_argument("--history", default=HISTORY_PATH)
+    parser.add_argument("--no-save", action="store_true", help="기록을 저장하지 않음")
+    args = parser.parse_args(argv)
+
+    cases = args.case or list(CASES)
+    backends.set_backend(args.backend)
+    start = time.perf_counter()
+    city = synthetic.generate_city(synthetic.SCALES[args.scale], args.seed)
+    print(
+        "scale {}: {} lots, {} roads, {} buildings, {} contours ({:.2f}s to generate)".format(
+            args.scale,
+            len(city.lots),
+            len(city.roads),
+            len(city.buildings),
+            len(city.contours),
+            time.perf_counter() - start,
+        )
+    )
+
+    history = load_history(args.history)
+    commit = get_commit()
+    timestamp = datetime.datetime.now().isoformat(timespec="seconds")
+
+    entries = []
+    print(
+        "{:<14s} {:>10s} {:>10s} {:>9s}".format("case", "time(s)", "result", "change")
+    )
+    print("-" * 46)
+    for case in cases:
+        seconds, result = time_case(CASES[case], city, args.repeat)
+        previous = get_previous(history, args.scale, case)
+        change = ""
+        if previous and previous["seconds"] > 0:
+            change = "{:+.1f}%".format((seconds / previous["seconds"] - 1) * 100)
+        print("{:<14s} {:>10.3f} {:>10d} {:>9s}".format(case, seconds, result, change))
+
+        entries.append(
+            {
+                "commit": commit,
+                "timestamp": timestamp,
+                "python": platform.python_version(),
+                "scale": args.scale,
+                "backend": args.backend,
+                "case": case,
+                "seed": args.seed,
+                "repeat": args.repeat,
+                "seconds": seconds,
+                "result": result,
+            }
+        )
+
+    if not args.no_save:
+        append_history(args.history, entries)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
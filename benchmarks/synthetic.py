@@ -0,0 +1,157 @@
+"""벤치마크용 가상 도시 데이터 생성기
+
+모든 생성기는 seed가 같으면 같은 결과를 만든다.
+"""
+import math
+import random
+from typing import List, Tuple
+
+from lauslecture.planar import Point, Ring
+
+Point3 = Tuple[float, float, float]
+
+SCALES = {"1k": 1000, "10k": 10000, "100k": 100000}
+
+LOT_WIDTH = 12.0
+LOT_DEPTH = 20.0
+ROAD_WIDTH = 8.0
+BLOCK_COLS = 10  # 블록당 가로 필지 수 (세로는 3열)
+FLAG_EVERY = 4  # 몇 번째 열마다 가운데 필지를 자루형으로 만들지
+STEM_WIDTH = 3.0  # 자루형 필지의 통로 폭
+
+
+class City:
+    """가상 도시 데이터"""
+
+    def __init__(self) -> None:
+        self.lots = []  # type: List[Ring]
+        self.roads = []  # type: List[Ring]
+        self.buildings = []  # type: List[Ring]
+        self.building_floors = []  # type: List[int]
+        self.contours = []  # type: List[List[Point3]]
+        self.path = []  # type: List[Point]
+        self.width = 0.0
+        self.height = 0.0
+
+
+def get_rect(x: float, y: float, w: float, h: float) -> Ring:
+    return [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+
+
+def get_block_lots(x0: float, y0: float) -> List[Ring]:
+    """블록 하나의 필지들 (3열: 아래, 가운데, 위)
+
+    가운데 열은 양 끝을 제외하면 맹지이고, FLAG_EVERY 열마다 아래 필지를
+    가로지르는 통로를 가진 자루형 필지가 된다.
+    """
+    lots = []
+    for col in range(BLOCK_COLS):
+        x = x0 + col * LOT_WIDTH
+        is_flag = 0 < col < BLOCK_COLS - 1 and col % FLAG_EVERY == 0
+
+        if is_flag:
+            # 아래 필지는 통로 폭만큼 줄어든다
+            lots.append(get_rect(x + STEM_WIDTH, y0, LOT_WIDTH - STEM_WIDTH, LOT_DEPTH))
+            y1 = y0 + LOT_DEPTH
+            lots.append(
+                [
+                    (x, y0),
+                    (x + STEM_WIDTH, y0),
+                    (x + STEM_WIDTH, y1),
+                    (x + LOT_WIDTH, y1),
+                    (x + LOT_WIDTH, y1 + LOT_DEPTH),
+                    (x, y1 + LOT_DEPTH),
+                ]
+            )
+        else:
+            lots.append(get_rect(x, y0, LOT_WIDTH, LOT_DEPTH))
+            lots.append(get_rect(x, y0 + LOT_DEPTH, LOT_WIDTH, LOT_DEPTH))
+
+        lots.append(get_rect(x, y0 + 2 * LOT_DEPTH, LOT_WIDTH, LOT_DEPTH))
+    return lots
+
+
+def generate_parcel_grid(feature_count: int, city: City) -> None:
+    """약 feature_count개의 필지와 블록을 둘러싼 도로망 생성"""
+    lots_per_block = BLOCK_COLS * 3
+    block_count = max(1, int(math.ceil(feature_count / lots_per_block)))
+    grid_cols = max(1, int(math.ceil(math.sqrt(block_count))))
+    grid_rows = int(math.ceil(block_count / grid_cols))
+
+    block_w = BLOCK_COLS * LOT_WIDTH
+    block_h = 3 * LOT_DEPTH
+    pitch_x = block_w + ROAD_WIDTH
+    pitch_y = block_h + ROAD_WIDTH
+
+    for b in range(block_count):
+        row, col = divmod(b, grid_cols)
+        city.lots.extend(
+            get_block_lots(ROAD_WIDTH + col * pitch_x, ROAD_WIDTH + row * pitch_y)
+        )
+
+    # 블록 한 변마다 도로 구간 하나 (교차로 포함)
+    for row in range(grid_rows + 1):
+        for col in range(grid_cols):
+            city.roads.append(
+                get_rect(col * pitch_x, row * pitch_y, pitch_x + ROAD_WIDTH, ROAD_WIDTH)
+            )
+    for col in range(grid_cols + 1):
+        for row in range(grid_rows):
+            city.roads.append(
+                get_rect(col * pitch_x, row * pitch_y, ROAD_WIDTH, pitch_y + ROAD_WIDTH)
+            )
+
+    city.width = grid_cols * pitch_x + ROAD_WIDTH
+    city.height = grid_rows * pitch_y + ROAD_WIDTH
+    # 첫 번째 가로 도로 중심선을 보행 경로로 사용
+    city.path = [(0.0, ROAD_WIDTH / 2), (city.width, ROAD_WIDTH / 2)]
+
+
+def generate_buildings(city: City, rng: random.Random, setback: float = 2.0) -> None:
+    """필지마다 setback만큼 안쪽의 직사각형 건물 외곽선 생성"""
+    for lot in city.lots:
+        xs = [pt[0] for pt in lot]
+        ys = [pt[1] for pt in lot]
+        w = max(xs) - min(xs) - 2 * setback
+        h = max(ys) - min(ys) - 2 * setback
+        if w <= 0 or h <= 0:
+            continue
+        city.buildings.append(get_rect(min(xs) + setback, min(ys) + setback, w, h))
+        city.building_floors.append(rng.randint(1, 15))
+
+
+def generate_contours(
+    city: City,
+    rng: random.Random,
+    contour_count: int,
+    interval: float = 2.0,
+    vertex_count: int = 64,
+) -> None:
+    """언덕 중심을 둘러싼 물결 모양의 닫힌 등고선 생성"""
+    hill_count = max(1, contour_count // 20)
+    levels_per_hill = int(math.ceil(contour_count / hill_count))
+    for _ in range(hill_count):
+        cx = rng.uniform(0, city.width)
+        cy = rng.uniform(0, city.height)
+        phase = rng.uniform(0, 2 * math.pi)
+        for level in range(levels_per_hill):
+            if len(city.contours) >= contour_count:
+                return
+            radius = 10.0 * (levels_per_hill - level)
+            z = level * interval
+            contour = []
+            for k in range(vertex_count + 1):
+                angle = 2 * math.pi * k / vertex_count
+                r = radius * (1 + 0.1 * math.sin(3 * angle + phase))
+                contour.append((cx + r * math.cos(angle), cy + r * math.sin(angle), z))
+            city.contours.append(contour)
+
+
+def generate_city(feature_count: int, seed: int = 0) -> City:
+    """feature_count 규모의 필지, 도로, 건물, 등고선 데이터 생성"""
+    rng = random.Random(seed)
+    city = City()
+    generate_parcel_grid(feature_count, city)
+    generate_buildings(city, rng)
+    generate_contours(city, rng, max(10, feature_count // 10))
+    return city
@@ -0,0 +1 @@
+"""LausLecture 강의 스크립트들이 공유하는 Rhino 비의존 도구 모음"""
@@ -0,0 +1,111 @@
+"""교체 가능한 기하 연산 백엔드
+
+같은 파이프라인 코드가 Rhino 안에서는 RhinoCommon(+Clipper)으로,
+Linux 배치 노드에서는 순수 파이썬으로 동작하도록 기하 연산을 한 곳으로 모은다.
+
+    from lauslecture import backends
+
+    backend = backends.get_backend()  # 환경변수 LAUS_GEOMETRY_BACKEND 또는 자동 선택
+    backends.set_backend("python")  # 실행 중 교체
+"""
+import importlib
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from lauslecture.planar import BBox, Point
+
+# curve_relation 결과
+DISJOINT = "disjoint"
+INTERSECTING = "intersecting"
+A_INSIDE_B = "a_inside_b"
+B_INSIDE_A = "b_inside_a"
+
+BACKEND_MODULES = {
+    "rhino": "lauslecture.backends.rhino",
+    "python": "lauslecture.backends.python",
+}
+ENV_NAME = "LAUS_GEOMETRY_BACKEND"
+
+
+class GeometryBackend:
+    """기하 연산 백엔드 인터페이스
+
+    커브/점 객체는 백엔드 고유 타입이며, 좌표를 돌려주는 메서드는
+    항상 (x, y) 튜플을 사용한다. 닫힌 폴리라인의 부호 있는 offset 거리는
+    양수가 바깥쪽, 음수가 안쪽이다.
+    """
+
+    name = ""
+
+    def point(self, x: float, y: float, z: float = 0.0) -> Any:
+        raise NotImplementedError
+
+    def polyline(self, points: Sequence[Sequence[float]], closed: bool = False) -> Any:
+        raise NotImplementedError
+
+    def vertices(self, curve: Any) -> List[Point]:
+        """폴리라인의 꼭짓점들 (닫힌 경우 시작점을 반복하지 않음)"""
+        raise NotImplementedError
+
+    def bounding_box(self, geometry: Any) -> BBox:
+        raise NotImplementedError
+
+    def offset(self, curve: Any, distance: float) -> List[Any]:
+        raise NotImplementedError
+
+    def closest_point(self, curve: Any, pt: Any) -> Tuple[Point, float]:
+        """커브 위의 최근접점과 거리"""
+        raise NotImplementedError
+
+    def curve_relation(self, curve_a: Any, curve_b: Any, tol: float = 0.001) -> str:
+        """두 닫힌 커브의 관계 (DISJOINT, INTERSECTING, A_INSIDE_B, B_INSIDE_A)"""
+        raise NotImplementedError
+
+    def area(self, curve: Any) -> float:
+        raise NotImplementedError
+
+    def length(self, curve: Any) -> float:
+        raise NotImplementedError
+
+
+_instances = {}  # type: Dict[str, GeometryBackend]
+_current = None  # type: Optional[GeometryBackend]
+
+
+def load_backend(name: str) -> GeometryBackend:
+    """이름으로 백엔드 인스턴스를 생성 (한 번 만든 인스턴스는 재사용)"""
+    if name not in BACKEND_MODULES:
+        raise ValueError(
+            "Unknown geometry backend: {} (choose from {})".format(
+                name, ", ".join(sorted(BACKEND_MODULES))
+            )
+        )
+    if name not in _instances:
+        module = importlib.import_module(BACKEND_MODULES[name])
+        _instances[name] = module.Backend()
+    return _instances[name]
+
+
+def get_default_backend_name() -> str:
+    """환경변수가 없으면 Rhino가 있을 때 rhino, 아니면 python"""
+    name = os.environ.get(ENV_NAME)
+    if name:
+        return name
+    try:
+        import Rhino  # noqa: F401
+    except ImportError:
+        return "python"
+    return "rhino"
+
+
+def get_backend() -> GeometryBackend:
+    global _current
+    if _current is None:
+        _current = load_backend(get_default_backend_name())
+    return _current
+
+
+def set_backend(name: str) -> GeometryBackend:
+    global _current
+    _current = load_backend(name)
+    return _current
@@ -0,0 +1,93 @@
+"""순수 파이썬 기하 백엔드
+
+폴리라인은 (x, y) 튜플 리스트로 표현하며, Rhino의 PolylineCurve처럼
+시작점과 끝점이 같으면 닫힌 커브로 본다.
+"""
+import math
+from typing import List, Sequence, Tuple
+
+from lauslecture import clipping, planar
+from lauslecture.backends import (
+    A_INSIDE_B,
+    B_INSIDE_A,
+    DISJOINT,
+    INTERSECTING,
+    GeometryBackend,
+)
+from lauslecture.planar import BBox, Point
+
+
+class Backend(GeometryBackend):
+    name = "python"
+
+    def point(self, x: float, y: float, z: float = 0.0) -> Point:
+        return (x, y)
+
+    def polyline(
+        self, points: Sequence[Sequence[float]], closed: bool = False
+    ) -> List[Point]:
+        result = [(pt[0], pt[1]) for pt in points]
+        if closed and result[0] != result[-1]:
+            result.append(result[0])
+        return result
+
+    def vertices(self, curve: Sequence[Point]) -> List[Point]:
+        if len(curve) > 1 and tuple(curve[0]) == tuple(curve[-1]):
+            return list(curve[:-1])
+        return list(curve)
+
+    def is_closed(self, curve: Sequence[Point]) -> bool:
+        return len(curve) > 2 and tuple(curve[0]) == tuple(curve[-1])
+
+    def bounding_box(self, geometry: Sequence[Point]) -> BBox:
+        if geometry and not isinstance(geometry[0], (tuple, list)):
+            return (geometry[0], geometry[1], geometry[0], geometry[1])
+        return planar.get_bbox(geometry)
+
+    def offset(self, curve: Sequence[Point], distance: float) -> List[List[Point]]:
+        vertices = self.vertices(curve)
+        ring = planar.offset_ring(vertices, distance)
+        if ring is not None:
+            return [self.polyline(ring, closed=True)]
+        # miter offset이 갈라지거나 스스로 교차하면 불리언 offset으로 계산 (오목한 모서리는 둥글게)
+        return [
+            self.polyline(polygon.outer, closed=True)
+            for polygon in clipping.offset([vertices], distance)
+        ]
+
+    def closest_point(
+        self, curve: Sequence[Point], pt: Sequence[float]
+    ) -> Tuple[Point, float]:
+        pt = (pt[0], pt[1])
+        best_pt, best_dist = None, math.inf
+        for a, b in planar.get_segments(curve, closed=False):
+            closest = planar.get_closest_pt_on_segment(pt, a, b)
+            dist = math.dist(pt, closest)
+            if dist < best_dist:
+                best_pt, best_dist = closest, dist
+        return best_pt, best_dist
+
+    def curve_relation(
+        self, curve_a: Sequence[Point], curve_b: Sequence[Point], tol: float = 0.001
+    ) -> str:
+        ring_a = self.vertices(curve_a)
+        ring_b = self.vertices(curve_b)
+        bbox_a = planar.get_bbox(ring_a)
+        bbox_b = planar.get_bbox(ring_b)
+        if not planar.bbox_intersects(
+            planar.inflate_bbox(bbox_a, tol), planar.inflate_bbox(bbox_b, tol)
+        ):
+            return DISJOINT
+        if planar.is_ring_near_ring(ring_a, ring_b, tol):
+            return INTERSECTING
+        if planar.is_pt_inside_ring(ring_a[0], ring_b):
+            return A_INSIDE_B
+        if planar.is_pt_inside_ring(ring_b[0], ring_a):
+            return B_INSIDE_A
+        return DISJOINT
+
+    def area(self, curve: Sequence[Point]) -> float:
+        return planar.get_area(self.vertices(curve))
+
+    def length(self, curve: Sequence[Point]) -> float:
+        return planar.get_perimeter(curve, closed=False)
@@ -0,0 +1,130 @@
+"""RhinoCommon + Clipper 기하 백엔드 (Rhino/Grasshopper 안에서만 사용 가능)"""
+from typing import List, Sequence, Tuple
+
+import Rhino
+import Rhino.Geometry as geo  # type: ignore
+
+from lauslecture import offsetting, runtime
+from lauslecture.backends import (
+    A_INSIDE_B,
+    B_INSIDE_A,
+    DISJOINT,
+    INTERSECTING,
+    GeometryBackend,
+)
+from lauslecture.planar import BBox, Point
+
+BIGNUM = 10000000  # Clipper miter limit
+
+ghcomp = runtime.lazy_import("ghpythonlib.components")
+th = runtime.lazy_import("ghpythonlib.treehelpers")
+
+RELATIONS = {
+    geo.RegionContainment.Disjoint: DISJOINT,
+    geo.RegionContainment.MutualIntersection: INTERSECTING,
+    geo.RegionContainment.AInsideB: A_INSIDE_B,
+    geo.RegionContainment.BInsideA: B_INSIDE_A,
+}
+
+
+class Backend(GeometryBackend):
+    name = "rhino"
+
+    def point(self, x: float, y: float, z: float = 0.0) -> geo.Point3d:
+        return geo.Point3d(x, y, z)
+
+    def polyline(
+        self, points: Sequence[Sequence[float]], closed: bool = False
+    ) -> geo.PolylineCurve:
+        pts = [geo.Point3d(pt[0], pt[1], pt[2] if len(pt) > 2 else 0) for pt in points]
+        if closed and pts[0].DistanceTo(pts[-1]) > Rhino.RhinoMath.ZeroTolerance:
+            pts.append(pts[0])
+        return geo.PolylineCurve(pts)
+
+    def vertices(self, curve: geo.Curve) -> List[Point]:
+        vertices = [
+            curve.PointAt(curve.SpanDomain(i)[0]) for i in range(curve.SpanCount)
+        ]
+        if not curve.IsClosed:
+            vertices.append(curve.PointAtEnd)
+        return [(pt.X, pt.Y) for pt in vertices]
+
+    def bounding_box(self, geometry: geo.GeometryBase) -> BBox:
+        if isinstance(geometry, geo.Point3d):
+            return (geometry.X, geometry.Y, geometry.X, geometry.Y)
+        bbox = geometry.GetBoundingBox(False)
+        return (bbox.Min.X, bbox.Min.Y, bbox.Max.X, bbox.Max.Y)
+
+    def offset(self, curve: geo.Curve, distance: float) -> List[geo.Curve]:
+        if not distance:
+            return [curve]
+        plane = geo.Plane(geo.Point3d(0, 0, curve.PointAtEnd.Z), geo.Vector3d.ZAxis)
+        result = ghcomp.ClipperComponents.PolylineOffset(
+            [curve],
+            [abs(distance)],
+            plane,
+            Rhino.RhinoMath.ZeroTolerance,
+            2,  # closed_fillet: 2 = miter
+            2,  # open_fillet: 2 = butt
+            BIGNUM,
+        )
+        output = result["contour"] if distance > 0 else result["holes"]
+        if not output:
+            return []
+        if isinstance(output, geo.Curve):
+            return [output]
+        return list(output)
+
+    def closest_point(self, curve: geo.Curve, pt: geo.Point3d) -> Tuple[Point, float]:
+        _, param = curve.ClosestPoint(pt)
+        closest = curve.PointAt(param)
+        return (closest.X, closest.Y), closest.DistanceTo(pt)
+
+    def curve_relation(
+        self, curve_a: geo.Curve, curve_b: geo.Curve, tol: float = 0.001
+    ) -> str:
+        relationship = geo.Curve.PlanarClosedCurveRelationship(
+            curve_a, curve_b, geo.Plane.WorldXY, tol
+        )
+        return RELATIONS[relationship]
+
+    def area(self, curve: geo.Curve) -> float:
+        return geo.AreaMassProperties.Compute(curve).Area
+
+    def length(self, curve: geo.Curve) -> float:
+        return curve.GetLength()
+
+
+def polyline_offset_groups(
+    crv_groups: Sequence[Sequence[geo.Curve]],
+    dists: Sequence[float],
+    miter: float,
+    closed_fillet: int,
+    open_fillet: int,
+    tol: float,
+) -> Tuple[List[List[geo.Curve]], List[List[geo.Curve]]]:
+    """커브 묶음마다 가지 하나인 DataTree로 PolylineOffset을 한 번 호출
+
+    source=[]로 입력 가지 경로를 {i}로 만들어 출력 경로의 첫 인덱스가 묶음 번호가 되게 한다.
+    (기본값 source=[0]이면 경로가 {0;i}라 모든 결과가 0번 묶음으로 모인다)
+
+    Returns:
+        (묶음별 contour 커브들, 묶음별 holes 커브들)
+    """
+    plane = geo.Plane(
+        geo.Point3d(0, 0, crv_groups[0][0].PointAtEnd.Z), geo.Vector3d.ZAxis
+    )
+    result = ghcomp.ClipperComponents.PolylineOffset(
+        th.list_to_tree([list(crvs) for crvs in crv_groups], source=[]),
+        th.list_to_tree([[dist] for dist in dists], source=[]),
+        plane,
+        tol,
+        closed_fillet,
+        open_fillet,
+        miter,
+    )
+    count = len(crv_groups)
+    return (
+        offsetting.group_tree_by_input(result["contour"], count),
+        offsetting.group_tree_by_input(result["holes"], count),
+    )
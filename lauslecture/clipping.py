@@ -0,0 +1,465 @@
+"""정수 좌표 다각형 불리언 연산 (합집합, 교집합, 차집합, 대칭차)
+
+그래스호퍼 컴포넌트 없이 영역끼리 더하고 빼기 위한 엔진이다.
+
+1. 좌표를 10**precision 배 한 정수로 바꿔 방향/교차 판정을 정확하게 한다.
+2. 두 입력의 모든 변을 서로의 교차점, 접점에서 나누고 겹치는 변은 하나로 합친다.
+3. 나뉜 변마다 왼쪽/오른쪽이 각 입력의 안쪽인지 even-odd 규칙으로 판정하고,
+   연산 결과의 안/밖 경계가 되는 변만 결과 안쪽이 왼쪽이 되도록 남긴다.
+4. 남은 변을 꼭짓점마다 가장 왼쪽으로 꺾으며 이어 고리를 만들고,
+   반시계 고리는 외곽, 시계 고리는 구멍으로 외곽에 배정한다.
+
+영역(Shape)은 고리(ring) 리스트이며 even-odd 규칙으로 안쪽을 정하므로
+외곽과 구멍의 방향은 상관없다. 결과 Polygon.rings를 그대로 다시 입력으로 쓸 수 있다.
+서로 겹칠 수 있는 영역들은 한 Shape에 넣지 말고 union_all로 먼저 합친다.
+
+    from lauslecture import clipping
+
+    footprint = clipping.to_rings(clipping.union_all([[ring] for ring in buildings]))
+    pieces = clipping.difference([lot], footprint)
+    area = sum(p.area for p in pieces)
+"""
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from lauslecture import planar
+from lauslecture.planar import Point, Ring
+
+UNION = "union"
+INTERSECTION = "intersection"
+DIFFERENCE = "difference"
+XOR = "xor"
+
+OPERATIONS = {
+    UNION: lambda a, b: a or b,
+    INTERSECTION: lambda a, b: a and b,
+    DIFFERENCE: lambda a, b: a and not b,
+    XOR: lambda a, b: a != b,
+}  # type: Dict[str, Callable[[bool, bool], bool]]
+
+PRECISION = 4  # 정수화 소수점 자리수 (0.0001 단위)
+PROBE = 1e-3  # 변 중점에서 좌우 판정점까지 거리 (정수 좌표 단위)
+
+Shape = Sequence[Ring]
+IntPoint = Tuple[int, int]
+IntEdge = Tuple[IntPoint, IntPoint]
+
+
+class Polygon:
+    """불리언 연산 결과 영역 하나 (반시계 외곽 + 시계 구멍들)"""
+
+    __slots__ = ("outer", "holes")
+
+    def __init__(self, outer: List[Point], holes: Sequence[List[Point]] = ()) -> None:
+        self.outer = outer
+        self.holes = list(holes)
+
+    @property
+    def rings(self) -> List[List[Point]]:
+        return [self.outer] + self.holes
+
+    @property
+    def area(self) -> float:
+        return planar.get_area(self.outer) - sum(planar.get_area(h) for h in self.holes)
+
+    def __repr__(self) -> str:
+        return "Polygon(area={:.2f}, holes={})".format(self.area, len(self.holes))
+
+
+def to_rings(polygons: Sequence[Polygon]) -> List[List[Point]]:
+    """결과 Polygon들을 다시 입력으로 쓸 수 있는 고리 리스트로 변환"""
+    return [ring for polygon in polygons for ring in polygon.rings]
+
+
+# ================ 정수 기하 ================
+
+
+def _to_int_rings(shape: Shape, scale: int) -> List[List[IntPoint]]:
+    rings = []
+    for ring in shape:
+        pts = []  # type: List[IntPoint]
+        for pt in ring:
+            ipt = (int(round(pt[0] * scale)), int(round(pt[1] * scale)))
+            if not pts or pts[-1] != ipt:
+                pts.append(ipt)
+        while len(pts) > 1 and pts[0] == pts[-1]:
+            pts.pop()
+        if len(pts) >= 3:
+            rings.append(pts)
+    return rings
+
+
+def _orient(a: IntPoint, b: IntPoint, c: IntPoint) -> int:
+    return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+
+def _in_range(a: IntPoint, b: IntPoint, p: IntPoint) -> bool:
+    """a, b, p가 한 직선 위에 있을 때 p가 선분 ab 위에 있는지"""
+    return min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and min(a[1], b[1]) <= p[
+        1
+    ] <= max(a[1], b[1])
+
+
+def _div_round(num: int, den: int) -> int:
+    if den < 0:
+        num, den = -num, -den
+    return (2 * num + den) // (2 * den)
+
+
+def _get_split_points(e: IntEdge, f: IntEdge) -> Tuple[List[IntPoint], List[IntPoint]]:
+    """두 선분이 서로를 나눠야 하는 점들 (e 위의 점들, f 위의 점들)"""
+    a, b = e
+    c, d = f
+    d1 = _orient(a, b, c)
+    d2 = _orient(a, b, d)
+    d3 = _orient(c, d, a)
+    d4 = _orient(c, d, b)
+
+    if d1 == 0 and d2 == 0:
+        # 같은 직선 위: 서로의 끝점이 상대 선분 위에 있으면 나눈다
+        return (
+            [p for p in (c, d) if _in_range(a, b, p)],
+            [p for p in (a, b) if _in_range(c, d, p)],
+        )
+
+    if (d1 > 0) != (d2 > 0) and d1 and d2 and (d3 > 0) != (d4 > 0) and d3 and d4:
+        # 내부에서 교차: 교점을 정수 격자로 반올림
+        den = (b[0] - a[0]) * (d[1] - c[1]) - (b[1] - a[1]) * (d[0] - c[0])
+        num = (c[0] - a[0]) * (d[1] - c[1]) - (c[1] - a[1]) * (d[0] - c[0])
+        pt = (
+            a[0] + _div_round((b[0] - a[0]) * num, den),
+            a[1] + _div_round((b[1] - a[1]) * num, den),
+        )
+        return [pt], [pt]
+
+    # 한쪽 끝점이 다른 선분에 닿는 경우
+    on_e = [p for p, o in ((c, d1), (d, d2)) if o == 0 and _in_range(a, b, p)]
+    on_f = [p for p, o in ((a, d3), (b, d4)) if o == 0 and _in_range(c, d, p)]
+    return on_e, on_f
+
+
+def _split_edges(edges: List[IntEdge]) -> List[List[IntPoint]]:
+    """모든 선분 쌍의 교차점으로 선분을 나눈 점 리스트 (x 구간 sweep으로 후보 쌍을 찾는다)"""
+    points = [[a, b] for a, b in edges]
+    order = sorted(range(len(edges)), key=lambda i: min(edges[i][0][0], edges[i][1][0]))
+    active = []  # type: List[int]
+    for i in order:
+        a, b = edges[i]
+        min_x = min(a[0], b[0])
+        min_y, max_y = min(a[1], b[1]), max(a[1], b[1])
+        active = [j for j in active if max(edges[j][0][0], edges[j][1][0]) >= min_x]
+        for j in active:
+            c, d = edges[j]
+            if max(c[1], d[1]) < min_y or min(c[1], d[1]) > max_y:
+                continue
+            on_i, on_j = _get_split_points(edges[i], edges[j])
+            points[i].extend(on_i)
+            points[j].extend(on_j)
+        active.append(i)
+
+    result = []
+    for (a, b), pts in zip(edges, points):
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        result.append(
+            sorted(set(pts), key=lambda p: (p[0] - a[0]) * dx + (p[1] - a[1]) * dy)
+        )
+    return result
+
+
+class _CrossingIndex:
+    """even-odd 내부 판정용 y 구간 버킷 (+x 방향 반직선과 교차하는 변 개수)"""
+
+    def __init__(self, edges: List[IntEdge]) -> None:
+        self.edges = edges
+        ys = [p[1] for edge in edges for p in edge]
+        self.min_y = min(ys) if ys else 0
+        span = (max(ys) - self.min_y) if ys else 1
+        # 버킷 하나에 반직선이 실제로 지나는 변 정도만 남도록 변 개수만큼 나눈다
+        self.size = max(span / max(len(edges), 1), 1.0)
+        self.buckets = {}  # type: Dict[int, List[IntEdge]]
+        for edge in edges:
+            lo = int((min(edge[0][1], edge[1][1]) - self.min_y) // self.size)
+            hi = int((max(edge[0][1], edge[1][1]) - self.min_y) // self.size)
+            for k in range(lo, hi + 1):
+                self.buckets.setdefault(k, []).append(edge)
+
+    def contains(self, x: float, y: float) -> bool:
+        inside = False
+        for (x1, y1), (x2, y2) in self.buckets.get(
+            int((y - self.min_y) // self.size), ()
+        ):
+            if (y1 > y) != (y2 > y):
+                if x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+        return inside
+
+
+def _probe_left(p: IntPoint, q: IntPoint) -> Tuple[float, float]:
+    """변 pq 중점에서 왼쪽으로 PROBE만큼 떨어진 점"""
+    dx, dy = q[0] - p[0], q[1] - p[1]
+    length = math.hypot(dx, dy)
+    return (
+        (p[0] + q[0]) / 2 - dy / length * PROBE,
+        (p[1] + q[1]) / 2 + dx / length * PROBE,
+    )
+
+
+# ================ 고리 구성 ================
+
+
+def _link_rings(edges: List[IntEdge]) -> List[List[IntPoint]]:
+    """방향 있는 변들을 이어 닫힌 고리로 (꼭짓점마다 가장 왼쪽으로 꺾는 변 선택)"""
+    outgoing = {}  # type: Dict[IntPoint, List[IntPoint]]
+    for p, q in edges:
+        outgoing.setdefault(p, []).append(q)
+
+    used = set()
+    rings = []
+    for start, first in edges:
+        if (start, first) in used:
+            continue
+        used.add((start, first))
+        ring = [start]
+        prev, cur = start, first
+        while cur != start:
+            ring.append(cur)
+            din = (cur[0] - prev[0], cur[1] - prev[1])
+            best, best_angle = None, -math.inf
+            for nxt in outgoing.get(cur, ()):
+                if (cur, nxt) in used:
+                    continue
+                dout = (nxt[0] - cur[0], nxt[1] - cur[1])
+                angle = math.atan2(
+                    din[0] * dout[1] - din[1] * dout[0],
+                    din[0] * dout[0] + din[1] * dout[1],
+                )
+                if angle > best_angle:
+                    best, best_angle = nxt, angle
+            if best is None:
+                ring = []
+                break
+            used.add((cur, best))
+            prev, cur = cur, best
+        if len(ring) >= 3:
+            rings.append(_remove_collinear(ring))
+    return [ring for ring in rings if len(ring) >= 3]
+
+
+def _remove_collinear(ring: List[IntPoint]) -> List[IntPoint]:
+    result = list(ring)
+    changed = True
+    while changed and len(result) >= 3:
+        changed = False
+        for i in range(len(result)):
+            if _orient(result[i - 1], result[i], result[(i + 1) % len(result)]) == 0:
+                del result[i]
+                changed = True
+                break
+    return result
+
+
+def _signed_area2(ring: List[IntPoint]) -> int:
+    n = len(ring)
+    return sum(
+        ring[i][0] * ring[(i + 1) % n][1] - ring[(i + 1) % n][0] * ring[i][1]
+        for i in range(n)
+    )
+
+
+def _build_polygons(rings: List[List[IntPoint]], scale: int) -> List[Polygon]:
+    """반시계 고리는 외곽, 시계 고리는 그 고리를 감싸는 가장 작은 외곽의 구멍"""
+    outers = []
+    holes = []
+    for ring in rings:
+        area2 = _signed_area2(ring)
+        if area2 > 0:
+            outers.append((area2, ring))
+        elif area2 < 0:
+            holes.append(ring)
+    outers.sort(key=lambda item: item[0])
+
+    assigned = [[] for _ in outers]  # type: List[List[List[IntPoint]]]
+    for hole in holes:
+        # 구멍 변의 왼쪽(결과 영역 안)에 있는 점을 감싸는 외곽
+        x, y = _probe_left(hole[0], hole[1])
+        for k, (_, outer) in enumerate(outers):
+            if planar.is_pt_inside_ring((x, y), outer):
+                assigned[k].append(hole)
+                break
+
+    def to_float(ring: List[IntPoint]) -> List[Point]:
+        return [(x / scale, y / scale) for x, y in ring]
+
+    return [
+        Polygon(to_float(outer), [to_float(hole) for hole in hole_list])
+        for (_, outer), hole_list in zip(outers, assigned)
+    ]
+
+
+# ================ 불리언 연산 ================
+
+
+def boolean(
+    subject: Shape, clip: Shape, operation: str, precision: int = PRECISION
+) -> List[Polygon]:
+    """두 영역의 불리언 연산
+
+    Args:
+        subject, clip: 고리 리스트 (even-odd 규칙, 방향 무관)
+        operation: UNION, INTERSECTION, DIFFERENCE(subject - clip), XOR
+        precision: 정수화 소수점 자리수
+
+    Returns:
+        결과 Polygon 리스트 (외곽 면적이 작은 순)
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(
+            "Unknown boolean operation: {} (choose from {})".format(
+                operation, ", ".join(sorted(OPERATIONS))
+            )
+        )
+    op = OPERATIONS[operation]
+    scale = 10**precision
+
+    # 1. 정수 좌표 변 (출처: 0 = subject, 1 = clip)
+    edges = []  # type: List[IntEdge]
+    sources = []  # type: List[int]
+    for source, shape in enumerate((subject, clip)):
+        for ring in _to_int_rings(shape, scale):
+            for i in range(len(ring)):
+                edges.append((ring[i], ring[(i + 1) % len(ring)]))
+                sources.append(source)
+    if not edges:
+        return []
+
+    # 2. 교차점에서 나누고 같은 변은 출처별 개수로 합친다
+    counts = {}  # type: Dict[IntEdge, List[int]]
+    for pts, source in zip(_split_edges(edges), sources):
+        for p, q in zip(pts, pts[1:]):
+            if p == q:
+                continue
+            key = (p, q) if p < q else (q, p)
+            counts.setdefault(key, [0, 0])[source] += 1
+
+    # 3. 출처별 경계(홀수 번 나온 변)로 내부 판정 인덱스를 만들고 결과 경계 변을 고른다
+    indexes = [
+        _CrossingIndex([edge for edge, count in counts.items() if count[s] % 2])
+        for s in (0, 1)
+    ]
+    kept = []  # type: List[IntEdge]
+    for (p, q), count in counts.items():
+        x, y = _probe_left(p, q)
+        left = [index.contains(x, y) for index in indexes]
+        right = [inside != bool(c % 2) for inside, c in zip(left, count)]
+        inside_left = op(*left)
+        if inside_left != op(*right):
+            kept.append((p, q) if inside_left else (q, p))
+
+    # 4. 고리 구성
+    return _build_polygons(_link_rings(kept), scale)
+
+
+def union(
+    subject: Shape, clip: Shape = (), precision: int = PRECISION
+) -> List[Polygon]:
+    return boolean(subject, clip, UNION, precision)
+
+
+def intersection(
+    subject: Shape, clip: Shape, precision: int = PRECISION
+) -> List[Polygon]:
+    return boolean(subject, clip, INTERSECTION, precision)
+
+
+def difference(
+    subject: Shape, clip: Shape, precision: int = PRECISION
+) -> List[Polygon]:
+    return boolean(subject, clip, DIFFERENCE, precision)
+
+
+def xor(subject: Shape, clip: Shape, precision: int = PRECISION) -> List[Polygon]:
+    return boolean(subject, clip, XOR, precision)
+
+
+def union_all(shapes: Sequence[Shape], precision: int = PRECISION) -> List[Polygon]:
+    """여러 영역의 합집합 (두 개씩 합치는 분할 정복)"""
+    if not shapes:
+        return []
+    layer = [list(shape) for shape in shapes]
+    while len(layer) > 1:
+        merged = [
+            to_rings(union(layer[i], layer[i + 1], precision))
+            for i in range(0, len(layer) - 1, 2)
+        ]
+        if len(layer) % 2:
+            merged.append(layer[-1])
+        layer = merged
+    return union(layer[0], (), precision)
+
+
+def _boolean_job(args) -> List[Polygon]:
+    return boolean(*args)
+
+
+def boolean_batch(
+    pairs: Sequence[Tuple[Shape, Shape]],
+    operation: str,
+    workers: int = 1,
+    precision: int = PRECISION,
+    chunk_size: Optional[int] = None,
+) -> List[List[Polygon]]:
+    """여러 (subject, clip) 쌍의 불리언 연산 (workers > 1이면 프로세스 풀)"""
+    jobs = [(subject, clip, operation, precision) for subject, clip in pairs]
+    if workers > 1 and len(jobs) > 1:
+        chunk_size = chunk_size or max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_boolean_job, jobs, chunksize=chunk_size))
+    return [_boolean_job(job) for job in jobs]
+
+
+# ================ offset ================
+
+
+def get_segment_buffer(
+    a: Point, b: Point, distance: float, arc_segments: int = 8
+) -> List[Point]:
+    """선분에서 distance 이내 영역을 감싸는 볼록 다각형 (반시계 방향)
+
+    양 끝 반원을 각각 arc_segments * 2 개의 변으로 원에 외접시켜 근사한다.
+    꼭짓점은 원 밖으로 나가지만 변은 원에 접하므로 옆면은 선분에서 정확히 distance 거리다.
+    """
+    count = arc_segments * 2
+    step = math.pi / count
+    radius = distance / math.cos(step / 2)
+    heading = math.atan2(b[1] - a[1], b[0] - a[0])
+    pts = []
+    # b 쪽 반원은 오른쪽 법선에서 왼쪽 법선까지, a 쪽은 그 반대
+    for c, start in ((b, heading - math.pi / 2), (a, heading + math.pi / 2)):
+        for k in range(count):
+            angle = start + (k + 0.5) * step
+            pts.append(
+                (c[0] + radius * math.cos(angle), c[1] + radius * math.sin(angle))
+            )
+    return pts
+
+
+def offset(
+    shape: Shape, distance: float, arc_segments: int = 8, precision: int = PRECISION
+) -> List[Polygon]:
+    """영역을 distance만큼 offset (양수: 바깥쪽, 음수: 안쪽, 모서리는 둥글게)
+
+    경계의 모든 변을 distance 폭으로 감싼 영역을 합친 뒤 더하거나 뺀다.
+    miter offset과 달리 영역이 갈라지거나 사라지는 경우도 그대로 처리한다.
+    """
+    if not distance:
+        return union(shape, (), precision)
+    buffers = [
+        get_segment_buffer(a, b, abs(distance), arc_segments)
+        for ring in shape
+        for a, b in planar.get_segments(ring)
+    ]
+    band = to_rings(union_all([[buffer] for buffer in buffers], precision))
+    if distance > 0:
+        return union(shape, band, precision)
+    return difference(shape, band, precision)
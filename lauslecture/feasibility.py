@@ -0,0 +1,241 @@
+"""대지 하나의 주차 + 공개공지 통합 검토 파이프라인
+
+Lecture4 주차와 Lecture5 공개공지는 같은 대지 경계의 offset, 배치 축, 접도 변을
+시나리오마다 다시 계산한다. SitePipeline은 대지를 한 번 읽고 파생 기하(SiteGeometry)를
+처음 요청될 때 한 번만 계산해 여러 시나리오와 단계가 함께 쓰며, 단계별 소요 시간을 기록한다.
+
+    pipeline = SitePipeline("A-1", lot, roads, buildings, "상업지역")
+    result = pipeline.run("업무시설", 10)
+    print(result.stall_count, result.openspace_area)
+    print(pipeline.timer.summary())
+
+단계 순서는 공개공지 -> 주차이며, 주차칸은 공개공지와 건물에 겹치지 않는 것만 남긴다.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lauslecture import backends, planar, primitives, timing
+from lauslecture.openspace import layout
+from lauslecture.parking import batch, rules, stalls
+from lauslecture.planar import Point, Ring
+
+TOL = 0.01
+
+
+class SiteGeometry:
+    """대지 경계에서 파생되는 공유 기하 (처음 요청할 때 한 번만 계산)"""
+
+    def __init__(
+        self,
+        lot: Ring,
+        roads: Sequence[layout.Road],
+        backend: Optional[backends.GeometryBackend] = None,
+        tol: float = TOL,
+    ) -> None:
+        self.points = [(float(x), float(y)) for x, y in lot]
+        self.ring = stalls.as_ring(self.points)
+        self.roads = [(list(points), closed) for points, closed in roads]
+        self.backend = backend or backends.get_backend()
+        self.tol = tol
+        self._axis = None  # type: Optional[Tuple[np.ndarray, np.ndarray]]
+        self._frontage = None  # type: Optional[layout.Frontage]
+        self._offsets = {}  # type: Dict[float, List[np.ndarray]]
+
+    @property
+    def axis(self) -> Tuple[np.ndarray, np.ndarray]:
+        """내부 주차칸 배치 축 (원점, 단위 방향)"""
+        if self._axis is None:
+            self._axis = batch.get_axis(self.ring)
+        return self._axis
+
+    @property
+    def frontage(self) -> layout.Frontage:
+        """도로 접도 선분들과 도로별 접도 길이 (layout.get_frontage_edges)"""
+        if self._frontage is None:
+            self._frontage = layout.get_frontage_edges(
+                self.points, self.roads, self.tol
+            )
+        return self._frontage
+
+    def get_inward_offsets(self, dist: float) -> List[np.ndarray]:
+        """dist만큼 안쪽으로 offset 한 영역들 (거리별로 한 번만 계산)"""
+        dist = round(float(dist), 6)
+        if dist not in self._offsets:
+            self._offsets[dist] = batch.offset_inward(self.ring, dist, self.backend)
+        return self._offsets[dist]
+
+
+class FeasibilityResult:
+    """시나리오 하나의 검토 결과"""
+
+    def __init__(
+        self,
+        site_id: str,
+        required_area: float,
+        openspace: Optional[List[Point]],
+        corners: np.ndarray,
+        seconds: Dict[str, float],
+    ) -> None:
+        self.site_id = site_id
+        self.required_area = required_area
+        self.openspace = openspace
+        self.stalls = corners
+        self.seconds = seconds
+
+    @property
+    def openspace_area(self) -> float:
+        return planar.get_area(self.openspace) if self.openspace else 0.0
+
+    @property
+    def stall_count(self) -> int:
+        return len(self.stalls)
+
+    def to_row(self) -> dict:
+        row = {
+            "id": self.site_id,
+            "required": round(self.required_area, 2),
+            "openspace": round(self.openspace_area, 2),
+            "stalls": self.stall_count,
+        }
+        # 단계별 시간은 "<단계>_s" 열로 추가
+        row.update(
+            {name + "_s": round(value, 4) for name, value in self.seconds.items()}
+        )
+        return row
+
+
+def get_clear_stall_mask(
+    corners: np.ndarray, obstacles: Sequence[Ring], tol: float = TOL
+) -> np.ndarray:
+    """장애물(공개공지, 건물)과 겹치지 않는 주차칸 마스크 (N,)
+
+    주차칸을 중심 쪽으로 tol만큼 줄여서 검사하므로 변이 맞닿기만 한 주차칸은 남는다.
+    """
+    keep = np.ones(len(corners), dtype=bool)
+    if not len(corners) or not obstacles:
+        return keep
+
+    centers = corners.mean(axis=1, keepdims=True)
+    offsets = corners - centers
+    norms = np.linalg.norm(offsets, axis=-1, keepdims=True)
+    shrunk = centers + offsets * np.maximum(norms - tol, 0) / np.where(
+        norms == 0, 1, norms
+    )
+    mins = shrunk.min(axis=1)
+    maxs = shrunk.max(axis=1)
+
+    for obstacle in obstacles:
+        x0, y0, x1, y1 = planar.get_bbox(obstacle)
+        near = np.flatnonzero(
+            keep
+            & (mins[:, 0] <= x1)
+            & (maxs[:, 0] >= x0)
+            & (mins[:, 1] <= y1)
+            & (maxs[:, 1] >= y0)
+        )
+        # 후보 주차칸만 한 번에 Ring으로 바꿔 주차칸마다 tolist를 부르지 않는다
+        for i, quad in zip(near, primitives.rings_from_array(shrunk[near])):
+            if planar.rings_intersect(quad.points, obstacle, 0.0):
+                keep[i] = False
+    return keep
+
+
+class SitePipeline:
+    """대지 하나에 대해 공개공지, 주차 단계를 공유 기하로 실행
+
+    Args:
+        site_id: 대지 id
+        lot: 대지 외곽 꼭짓점
+        roads: (꼭짓점, 닫힘 여부) 도로 리스트
+        buildings: 건물 바닥 영역들
+        district_use: 용도지역
+        entrance: 주차 진입점 (None이면 가장 긴 변의 중점)
+        parking_rules: 주차장 설계 규칙 (기본: 일반형 직각 주차)
+        timer: 단계 시간을 기록할 타이머 (기본: 파이프라인 전용 타이머)
+    """
+
+    def __init__(
+        self,
+        site_id: str,
+        lot: Ring,
+        roads: Sequence[layout.Road],
+        buildings: Sequence[Ring] = (),
+        district_use: str = "",
+        entrance: Optional[Point] = None,
+        parking_rules: Optional[rules.ParkingRules] = None,
+        backend: Optional[backends.GeometryBackend] = None,
+        timer: Optional[timing.StageTimer] = None,
+    ) -> None:
+        self.timer = timer or timing.StageTimer()
+        with self.timer.stage("load"):
+            self.geometry = SiteGeometry(lot, roads, backend)
+            self.site = layout.Site(
+                site_id,
+                self.geometry.points,
+                self.geometry.roads,
+                buildings,
+                district_use=district_use,
+            )
+        self.entrance = entrance
+        self.parking_rules = parking_rules or rules.ParkingRules()
+
+    def run_openspace(
+        self, building_use: str, floor_count: int
+    ) -> Tuple[float, Optional[List[Point]]]:
+        """공개공지 필요 면적과 영역 (설치 대상이 아니면 기하 연산 없이 (0, None))"""
+        required = self.site.get_required_area(building_use, floor_count)
+        if required <= 0:
+            return required, None
+        with self.timer.stage("frontage"):
+            frontage = self.geometry.frontage
+        with self.timer.stage("openspace"):
+            region = layout.layout_openspace(
+                self.site, required, self.geometry.tol, frontage=frontage
+            )
+        return required, region
+
+    def run_parking(self, obstacles: Sequence[Ring] = ()) -> np.ndarray:
+        """외부 + 내부 주차칸 (N, 4, 2), obstacles와 겹치는 주차칸 제외"""
+        geometry = self.geometry
+        depth = self.parking_rules.row_depth
+        with self.timer.stage("offsets"):
+            outside_rings = geometry.get_inward_offsets(depth)
+            inside_rings = geometry.get_inward_offsets(
+                depth + self.parking_rules.aisle_width
+            )
+        with self.timer.stage("axis"):
+            origin, x_axis = geometry.axis
+        with self.timer.stage("parking"):
+            entrance = (
+                batch.get_default_entrance(geometry.ring)
+                if self.entrance is None
+                else np.asarray(self.entrance, dtype=float)
+            )
+            outside, inside = batch.layout_stalls(
+                geometry.ring,
+                entrance,
+                outside_rings,
+                inside_rings,
+                origin,
+                x_axis,
+                self.parking_rules,
+            )
+            corners = np.concatenate([outside, inside])
+        with self.timer.stage("parking_clearance"):
+            corners = corners[get_clear_stall_mask(corners, obstacles)]
+        return corners
+
+    def run(self, building_use: str, floor_count: int) -> FeasibilityResult:
+        """공개공지 -> 주차 순서로 실행하고 이번 실행의 단계별 시간을 함께 반환"""
+        event_start = len(self.timer.events)
+        required, openspace = self.run_openspace(building_use, floor_count)
+        obstacles = self.site.buildings + ([openspace] if openspace else [])
+        corners = self.run_parking(obstacles)
+
+        seconds = {}  # type: Dict[str, float]
+        for event in self.timer.events[event_start:]:
+            seconds[event["name"]] = seconds.get(event["name"], 0.0) + event["duration"]
+        return FeasibilityResult(
+            self.site.site_id, required, openspace, corners, seconds
+        )
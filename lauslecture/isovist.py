@@ -0,0 +1,128 @@
+"""Isovist(가시 영역) 계산의 Rhino 비의존 구현"""
+import heapq
+import math
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from lauslecture import backends, planar
+from lauslecture.planar import Point
+from lauslecture.spatial import GridIndex
+
+Segment = Tuple[Point, Point]
+
+
+def get_wedge_error(dist_a: float, dist_b: float, angle_step: float) -> float:
+    """인접한 두 시야선 사이 부채꼴 면적의 오차 추정치"""
+    # 두 거리로 만든 부채꼴 면적 차이의 절반을 오차 상한으로 사용
+    return 0.25 * abs(dist_a * dist_a - dist_b * dist_b) * angle_step
+
+
+def refine_isovist_rays(
+    cast_ray: Callable[[float], float],
+    initial_count: int = 16,
+    dist_threshold: float = 1.0,
+    area_tol: float = 0.5,
+    max_count: int = 360,
+) -> List[Tuple[float, float]]:
+    """시야선을 적응적으로 세분화하여 (각도, 거리) 리스트를 반환
+
+    1. initial_count개의 균등한 시야선으로 시작
+    2. 인접 시야선의 거리 차이가 dist_threshold보다 큰 구간만 이등분
+    3. 구간의 면적 오차가 area_tol 이하가 되거나 max_count에 도달하면 종료
+    """
+    angle_step = 2 * math.pi / initial_count
+    rays = [(i * angle_step, cast_ray(i * angle_step)) for i in range(initial_count)]
+
+    # 오차가 큰 구간부터 세분화하도록 힙 사용 (마지막 구간은 2pi에서 닫힘)
+    intervals = []
+    for i, (angle_a, dist_a) in enumerate(rays):
+        dist_b = rays[(i + 1) % initial_count][1]
+        error = get_wedge_error(dist_a, dist_b, angle_step)
+        heapq.heappush(
+            intervals, (-error, angle_a, dist_a, angle_a + angle_step, dist_b)
+        )
+
+    while intervals and len(rays) < max_count:
+        neg_error, angle_a, dist_a, angle_b, dist_b = heapq.heappop(intervals)
+        if -neg_error <= area_tol:
+            break
+        if abs(dist_a - dist_b) <= dist_threshold:
+            continue
+
+        angle_mid = (angle_a + angle_b) / 2
+        dist_mid = cast_ray(angle_mid)
+        rays.append((angle_mid, dist_mid))
+
+        half_step = (angle_b - angle_a) / 2
+        for interval in (
+            (angle_a, dist_a, angle_mid, dist_mid),
+            (angle_mid, dist_mid, angle_b, dist_b),
+        ):
+            error = get_wedge_error(interval[1], interval[3], half_step)
+            heapq.heappush(intervals, (-error,) + interval)
+
+    return sorted(rays)
+
+
+def get_isovist_area(rays: List[Tuple[float, float]]) -> float:
+    """(각도, 거리) 리스트로 만든 isovist 다각형의 면적"""
+    area = 0.0
+    for i, (angle_a, dist_a) in enumerate(rays):
+        angle_b, dist_b = rays[(i + 1) % len(rays)]
+        area += 0.5 * dist_a * dist_b * math.sin((angle_b - angle_a) % (2 * math.pi))
+    return area
+
+
+def cast_ray(
+    origin: Point, angle: float, segments: Sequence[Segment], radius: float
+) -> float:
+    """origin에서 angle 방향으로 쏜 시야선이 처음 닿는 선분까지의 거리"""
+    direction = (math.cos(angle), math.sin(angle))
+    dist = radius
+    for seg_a, seg_b in segments:
+        t = planar.get_line_x_ray(origin, direction, seg_a, seg_b)
+        if t is not None and t < dist:
+            dist = t
+    return dist
+
+
+def create_obstacle_index(
+    obstacles: Sequence[Any],
+    cell_size: float = 50.0,
+    backend: Optional[backends.GeometryBackend] = None,
+) -> Tuple[List[Segment], GridIndex]:
+    """장애물(건물 외곽선 커브) 선분 리스트와 선분 격자 인덱스 생성"""
+    backend = backend or backends.get_backend()
+    segments = [
+        seg
+        for curve in obstacles
+        for seg in planar.get_segments(backend.vertices(curve))
+    ]
+    index = GridIndex.from_bboxes((planar.get_bbox(seg) for seg in segments), cell_size)
+    return segments, index
+
+
+def get_isovist(
+    origin: Point,
+    segments: Sequence[Segment],
+    index: GridIndex,
+    radius: float = 50.0,
+    ray_count: Optional[int] = None,
+    initial_count: int = 16,
+    dist_threshold: float = 1.0,
+    area_tol: float = 0.5,
+    max_count: int = 360,
+) -> List[Tuple[float, float]]:
+    """origin의 isovist를 (각도, 거리) 리스트로 반환
+
+    ray_count를 주면 고정 개수의 균등 시야선, 아니면 적응형 세분화를 사용한다.
+    """
+    nearby_ids = index.query(planar.inflate_bbox(origin + origin, radius))
+    nearby_segments = [segments[i] for i in nearby_ids]
+
+    def cast(angle: float) -> float:
+        return cast_ray(origin, angle, nearby_segments, radius)
+
+    if ray_count:
+        step = 2 * math.pi / ray_count
+        return [(i * step, cast(i * step)) for i in range(ray_count)]
+    return refine_isovist_rays(cast, initial_count, dist_threshold, area_tol, max_count)
@@ -0,0 +1,104 @@
+"""Lecture4/5 utils가 함께 쓰는 offset 일괄 처리 도구 (백엔드와 무관한 부분)
+
+Rhino 커브를 다루고 Clipper를 호출하는 부분은 backends.rhino와 각 Lecture utils에 두고,
+여기에는 캐시 키, 출력 트리 묶기, 메모, 거리별 안쪽 offset 재사용만 둔다.
+
+- get_points_key: 꼭짓점 좌표로 만든 캐시 키
+- group_tree_by_input: ghcomp 트리 출력을 입력 가지 번호별 리스트로 모은다
+- memoize_batch: 메모에 없는 키만 한 번에 계산하고 복사본을 돌려준다 (LRU)
+- InwardOffsetFamily: 같은 영역 묶음을 여러 거리로 안쪽 offset 한 결과 모음
+"""
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Sequence
+
+from lauslecture import runtime
+
+
+def get_points_key(points: Iterable[Sequence[float]], precision: int = 6) -> tuple:
+    """꼭짓점 좌표로 만든 캐시 키 (같은 형상이면 같은 키)"""
+    return tuple(tuple(round(v, precision) for v in pt) for pt in points)
+
+
+def group_tree_by_input(data: Any, count: int) -> List[List[Any]]:
+    """ghcomp 트리 출력을 입력 가지 번호(경로의 첫 인덱스)별 리스트로 모은다"""
+    groups = [[] for _ in range(count)]  # type: List[List[Any]]
+    if not hasattr(data, "Paths"):
+        # 반복 없이 한 번만 실행되어 리스트(또는 단일 값)가 나온 경우
+        items = data if isinstance(data, list) else [data]
+        groups[0].extend(item for item in items if item is not None)
+        return groups
+
+    for path, branch in zip(data.Paths, data.Branches):
+        groups[path.Indices[0]].extend(item for item in branch if item is not None)
+    return groups
+
+
+def memoize_batch(
+    namespace: str,
+    keys: Sequence[Hashable],
+    compute: Callable[[List[int]], Sequence[Any]],
+    copy: Callable[[Any], Any],
+    max_entries: int,
+) -> List[Any]:
+    """keys 순서대로 값의 복사본 (메모에 없는 키의 번호들만 compute로 한 번에 계산)
+
+    이번 호출에서 쓴 키를 뒤로 보내고 복사본을 만든 뒤에 오래된 것부터 제거하므로
+    같은 호출이 읽을 값이 먼저 지워지지 않는다.
+    """
+    memo = runtime.get_state(namespace)
+    missing = [i for i, key in enumerate(keys) if key not in memo]
+    if missing:
+        for i, value in zip(missing, compute(missing)):
+            memo[keys[i]] = value
+
+    for key in keys:
+        memo[key] = memo.pop(key)
+    values = [copy(memo[key]) for key in keys]
+    runtime.trim_state(namespace, max_entries)
+    return values
+
+
+class InwardOffsetFamily:
+    """같은 영역 묶음을 여러 거리로 안쪽 offset 한 결과 모음
+
+    miter offset은 거리가 더해지므로 d2 > d1이면 d2 결과를 d1 결과에서
+    (d2 - d1)만큼 다시 offset 해서 구한다. 이미 줄어든 커브를 offset 하므로
+    처음부터 offset 하는 것보다 가볍다. 거리별 결과는 solve가 반복되어도 유지된다.
+
+    offset과 copy는 백엔드 쪽에서 구현한다.
+    """
+
+    CACHE_NAMESPACE = "lauslecture.offset_family"
+    CACHE_SIZE = 32  # 영역 묶음 개수 기준
+
+    def __init__(self, regions: Sequence[Any], key: Hashable) -> None:
+        self.regions = list(regions)
+        self.key = key
+
+    def offset(self, curves: List[Any], dist: float) -> List[Any]:
+        """curves를 dist만큼 안쪽으로 offset"""
+        raise NotImplementedError
+
+    def copy(self, curve: Any) -> Any:
+        raise NotImplementedError
+
+    def _get_offsets(self) -> Dict[float, List[Any]]:
+        state = runtime.get_state(self.CACHE_NAMESPACE)
+        if self.key in state:
+            # 최근 사용한 묶음을 뒤로 보낸다
+            state[self.key] = state.pop(self.key)
+        else:
+            state[self.key] = {}
+            runtime.trim_state(self.CACHE_NAMESPACE, self.CACHE_SIZE)
+        return state[self.key]
+
+    def get(self, dists: List[float]) -> Dict[float, List[Any]]:
+        """거리별 안쪽 offset 커브 (복사본)"""
+        offsets = self._get_offsets()
+        for dist in sorted(set(dists)):
+            if dist in offsets:
+                continue
+            # 계산해 둔 거리 중 dist보다 작은 가장 큰 거리에서 이어서 offset
+            base_dist = max((d for d in offsets if d < dist), default=0.0)
+            base = offsets[base_dist] if base_dist else self.regions
+            offsets[dist] = self.offset(base, dist - base_dist) if base else []
+        return {dist: [self.copy(crv) for crv in offsets[dist]] for dist in dists}
@@ -0,0 +1,4 @@
+"""Lecture5 공개공지 자동화의 Rhino 비의존 엔진
+
+영역은 (x, y) 튜플 리스트(닫는 점 제외)로, 도로는 (꼭짓점 리스트, 닫힘 여부)로 다룬다.
+"""
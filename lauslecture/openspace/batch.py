@@ -0,0 +1,252 @@
+"""여러 (대지, 건물 용도, 층수) 시나리오의 공개공지 일괄 평가
+
+시나리오마다 필요 면적을 먼저 계산하고, 설치 대상이 아닌(필요 면적 0) 시나리오는
+기하 연산 없이 바로 결과를 채운다. 나머지는 (대지, 필요 면적)이 같은 것끼리 묶어
+한 번만 배치를 계산하며, 프로세스 풀에서 실행한다.
+
+사용 예:
+    python -m lauslecture.openspace.batch scenarios.json --workers 4 --csv openspace.csv
+    python -m lauslecture.openspace.batch sites.json --uses 업무시설 판매시설 --floors 3 5 10
+
+JSON 입력 형식 (scenarios를 생략하면 --uses x --floors 조합을 모든 대지에 적용):
+    {
+        "sites": [{"id": "A-1", "lot": [[x, y], ...], "district_use": "상업지역",
+                   "roads": [[[x, y], ...], ...], "buildings": [[[x, y], ...]],
+                   "parking": [[x, y], ...]}, ...],
+        "scenarios": [{"id": "s1", "site": "A-1", "use": "업무시설", "floor_count": 5}, ...]
+    }
+도로는 첫 점과 끝 점이 같으면 닫힌 영역, 다르면 중심선(열린 폴리라인)으로 본다.
+중심선은 평행하게 마주보는 대지 변이 layout.CENTERLINE_MAX_DIST 이내일 때 접도로 본다.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from lauslecture import planar
+from lauslecture.openspace import layout
+from lauslecture.planar import Point
+
+Scenario = Tuple[str, str, str, int]  # (시나리오 id, 대지 id, 건물 용도, 층수)
+
+
+class BatchResult:
+    """시나리오별 필요 면적과 확보 면적"""
+
+    def __init__(
+        self,
+        scenarios: List[Scenario],
+        required_areas: List[float],
+        achieved_areas: List[float],
+        regions: List[Optional[List[Point]]],
+    ) -> None:
+        self.scenarios = scenarios
+        self.required_areas = required_areas
+        self.achieved_areas = achieved_areas
+        self.regions = regions
+
+    def __len__(self) -> int:
+        return len(self.scenarios)
+
+    @property
+    def satisfied(self) -> List[bool]:
+        return [
+            achieved >= required - layout.AREA_TOL
+            for required, achieved in zip(self.required_areas, self.achieved_areas)
+        ]
+
+    def to_rows(self) -> List[dict]:
+        return [
+            {
+                "id": scenario_id,
+                "site": site_id,
+                "use": use,
+                "floor_count": floor_count,
+                "required": round(self.required_areas[i], 2),
+                "achieved": round(self.achieved_areas[i], 2),
+                "satisfied": self.satisfied[i],
+            }
+            for i, (scenario_id, site_id, use, floor_count) in enumerate(self.scenarios)
+        ]
+
+    def write_csv(self, path: str) -> None:
+        rows = self.to_rows()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(
+                f,
+                [
+                    "id",
+                    "site",
+                    "use",
+                    "floor_count",
+                    "required",
+                    "achieved",
+                    "satisfied",
+                ],
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def _layout_job(args) -> Optional[List[Point]]:
+    site, required_area = args
+    return layout.layout_openspace(site, required_area)
+
+
+def create_scenarios(
+    site_ids: Sequence[str], uses: Sequence[str], floor_counts: Sequence[int]
+) -> List[Scenario]:
+    """모든 대지에 용도 x 층수 조합을 적용한 시나리오"""
+    return [
+        ("{}/{}/{}".format(site_id, use, floor_count), site_id, use, floor_count)
+        for site_id, use, floor_count in itertools.product(site_ids, uses, floor_counts)
+    ]
+
+
+def evaluate_scenarios(
+    sites: Sequence[layout.Site],
+    scenarios: Sequence[Scenario],
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+) -> BatchResult:
+    """시나리오별 공개공지 필요 면적과 확보 면적을 계산
+
+    Args:
+        sites: 대지 리스트 (시나리오는 site_id로 참조)
+        scenarios: (시나리오 id, 대지 id, 건물 용도, 층수) 리스트
+        workers: 프로세스 수 (1이면 순차 실행)
+        chunk_size: 프로세스에 한 번에 넘길 작업 수 (기본: 작업 수당 4묶음)
+
+    Returns:
+        BatchResult
+    """
+    site_map = {site.site_id: site for site in sites}
+    required_areas = [
+        site_map[site_id].get_required_area(use, floor_count)
+        for _, site_id, use, floor_count in scenarios
+    ]
+
+    # 1. 필요 면적이 0인 시나리오는 건너뛰고, 같은 (대지, 필요 면적)은 한 번만 계산
+    keys = {}  # type: Dict[Tuple[str, float], None]
+    for (_, site_id, _, _), required in zip(scenarios, required_areas):
+        if required > 0:
+            keys[(site_id, required)] = None
+    jobs = [(site_map[site_id], required) for site_id, required in keys]
+
+    # 2. 배치 계산
+    if workers > 1 and len(jobs) > 1:
+        chunk_size = chunk_size or max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_layout_job, jobs, chunksize=chunk_size))
+    else:
+        results = [_layout_job(job) for job in jobs]
+    regions_by_key = dict(zip(keys, results))
+
+    regions = [
+        regions_by_key.get((site_id, required)) if required > 0 else None
+        for (_, site_id, _, _), required in zip(scenarios, required_areas)
+    ]
+    achieved_areas = [planar.get_area(region) if region else 0.0 for region in regions]
+    return BatchResult(list(scenarios), required_areas, achieved_areas, regions)
+
+
+# ================ 입력 ================
+
+
+def _as_ring(points: Sequence[Sequence[float]]) -> List[Point]:
+    ring = [(float(pt[0]), float(pt[1])) for pt in points]
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        ring = ring[:-1]
+    return ring
+
+
+def _as_road(points: Sequence[Sequence[float]]) -> layout.Road:
+    pts = [(float(pt[0]), float(pt[1])) for pt in points]
+    closed = len(pts) > 2 and pts[0] == pts[-1]
+    return (pts[:-1] if closed else pts, closed)
+
+
+def load_json(path: str) -> Tuple[List[layout.Site], List[Scenario]]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        data = {"sites": data}
+
+    sites = []
+    for i, item in enumerate(data["sites"]):
+        parking = item.get("parking")
+        sites.append(
+            layout.Site(
+                str(item.get("id", i)),
+                _as_ring(item["lot"]),
+                [_as_road(road) for road in item.get("roads", [])],
+                [_as_ring(ring) for ring in item.get("buildings", [])],
+                _as_ring(parking) if parking else None,
+                item.get("district_use", ""),
+            )
+        )
+
+    scenarios = [
+        (
+            str(item.get("id", i)),
+            str(item["site"]),
+            item["use"],
+            int(item["floor_count"]),
+        )
+        for i, item in enumerate(data.get("scenarios", []))
+    ]
+    return sites, scenarios
+
+
+# ================ CLI ================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="대지/시나리오 JSON")
+    parser.add_argument("--uses", nargs="+", help="scenarios가 없을 때 적용할 건물 용도")
+    parser.add_argument("--floors", nargs="+", type=int, help="scenarios가 없을 때 적용할 층수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--csv", help="시나리오별 결과 CSV 저장 경로")
+    args = parser.parse_args(argv)
+
+    sites, scenarios = load_json(args.path)
+    if not scenarios:
+        if not args.uses or not args.floors:
+            parser.error("scenarios가 없으면 --uses와 --floors가 필요합니다")
+        scenarios = create_scenarios(
+            [site.site_id for site in sites], args.uses, args.floors
+        )
+
+    start = time.perf_counter()
+    result = evaluate_scenarios(sites, scenarios, workers=args.workers)
+    print(
+        "{} scenarios, {} required, {} satisfied ({:.2f}s, {} workers)".format(
+            len(result),
+            sum(1 for area in result.required_areas if area > 0),
+            sum(
+                1
+                for area, ok in zip(result.required_areas, result.satisfied)
+                if area > 0 and ok
+            ),
+            time.perf_counter() - start,
+            args.workers,
+        )
+    )
+
+    if args.csv:
+        result.write_csv(args.csv)
+    else:
+        print("{:<30s} {:>10s} {:>10s}".format("id", "required", "achieved"))
+        for row in result.to_rows():
+            print("{id:<30s} {required:>10.2f} {achieved:>10.2f}".format(**row))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
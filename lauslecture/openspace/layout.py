@@ -0,0 +1,210 @@
+"""대지 하나의 공개공지 배치 (Rhino 없이 계산하는 추정치)
+
+Lecture5의 offset 기반 후보 생성 대신, 대지의 도로 접도 변마다 그 변 폭의 띠를
+대지에서 잘라낸 뒤 변과 평행하게 깊이를 조절해 필요 면적에 맞춘다.
+건물/주차장과 겹치거나 접도 조건을 만족하지 못하는 후보는 버리고,
+접도 변이 긴 순서로 처음 만족하는 후보를 사용한다.
+"""
+import math
+from typing import List, Optional, Sequence, Tuple
+
+from lauslecture import overlap, planar
+from lauslecture.openspace import requirement
+from lauslecture.planar import Point, Ring
+
+TOL = 0.001
+AREA_TOL = 0.1
+# 도로 중심선(열린 폴리라인)과 마주보는 대지 변으로 볼 최대 거리 (폭 40m 도로의 절반)와 각도
+CENTERLINE_MAX_DIST = 20.0
+CENTERLINE_ANGLE_TOL = math.radians(5.0)
+
+Road = Tuple[List[Point], bool]  # (꼭짓점, 닫힘 여부)
+
+
+class Site:
+    """대지와 주변 도로, 건물 바닥, 주차장 영역"""
+
+    def __init__(
+        self,
+        site_id: str,
+        lot: Ring,
+        roads: Sequence[Road],
+        buildings: Sequence[Ring] = (),
+        parking: Optional[Ring] = None,
+        district_use: str = "",
+    ) -> None:
+        self.site_id = site_id
+        self.lot = [(float(x), float(y)) for x, y in lot]
+        self.roads = [(list(points), closed) for points, closed in roads]
+        self.buildings = [list(ring) for ring in buildings]
+        self.parking = list(parking) if parking else None
+        self.district_use = district_use
+        self.area = planar.get_area(self.lot)
+        self.floor_area = sum(planar.get_area(ring) for ring in self.buildings)
+
+    @property
+    def obstacles(self) -> List[Ring]:
+        return self.buildings + ([self.parking] if self.parking else [])
+
+    def get_required_area(self, building_use: str, floor_count: int) -> float:
+        return requirement.get_required_area(
+            self.area, self.district_use, building_use, self.floor_area * floor_count
+        )
+
+
+Frontage = Tuple[List[Tuple[float, int, Point, Point]], List[float]]
+
+
+def get_centerline_frontage(
+    lot: Ring,
+    centerline: Sequence[Point],
+    max_dist: float = CENTERLINE_MAX_DIST,
+    tol: float = TOL,
+) -> List[Tuple[Point, Point]]:
+    """도로 중심선과 마주보는 대지 경계 구간들
+
+    중심선 선분과 평행(CENTERLINE_ANGLE_TOL 이내)하고, 바깥쪽 법선 방향으로
+    max_dist 이내에 중심선이 있는 대지 변의 구간을 중심선 선분에 투영해 구한다.
+    대지 안쪽을 가로질러야 닿는 반대편 변은 바깥쪽 법선이 중심선을 향하지 않으므로 제외된다.
+    """
+    sign = 1.0 if planar.get_signed_area(lot) > 0 else -1.0
+    max_sin = math.sin(CENTERLINE_ANGLE_TOL)
+    road_segments = planar.get_segments(centerline, closed=False)
+    pieces = []
+    for a, b in planar.get_segments(lot):
+        length = math.dist(a, b)
+        if length <= tol:
+            continue
+        ux, uy = (b[0] - a[0]) / length, (b[1] - a[1]) / length
+        nx, ny = sign * uy, -sign * ux  # 바깥쪽 법선
+
+        intervals = []
+        for c, d in road_segments:
+            road_length = math.dist(c, d)
+            if road_length <= tol:
+                continue
+            vx, vy = (d[0] - c[0]) / road_length, (d[1] - c[1]) / road_length
+            if abs(ux * vy - uy * vx) > max_sin:
+                continue
+            # 중심선 선분을 변 위로 투영한 구간
+            tc = (c[0] - a[0]) * ux + (c[1] - a[1]) * uy
+            td = (d[0] - a[0]) * ux + (d[1] - a[1]) * uy
+            start, end = max(min(tc, td), 0.0), min(max(tc, td), length)
+            if end - start <= tol:
+                continue
+            # 구간 중점에서 바깥쪽 법선 방향으로 잰 중심선까지의 거리
+            mid = (start + end) / 2
+            px, py = a[0] + ux * mid, a[1] + uy * mid
+            denom = nx * vy - ny * vx
+            if abs(denom) <= 1e-12:
+                continue
+            dist = ((c[0] - px) * vy - (c[1] - py) * vx) / denom
+            if tol < dist <= max_dist:
+                intervals.append((start, end))
+
+        for start, end in overlap.merge_intervals(intervals, tol):
+            pieces.append(
+                (
+                    (a[0] + ux * start, a[1] + uy * start),
+                    (a[0] + ux * end, a[1] + uy * end),
+                )
+            )
+    return pieces
+
+
+def get_frontage_edges(lot: Ring, roads: Sequence[Road], tol: float = TOL) -> Frontage:
+    """대지의 도로 접도 선분들 (길이, 도로 번호, 시작점, 끝점)과 도로별 접도 길이
+
+    닫힌 도로 영역은 대지 경계와 겹치는 변을, 열린 폴리라인(도로 중심선)은
+    get_centerline_frontage로 중심선과 마주보는 대지 경계 구간을 접도 선분으로 본다.
+    접도 선분은 긴 순서로 정렬한다.
+    """
+    edges = []
+    frontages = []
+    for i, (road, closed) in enumerate(roads):
+        if closed:
+            polylines, _ = overlap.get_overlaps(lot, road, True, True, tol)
+            segments = [
+                segment
+                for pts in polylines
+                for segment in planar.get_segments(pts, closed=False)
+            ]
+        else:
+            segments = get_centerline_frontage(lot, road, tol=tol)
+        frontages.append(sum((math.dist(a, b) for a, b in segments), 0.0))
+        for a, b in segments:
+            edges.append((math.dist(a, b), i, a, b))
+    edges.sort(key=lambda edge: -edge[0])
+    return edges, frontages
+
+
+def get_strip(lot: Ring, edge_a: Point, edge_b: Point) -> List[Point]:
+    """대지에서 변(edge_a, edge_b) 폭만큼의 띠 (변에 수직인 두 직선 사이)"""
+    dx = edge_b[0] - edge_a[0]
+    dy = edge_b[1] - edge_a[1]
+    length = math.hypot(dx, dy)
+    ux, uy = dx / length, dy / length
+    start = edge_a[0] * ux + edge_a[1] * uy
+    strip = planar.clip_ring_by_half_plane(lot, (ux, uy), start + length)
+    return planar.clip_ring_by_half_plane(strip, (-ux, -uy), -start)
+
+
+def get_sub_edges(
+    edge_a: Point, edge_b: Point, width: float
+) -> List[Tuple[Point, Point]]:
+    """변 위에서 양 끝에 붙인 길이 width의 부분 변들 (width가 변 길이 이상이면 변 그대로)"""
+    length = math.dist(edge_a, edge_b)
+    if width >= length:
+        return [(edge_a, edge_b)]
+    t = width / length
+    dx = (edge_b[0] - edge_a[0]) * t
+    dy = (edge_b[1] - edge_a[1]) * t
+    return [
+        (edge_a, (edge_a[0] + dx, edge_a[1] + dy)),
+        ((edge_b[0] - dx, edge_b[1] - dy), edge_b),
+    ]
+
+
+def layout_openspace(
+    site: Site,
+    required_area: float,
+    tol: float = TOL,
+    frontage: Optional[Frontage] = None,
+    obstacles: Optional[List[Ring]] = None,
+) -> Optional[List[Point]]:
+    """필요 면적을 만족하는 공개공지 영역 (없으면 None)
+
+    띠 폭은 최소 깊이로 필요 면적을 채우는 폭(접도 조건과 최소 깊이 이상)으로 줄이고,
+    접도 변의 양 끝에 붙여 두 위치를 시도한다.
+    frontage(get_frontage_edges 결과)와 obstacles를 주면 다시 계산하지 않는다.
+    """
+    if required_area <= 0:
+        return None
+
+    edges, frontages = frontage or get_frontage_edges(site.lot, site.roads, tol)
+    obstacles = site.obstacles if obstacles is None else obstacles
+    for length, road_index, a, b in edges:
+        # 해당 도로 접도 길이의 4분의 1 초과, 폭은 최소 깊이 이상
+        min_width = max(
+            frontages[road_index] * requirement.ROAD_ADJUST_RATIO + tol,
+            requirement.MIN_DEPTH,
+        )
+        if length < min_width:
+            continue
+        width = max(required_area / requirement.MIN_DEPTH, min_width)
+
+        for sub_a, sub_b in get_sub_edges(a, b, width):
+            strip = get_strip(site.lot, sub_a, sub_b)
+            if len(strip) < 3:
+                continue
+            region = planar.trim_ring_from_edge(
+                strip, sub_a, sub_b, required_area, requirement.MIN_DEPTH, AREA_TOL
+            )
+            if not region or planar.get_area(region) < required_area - AREA_TOL:
+                continue
+            if any(
+                planar.rings_intersect(region, obstacle, tol) for obstacle in obstacles
+            ):
+                continue
+            return region
+    return None
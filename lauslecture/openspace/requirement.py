@@ -0,0 +1,36 @@
+"""공개공지 설치 조건 (Lecture5 OpenspaceRequirement와 같은 기준)"""
+
+MIN_AREA = 90.0
+MIN_DEPTH = 9.0
+AREA_RATIO = 0.1
+# 최대 넓이 도로변과 4분의1이상 접할 것
+ROAD_ADJUST_RATIO = 0.25
+MIN_TOTAL_FLOOR_AREA = 5000.0
+
+DISTRICT_USES = ("일반주거지역", "준주거지역", "상업지역", "준공업지역")
+BUILDING_USES = (
+    "문화시설",
+    "집회시설",
+    "종교시설",
+    "판매시설",
+    "운수시설",
+    "업무시설",
+    "숙박시설",
+)
+
+
+def get_required_area(
+    lot_area: float, district_use: str, building_use: str, total_floor_area: float
+) -> float:
+    """공개공지 필요 면적 (설치 대상이 아니면 0)"""
+    # 1. 대지의 용도 조건
+    if district_use not in DISTRICT_USES:
+        return 0.0
+    # 2. 건축물의 용도 조건
+    if building_use not in BUILDING_USES:
+        return 0.0
+    # 3. 건축물의 연면적 조건
+    if total_floor_area < MIN_TOTAL_FLOOR_AREA:
+        return 0.0
+    # 공개공지 면적 = 대지면적의 10%이상(최소 90m2)
+    return max(lot_area * AREA_RATIO, MIN_AREA)
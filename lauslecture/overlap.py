@@ -0,0 +1,160 @@
+"""두 폴리라인이 공유하는 변(같은 직선 위에서 겹치는 구간) 계산
+
+Rhino/Grasshopper 없이 선분 리스트만으로 겹치는 구간과 전체 길이를 한 번에 구한다.
+
+1. 기준 폴리라인(a)의 각 선분마다 바운딩박스가 걸치는 상대 선분(b)만 격자 인덱스로 찾는다.
+2. 상대 선분의 양 끝점이 기준 선분의 직선에서 tol 이내이면 같은 직선 위에 있다고 보고,
+   기준 선분 위로 투영한 구간을 모은다.
+3. 선분별 구간을 합친 뒤 이웃 선분으로 이어지는 구간은 하나의 폴리라인으로 잇는다.
+"""
+import math
+from typing import List, Optional, Sequence, Tuple
+
+from lauslecture import planar
+from lauslecture.planar import Point, TOL
+from lauslecture.spatial import GridIndex
+
+Segment = Tuple[Point, Point]
+Interval = Tuple[float, float]  # 기준 선분 시작점으로부터의 거리 (start, end)
+
+
+class SegmentIndex:
+    """선분 바운딩박스 격자 인덱스 (격자 크기는 평균 선분 길이)"""
+
+    def __init__(self, segments: Sequence[Segment], tol: float = TOL) -> None:
+        self.segments = list(segments)
+        lengths = [math.dist(a, b) for a, b in self.segments]
+        cell_size = max(sum(lengths) / len(lengths), tol * 10) if lengths else 1.0
+        self.index = GridIndex.from_bboxes(
+            (planar.inflate_bbox(planar.get_bbox(seg), tol) for seg in self.segments),
+            cell_size,
+        )
+
+    def query(self, segment: Segment) -> List[Segment]:
+        """segment와 바운딩박스가 겹치는 선분들"""
+        return [self.segments[i] for i in self.index.query(planar.get_bbox(segment))]
+
+
+def get_collinear_interval(
+    segment: Segment, other: Segment, tol: float = TOL
+) -> Tuple[float, float]:
+    """other가 segment와 같은 직선 위에 있으면 segment 위로 투영한 구간, 아니면 (0, 0)"""
+    (ax, ay), (bx, by) = segment
+    length = math.hypot(bx - ax, by - ay)
+    if length <= tol:
+        return (0.0, 0.0)
+    ux, uy = (bx - ax) / length, (by - ay) / length
+
+    params = []
+    for x, y in other:
+        dx, dy = x - ax, y - ay
+        if abs(dx * uy - dy * ux) > tol:
+            return (0.0, 0.0)
+        params.append(dx * ux + dy * uy)
+
+    start = max(min(params), 0.0)
+    end = min(max(params), length)
+    if end - start <= tol:
+        return (0.0, 0.0)
+    return (start, end)
+
+
+def merge_intervals(intervals: List[Interval], tol: float = TOL) -> List[Interval]:
+    """tol 이내로 맞닿거나 겹치는 구간을 합친다"""
+    merged = []  # type: List[Interval]
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + tol:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _point_at(segment: Segment, dist: float) -> Point:
+    (ax, ay), (bx, by) = segment
+    t = dist / math.hypot(bx - ax, by - ay)
+    return (ax + (bx - ax) * t, ay + (by - ay) * t)
+
+
+def get_overlaps(
+    points_a: Sequence[Point],
+    points_b: Sequence[Point],
+    closed_a: bool = True,
+    closed_b: bool = True,
+    tol: float = TOL,
+) -> Tuple[List[List[Point]], float]:
+    """a를 기준으로 b와 겹치는 구간 폴리라인들과 전체 겹침 길이
+
+    Args:
+        points_a: 기준 폴리라인 꼭짓점 (닫힌 경우 닫는 점 제외)
+        points_b: 겹침을 테스트할 폴리라인 꼭짓점
+        closed_a, closed_b: 닫힌 폴리라인 여부
+        tol: 같은 직선으로 볼 거리 허용 오차
+
+    Returns:
+        (a 방향을 따르는 겹침 폴리라인 리스트, 전체 겹침 길이)
+    """
+    segments_a = planar.get_segments(points_a, closed_a)
+    segments_b = planar.get_segments(points_b, closed_b)
+    if not segments_a or not segments_b:
+        return [], 0.0
+
+    bbox_b = planar.inflate_bbox(planar.get_bbox(points_b), tol)
+    if not planar.bbox_intersects(planar.get_bbox(points_a), bbox_b):
+        return [], 0.0
+
+    index = SegmentIndex(segments_b, tol)
+    pieces = []  # type: List[Tuple[int, Interval]]
+    total = 0.0
+    for i, segment in enumerate(segments_a):
+        intervals = [
+            get_collinear_interval(segment, other, tol)
+            for other in index.query(segment)
+        ]
+        for interval in merge_intervals([iv for iv in intervals if iv[1] > iv[0]], tol):
+            pieces.append((i, interval))
+            total += interval[1] - interval[0]
+
+    # 선분 끝에서 다음 선분 시작으로 이어지는 구간은 하나의 폴리라인으로 잇는다
+    def is_seg_end(i: int, interval: Interval) -> bool:
+        seg = segments_a[i]
+        return interval[1] >= math.dist(seg[0], seg[1]) - tol
+
+    polylines = []  # type: List[List[Point]]
+    prev = None  # type: Optional[Tuple[int, Interval]]
+    for i, interval in pieces:
+        start = _point_at(segments_a[i], interval[0])
+        end = _point_at(segments_a[i], interval[1])
+        if (
+            prev is not None
+            and prev[0] == i - 1
+            and is_seg_end(*prev)
+            and interval[0] <= tol
+        ):
+            polylines[-1].append(end)
+        else:
+            polylines.append([start, end])
+        prev = (i, interval)
+
+    # 닫힌 폴리라인은 마지막 선분 끝과 첫 선분 시작이 이어질 수 있다
+    if (
+        closed_a
+        and len(polylines) > 1
+        and pieces[0][0] == 0
+        and pieces[0][1][0] <= tol
+        and pieces[-1][0] == len(segments_a) - 1
+        and is_seg_end(*pieces[-1])
+    ):
+        polylines[0] = polylines.pop()[:-1] + polylines[0]
+    return polylines, total
+
+
+def get_overlap_length(
+    points_a: Sequence[Point],
+    points_b: Sequence[Point],
+    closed_a: bool = True,
+    closed_b: bool = True,
+    tol: float = TOL,
+) -> float:
+    """a를 기준으로 b와 겹치는 전체 길이"""
+    return get_overlaps(points_a, points_b, closed_a, closed_b, tol)[1]
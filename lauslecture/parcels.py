@@ -0,0 +1,150 @@
+"""Lecture2 필지 분석(맹지, 자루형 토지)의 Rhino 비의존 구현
+
+필지와 도로 커브는 현재 기하 백엔드의 객체(Rhino 커브 또는 꼭짓점 리스트)로 받아
+꼭짓점 리스트(ring)로 변환한 뒤 계산한다. 결과는 조건을 만족하는 필지의 인덱스 리스트.
+"""
+import math
+from typing import Any, List, Optional, Sequence
+
+from lauslecture import backends, planar
+from lauslecture.planar import Ring
+from lauslecture.spatial import GridIndex
+
+ROAD_TOL = 0.5  # 도로 접근 판단 거리
+
+
+def create_road_index(
+    road_rings: Sequence[Ring], tolerance: float = ROAD_TOL
+) -> GridIndex:
+    """도로 바운딩박스(tolerance만큼 확장) 격자 인덱스 생성"""
+    bboxes = [
+        planar.inflate_bbox(planar.get_bbox(ring), tolerance) for ring in road_rings
+    ]
+    if not bboxes:
+        return GridIndex(1.0)
+
+    # 평균 도로 크기를 격자 크기로 사용
+    mean_size = sum(max(b[2] - b[0], b[3] - b[1]) for b in bboxes) / len(bboxes)
+    return GridIndex.from_bboxes(bboxes, max(mean_size, 1.0))
+
+
+def has_road_access(
+    lot_ring: Ring,
+    road_rings: Sequence[Ring],
+    road_index: GridIndex,
+    tolerance: float = ROAD_TOL,
+) -> bool:
+    """필지가 도로에 tolerance 이내로 접하는지 확인"""
+    lot_bbox = planar.inflate_bbox(planar.get_bbox(lot_ring), tolerance)
+    for idx in road_index.query(lot_bbox):
+        if planar.is_ring_near_ring(lot_ring, road_rings[idx], tolerance):
+            return True
+    return False
+
+
+def get_rings(
+    curves: Sequence[Any], backend: Optional[backends.GeometryBackend] = None
+) -> List[Ring]:
+    """백엔드 커브들을 꼭짓점 리스트로 변환"""
+    backend = backend or backends.get_backend()
+    return [backend.vertices(curve) for curve in curves]
+
+
+def get_road_rings(
+    roads: Sequence[Any],
+    road_holes: Sequence[Any] = (),
+    backend: Optional[backends.GeometryBackend] = None,
+) -> List[Ring]:
+    """도로의 모든 경계(외부 경계 + 내부 구멍)를 꼭짓점 리스트로 변환"""
+    return get_rings(roads, backend) + get_rings(road_holes, backend)
+
+
+def find_landlocked_lots(
+    lots: Sequence[Any],
+    roads: Sequence[Any],
+    road_holes: Sequence[Any] = (),
+    tolerance: float = ROAD_TOL,
+    backend: Optional[backends.GeometryBackend] = None,
+) -> List[int]:
+    """맹지(도로에 접하지 않는 필지)의 인덱스를 반환 (road_holes: 도로 내부 구멍 커브)"""
+    lot_rings = get_rings(lots, backend)
+    road_rings = get_road_rings(roads, road_holes, backend)
+    road_index = create_road_index(road_rings, tolerance)
+    return [
+        i
+        for i, lot_ring in enumerate(lot_rings)
+        if not has_road_access(lot_ring, road_rings, road_index, tolerance)
+    ]
+
+
+def is_flag_shaped(
+    lot_ring: Ring,
+    road_rings: Sequence[Ring],
+    road_index: GridIndex,
+    offset_distance: float,
+    tolerance: float = ROAD_TOL,
+) -> bool:
+    """필지가 자루형인지 판별
+
+    offset_distance만큼 안쪽 오프셋 후 다시 바깥쪽으로 복원한 형태(opening)가
+    도로와 접하지 않으면 자루형이다. 복원된 형태가 도로에 닿는 것은
+    "경계에서 offset_distance 이상 떨어진 내부 점 중 도로까지 거리가
+    offset_distance + tolerance 이하인 점이 있다"와 같으므로 내부 격자점으로 판정한다.
+    그런 내부 점이 하나도 없으면(안쪽 오프셋이 비면) Lecture2와 같이 자루형이 아니다.
+    """
+    step = offset_distance / 2
+    slack = step / 2  # 격자 간격에 의한 근사 오차 보정
+    reach = offset_distance + tolerance + slack
+
+    min_x, min_y, max_x, max_y = planar.get_bbox(lot_ring)
+    road_ids = road_index.query(
+        planar.inflate_bbox((min_x, min_y, max_x, max_y), reach)
+    )
+    road_segs = [
+        seg for idx in road_ids for seg in planar.get_segments(road_rings[idx])
+    ]
+
+    has_inner = False
+    for i in range(int(math.ceil((max_x - min_x) / step)) + 1):
+        x = min_x + i * step
+        for j in range(int(math.ceil((max_y - min_y) / step)) + 1):
+            pt = (x, min_y + j * step)
+            if not planar.is_pt_inside_ring(pt, lot_ring):
+                continue
+            if planar.get_dist_pt_to_ring(pt, lot_ring) < offset_distance - slack:
+                continue
+            has_inner = True
+            if any(
+                planar.get_dist_pt_to_segment(pt, a, b) <= reach for a, b in road_segs
+            ):
+                return False
+
+    return has_inner
+
+
+def find_flag_lots(
+    lots: Sequence[Any],
+    roads: Sequence[Any],
+    road_holes: Sequence[Any] = (),
+    offset_distance: float = 4.0,
+    tolerance: float = ROAD_TOL,
+    backend: Optional[backends.GeometryBackend] = None,
+) -> List[int]:
+    """자루형 토지(도로에 접하지만 좁은 통로로만 연결된 필지)의 인덱스를 반환
+
+    road_holes는 도로 내부 구멍 커브로, 도로 외부 경계와 함께 도로 경계로 쓴다.
+    """
+    lot_rings = get_rings(lots, backend)
+    road_rings = get_road_rings(roads, road_holes, backend)
+    road_index = create_road_index(road_rings, tolerance)
+
+    flag_lot_ids = []
+    for i, lot_ring in enumerate(lot_rings):
+        # 1단계: 도로에 접한 토지만 검사
+        if not has_road_access(lot_ring, road_rings, road_index, tolerance):
+            continue
+        # 2단계: 자루형 토지 판별
+        if is_flag_shaped(lot_ring, road_rings, road_index, offset_distance, tolerance):
+            flag_lot_ids.append(i)
+
+    return flag_lot_ids
@@ -0,0 +1,5 @@
+"""Lecture4 자주식 주차장 레이아웃의 Rhino 비의존 엔진
+
+주차칸(stall)은 (N, 4, 2) NumPy 배열의 한 행으로 표현한다.
+네 꼭짓점 순서는 [기준점, 폭 방향 점, 대각 점, 길이 방향 점] 이다.
+"""
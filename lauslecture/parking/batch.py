@@ -0,0 +1,402 @@
+"""여러 대지의 주차 레이아웃 일괄 계산
+
+01_parking_design.py의 외부/내부 주차칸 생성, 형식 배정, 겹침 정리를 같은 ParkingRules로
+대지마다 프로세스 풀에서 실행하고, 대지별 주차칸 수와 형상을 표 형태(BatchResult)로 모은다.
+
+사용 예:
+    python -m lauslecture.parking.batch sites.json --workers 4 --csv counts.csv
+    python -m lauslecture.parking.batch lots.shp --id-field A1 --geometry stalls.npz
+    python -m lauslecture.parking.batch sites.json --angle 60 --stall-type extended
+
+JSON 입력 형식 (entrance를 생략하면 가장 긴 변의 중점을 진입점으로 사용):
+    [{"id": "A-1", "region": [[x, y], ...], "entrance": [x, y]}, ...]
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lauslecture import backends, planar, primitives, runtime
+from lauslecture.parking import filters, overlap, rules, stalls
+
+shapefile = runtime.lazy_import("shapefile")
+
+# 외부/내부 주차칸이 겹칠 때 남길 쪽 (01_parking_design.py의 OVERLAP_PRIORITY와 같은 기본값)
+OVERLAP_PRIORITY = "outside"
+
+Site = Tuple[str, np.ndarray, Optional[np.ndarray]]  # (id, 외곽 (K, 2), 진입점 (2,))
+
+
+class BatchResult:
+    """대지별 주차칸 수와 형상
+
+    모든 대지의 주차칸은 stalls (M, 4, 2) 배열 하나에 이어 붙이고,
+    i번째 대지의 주차칸은 stalls[offsets[i]:offsets[i + 1]] 이다.
+    """
+
+    def __init__(
+        self,
+        site_ids: List[str],
+        outside_counts: np.ndarray,
+        inside_counts: np.ndarray,
+        stalls: np.ndarray,
+        seconds: np.ndarray,
+    ) -> None:
+        self.site_ids = site_ids
+        self.outside_counts = outside_counts
+        self.inside_counts = inside_counts
+        self.stalls = stalls
+        self.seconds = seconds
+        self.offsets = np.concatenate([[0], np.cumsum(outside_counts + inside_counts)])
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self.outside_counts + self.inside_counts
+
+    def __len__(self) -> int:
+        return len(self.site_ids)
+
+    @property
+    def empty_site_ids(self) -> List[str]:
+        """주차칸이 하나도 없는 대지 (대지가 작거나 offset 영역이 없는 경우)"""
+        return [self.site_ids[i] for i in np.flatnonzero(self.counts == 0)]
+
+    def get_stalls(self, i: int) -> np.ndarray:
+        return self.stalls[self.offsets[i] : self.offsets[i + 1]]
+
+    def to_rows(self) -> List[dict]:
+        return [
+            {
+                "id": site_id,
+                "outside": int(self.outside_counts[i]),
+                "inside": int(self.inside_counts[i]),
+                "total": int(self.counts[i]),
+                "seconds": round(float(self.seconds[i]), 4),
+            }
+            for i, site_id in enumerate(self.site_ids)
+        ]
+
+    def write_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, ["id", "outside", "inside", "total", "seconds"])
+            writer.writeheader()
+            writer.writerows(self.to_rows())
+
+    def save_geometry(self, path: str) -> None:
+        """주차칸 형상을 npz로 저장 (site_ids, offsets, stalls)"""
+        np.savez_compressed(
+            path,
+            site_ids=np.array(self.site_ids),
+            offsets=self.offsets,
+            stalls=self.stalls,
+        )
+
+
+# ================ 대지 하나 ================
+
+
+def get_default_entrance(ring: np.ndarray) -> np.ndarray:
+    """진입점이 없는 대지는 가장 긴 변의 중점을 진입점으로 사용"""
+    segments = primitives.SegmentArray.from_vertices(ring)
+    return segments.midpoints[int(np.argmax(segments.lengths))]
+
+
+def get_closest_pt_on_ring(ring: np.ndarray, pt: np.ndarray) -> np.ndarray:
+    """진입점을 대지 경계에 투영"""
+    closest = primitives.SegmentArray.from_vertices(ring).get_closest_points(pt)
+    dists = np.linalg.norm(closest - np.asarray(pt, dtype=float)[:2], axis=1)
+    return closest[int(np.argmin(dists))]
+
+
+def offset_inward(
+    ring: np.ndarray, distance: float, backend: backends.GeometryBackend
+) -> List[np.ndarray]:
+    """백엔드 offset으로 안쪽 영역들을 구해 (K, 2) 배열로 반환"""
+    curve = backend.polyline(ring.tolist(), closed=True)
+    return [
+        stalls.as_ring(backend.vertices(crv))
+        for crv in backend.offset(curve, -distance)
+    ]
+
+
+def get_axis(ring: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """내부 주차칸 배치 축: 최소 바운딩박스 변의 시작점과 단위 방향"""
+    index = planar.get_min_bbox_edge([tuple(pt) for pt in ring])
+    origin = ring[index]
+    x_axis = ring[(index + 1) % len(ring)] - origin
+    return origin, x_axis / np.linalg.norm(x_axis)
+
+
+def layout_stalls(
+    ring: np.ndarray,
+    entrance: np.ndarray,
+    outside_rings: List[np.ndarray],
+    inside_rings: List[np.ndarray],
+    origin: np.ndarray,
+    x_axis: np.ndarray,
+    parking_rules: Optional[rules.ParkingRules] = None,
+    overlap_priority: str = OVERLAP_PRIORITY,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """미리 구한 offset 영역과 축으로 외부/내부 주차칸 생성 (01_parking_design.py와 같은 순서)
+
+    Args:
+        outside_rings: 주차칸 열 깊이만큼 안쪽 offset 한 영역들
+        inside_rings: 주차칸 열 깊이 + 차로 폭만큼 안쪽 offset 한 영역들
+        parking_rules: 주차칸 형식, 각도, 차로 폭 (기본: 일반형 직각 주차)
+        overlap_priority: 외부/내부 주차칸이 겹칠 때 남길 쪽 ("outside" 또는 "inside")
+
+    Returns:
+        (외부 주차칸, 내부 주차칸) - 형식 배정으로 크기가 바뀐 주차칸 포함
+    """
+    parking_rules = parking_rules or rules.ParkingRules()
+    width, length = parking_rules.width, parking_rules.length
+    angle = parking_rules.angle
+    entrance_pt = get_closest_pt_on_ring(ring, entrance)
+
+    # 1. 외부: 열 깊이만큼 안쪽 영역의 변을 따라 바깥쪽으로 생성, 진입부 제거
+    outside = stalls.get_stalls_from_outside(outside_rings, width, length, angle)
+    outside = outside[filters.get_entrance_mask(outside, entrance_pt, width)]
+
+    # 2. 내부: 최소 바운딩박스 축으로 패턴을 채운 뒤 내부 영역을 벗어난 주차칸 제거
+    inside = stalls.EMPTY_STALLS
+    if inside_rings:
+        inside = np.concatenate(
+            [
+                stalls.get_stalls_from_inside_ring(
+                    r, origin, x_axis, width, length, parking_rules.pattern, angle=angle
+                )
+                for r in inside_rings
+            ]
+        )
+        inside = inside[
+            filters.get_inside_mask(inside, inside_rings, parking_rules.tol)
+        ]
+
+    # 3. 진입점에 가까운 주차칸부터 형식 배정, 4. 겹치는 주차칸 정리 (형식 배정 칸 우선)
+    corners, type_ids = rules.assign_stall_types(
+        np.concatenate([outside, inside]), parking_rules, entrance_pt
+    )
+    is_outside = np.arange(len(corners)) < len(outside)
+    preferred = is_outside if overlap_priority == "outside" else ~is_outside
+    keep = overlap.resolve_overlaps(
+        corners, (type_ids > 0) * 2 + preferred, parking_rules.tol
+    )
+    return corners[keep & is_outside], corners[keep & ~is_outside]
+
+
+def layout_site(
+    ring: np.ndarray,
+    entrance: Optional[np.ndarray],
+    parking_rules: Optional[rules.ParkingRules] = None,
+    backend: Optional[backends.GeometryBackend] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """대지 하나의 외부/내부 주차칸 (01_parking_design.py와 같은 순서)"""
+    parking_rules = parking_rules or rules.ParkingRules()
+    backend = backend or backends.get_backend()
+    ring = stalls.as_ring(ring)
+    entrance = get_default_entrance(ring) if entrance is None else np.asarray(entrance)
+    origin, x_axis = get_axis(ring)
+    depth = parking_rules.row_depth
+    return layout_stalls(
+        ring,
+        entrance,
+        offset_inward(ring, depth, backend),
+        offset_inward(ring, depth + parking_rules.aisle_width, backend),
+        origin,
+        x_axis,
+        parking_rules,
+    )
+
+
+def _layout_job(args) -> Tuple[np.ndarray, np.ndarray, float]:
+    ring, entrance, parking_rules, backend_name = args
+    start = time.perf_counter()
+    outside, inside = layout_site(
+        ring, entrance, parking_rules, backends.load_backend(backend_name)
+    )
+    return outside, inside, time.perf_counter() - start
+
+
+# ================ 일괄 실행 ================
+
+
+def layout_sites(
+    sites: Sequence[Site],
+    parking_rules: Optional[rules.ParkingRules] = None,
+    workers: int = 1,
+    backend_name: str = "python",
+    chunk_size: Optional[int] = None,
+) -> BatchResult:
+    """여러 대지의 주차 레이아웃을 계산
+
+    Args:
+        sites: (id, 외곽 꼭짓점 (K, 2), 진입점 (2,) 또는 None) 리스트
+        parking_rules: 모든 대지에 적용할 주차장 설계 규칙 (기본: 일반형 직각 주차)
+        workers: 프로세스 수 (1이면 순차 실행)
+        backend_name: 작업 프로세스에서 사용할 기하 백엔드 이름
+        chunk_size: 프로세스에 한 번에 넘길 대지 수 (기본: 작업 수당 4묶음)
+
+    Returns:
+        BatchResult
+    """
+    parking_rules = parking_rules or rules.ParkingRules()
+    jobs = [
+        (ring, entrance, parking_rules, backend_name) for _, ring, entrance in sites
+    ]
+    if workers > 1:
+        chunk_size = chunk_size or max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_layout_job, jobs, chunksize=chunk_size))
+    else:
+        results = [_layout_job(job) for job in jobs]
+
+    parts = [part for outside, inside, _ in results for part in (outside, inside)]
+    return BatchResult(
+        [site_id for site_id, _, _ in sites],
+        np.array([len(outside) for outside, _, _ in results], dtype=np.int64),
+        np.array([len(inside) for _, inside, _ in results], dtype=np.int64),
+        np.concatenate(parts) if parts else stalls.EMPTY_STALLS,
+        np.array([seconds for _, _, seconds in results]),
+    )
+
+
+# ================ 입력 ================
+
+
+def load_sites_json(path: str) -> List[Site]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data["sites"]
+
+    sites = []
+    for i, item in enumerate(data):
+        entrance = item.get("entrance")
+        sites.append(
+            (
+                str(item.get("id", i)),
+                stalls.as_ring(item["region"]),
+                None if entrance is None else np.asarray(entrance[:2], dtype=float),
+            )
+        )
+    return sites
+
+
+def get_shp_encodings(path: str) -> List[str]:
+    """시도할 shapefile 인코딩 (.cpg 파일이 있으면 그 인코딩부터)"""
+    encodings = []
+    cpg_path = os.path.splitext(path)[0] + ".cpg"
+    if os.path.exists(cpg_path):
+        with open(cpg_path, encoding="ascii", errors="ignore") as f:
+            name = f.read().strip()
+        if name:
+            encodings.append(name)
+    return encodings + [e for e in ("utf-8", "cp949") if e not in encodings]
+
+
+def read_shape_records(path: str) -> Tuple[List[str], list]:
+    """필드 이름과 (shape, record) 리스트
+
+    pyshp는 레코드 값을 읽을 때 디코딩하므로 레코드까지 모두 읽은 뒤에
+    디코딩 오류가 나면 다음 인코딩으로 다시 읽는다.
+    """
+    encodings = get_shp_encodings(path)
+    for i, encoding in enumerate(encodings):
+        try:
+            sf = shapefile.Reader(path, encoding=encoding)
+            fields = [field[0] for field in sf.fields[1:]]
+            return fields, list(sf.iterShapeRecords())
+        except (UnicodeDecodeError, LookupError, shapefile.ShapefileException):
+            # pyshp 2.x는 UnicodeDecodeError, 3.x는 dbfFileException으로 디코딩 실패를 알린다
+            if i == len(encodings) - 1:
+                raise
+    return [], []
+
+
+def load_sites_shp(path: str, id_field: Optional[str] = None) -> List[Site]:
+    """shapefile 폴리곤의 외곽(첫 번째 파트)을 대지로 읽는다 (진입점은 기본값 사용)"""
+    fields, shape_records = read_shape_records(path)
+    id_index = fields.index(id_field) if id_field in fields else None
+
+    sites = []
+    for i, shape_record in enumerate(shape_records):
+        shape = shape_record.shape
+        end = shape.parts[1] if len(shape.parts) > 1 else len(shape.points)
+        points = shape.points[:end]
+        if len(points) < 3:
+            continue
+        site_id = shape_record.record[id_index] if id_index is not None else i
+        sites.append((str(site_id), stalls.as_ring(points), None))
+    return sites
+
+
+def load_sites(path: str, id_field: Optional[str] = None) -> List[Site]:
+    if os.path.splitext(path)[1].lower() == ".json":
+        return load_sites_json(path)
+    return load_sites_shp(path, id_field)
+
+
+# ================ CLI ================
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="대지 JSON 또는 shapefile(.shp, .zip)")
+    parser.add_argument("--id-field", default="A1", help="shapefile 대지 id 필드")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--backend", choices=sorted(backends.BACKEND_MODULES), default="python"
+    )
+    parser.add_argument(
+        "--stall-type", choices=sorted(rules.STALL_TYPES), default="standard"
+    )
+    parser.add_argument("--angle", type=float, choices=rules.ANGLES, default=90.0)
+    parser.add_argument("--aisle-width", type=float, help="차로 폭 (기본: 각도별 법정 폭)")
+    parser.add_argument("--csv", help="대지별 주차칸 수 CSV 저장 경로")
+    parser.add_argument("--geometry", help="주차칸 형상 npz 저장 경로")
+    args = parser.parse_args(argv)
+
+    sites = load_sites(args.path, args.id_field)
+    start = time.perf_counter()
+    parking_rules = rules.ParkingRules(
+        rules.STALL_TYPES[args.stall_type], args.angle, args.aisle_width
+    )
+    result = layout_sites(
+        sites, parking_rules, workers=args.workers, backend_name=args.backend
+    )
+    print(
+        "{} sites, {} stalls ({:.2f}s, {} workers)".format(
+            len(result),
+            int(result.counts.sum()),
+            time.perf_counter() - start,
+            args.workers,
+        )
+    )
+
+    empty_ids = result.empty_site_ids
+    if empty_ids:
+        shown = ", ".join(empty_ids[:10]) + (" ..." if len(empty_ids) > 10 else "")
+        print(
+            "warning: {} sites have no stalls: {}".format(len(empty_ids), shown),
+            file=sys.stderr,
+        )
+
+    if args.csv:
+        result.write_csv(args.csv)
+    else:
+        print("{:<20s} {:>8s} {:>8s} {:>8s}".format("id", "outside", "inside", "total"))
+        for row in result.to_rows():
+            print("{id:<20s} {outside:>8d} {inside:>8d} {total:>8d}".format(**row))
+    if args.geometry:
+        result.save_geometry(args.geometry)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""주차 레이아웃 단계별 캐시
+
+그래스호퍼 solve가 반복될 때 바뀐 입력 이후의 단계만 다시 계산한다.
+
+    1단계 (영역 키 + 이름)       : 안쪽 offset 영역들, 축
+    2단계 (영역 키 + 파라미터)   : 진입부 필터 전 주차칸 후보
+    3단계 (진입점)              : 캐시하지 않음 (진입부 필터만 매번 실행)
+
+값은 runtime.get_state (scriptcontext.sticky)에 저장되어 utils 새로고침에도 유지된다.
+"""
+import hashlib
+from typing import Any, Callable, Hashable
+
+import numpy as np
+
+from lauslecture import runtime
+
+GEOMETRY_NAMESPACE = "parking.geometry"
+STALLS_NAMESPACE = "parking.stalls"
+MAX_ENTRIES = 32  # 단계별 최대 저장 개수 (오래된 것부터 제거)
+KEY_PRECISION = 6  # 영역 키를 만들 때 좌표 반올림 소수점 자리수
+
+
+def get_region_key(vertices: np.ndarray, precision: int = KEY_PRECISION) -> str:
+    """꼭짓점 좌표로 만든 영역 키 (같은 형상이면 같은 키)"""
+    rounded = np.round(np.asarray(vertices, dtype=float), precision) + 0.0  # -0.0 제거
+    return hashlib.sha1(rounded.tobytes()).hexdigest()
+
+
+def cached(
+    namespace: str,
+    key: Hashable,
+    factory: Callable[[], Any],
+    max_entries: int = MAX_ENTRIES,
+) -> Any:
+    """runtime.cached와 같지만 max_entries를 넘으면 가장 오래된 값부터 제거"""
+    state = runtime.get_state(namespace)
+    if key in state:
+        # 최근 사용한 값을 뒤로 보낸다
+        value = state.pop(key)
+        state[key] = value
+        return value
+
+    value = factory()
+    state[key] = value
+    runtime.trim_state(namespace, max_entries)
+    return value
+
+
+def get_geometry(region_key: str, name: Hashable, factory: Callable[[], Any]) -> Any:
+    """1단계: 영역이 그대로면 offset 영역, 축 등을 재사용
+
+    name으로 같은 영역의 여러 값을 구분한다 (예: ("offset", 5.0), "axis").
+    """
+    return cached(GEOMETRY_NAMESPACE, (region_key, name), factory)
+
+
+def get_stalls(region_key: str, params: tuple, factory: Callable[[], Any]) -> Any:
+    """2단계: 영역과 파라미터가 그대로면 주차칸 후보를 재사용"""
+    return cached(STALLS_NAMESPACE, (region_key,) + tuple(params), factory)
+
+
+def clear() -> None:
+    runtime.clear_state(GEOMETRY_NAMESPACE)
+    runtime.clear_state(STALLS_NAMESPACE)
@@ -0,0 +1,233 @@
+"""주차칸 배열 필터링 (진입부, 내부 영역)"""
+import math
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+ROUNDING_PRECISION = 6  # 거리 반올림 소수점 자리수 (utils.get_dist_between_pt_and_crv와 동일)
+
+
+class StallIndex:
+    """주차칸 바운딩박스 균일 격자 인덱스
+
+    주차칸은 크기가 거의 같으므로 격자 크기를 주차칸 크기로 잡으면
+    한 주차칸은 최대 2x2 칸에만 등록된다.
+    """
+
+    def __init__(self, corners: np.ndarray, cell_size: Optional[float] = None) -> None:
+        self.corners = corners
+        self.mins = corners.min(axis=1) if len(corners) else np.zeros((0, 2))
+        self.maxs = corners.max(axis=1) if len(corners) else np.zeros((0, 2))
+        if cell_size is None:
+            extents = self.maxs - self.mins
+            cell_size = float(extents.max()) if len(extents) else 1.0
+        self.cell_size = max(cell_size, 1e-6)
+        self.cells = self._build()  # type: Dict[Tuple[int, int], np.ndarray]
+
+    def _build(self) -> Dict[Tuple[int, int], np.ndarray]:
+        if not len(self.corners):
+            return {}
+        # (주차칸 번호, 격자 칸) 쌍을 모은 뒤 격자 칸별로 묶는다
+        ids, keys = get_cell_entries(self.mins, self.maxs, self.cell_size)
+
+        order = np.lexsort((keys[:, 1], keys[:, 0]))
+        keys, ids = keys[order], ids[order]
+        unique_keys, starts = np.unique(keys, axis=0, return_index=True)
+        groups = np.split(ids, starts[1:])
+        return {(int(k[0]), int(k[1])): g for k, g in zip(unique_keys, groups)}
+
+    def query_bbox(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """바운딩박스가 [lo, hi]와 겹치는 주차칸 번호들"""
+        i0, j0 = (int(v) for v in np.floor(np.asarray(lo) / self.cell_size))
+        i1, j1 = (int(v) for v in np.floor(np.asarray(hi) / self.cell_size))
+        found = [
+            self.cells[(i, j)]
+            for i in range(i0, i1 + 1)
+            for j in range(j0, j1 + 1)
+            if (i, j) in self.cells
+        ]
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        candidates = np.unique(np.concatenate(found))
+        overlap = np.all(self.mins[candidates] <= hi, axis=1) & np.all(
+            self.maxs[candidates] >= lo, axis=1
+        )
+        return candidates[overlap]
+
+    def query_radius(self, pt: np.ndarray, radius: float) -> np.ndarray:
+        """pt에서 radius 이내에 바운딩박스가 걸치는 주차칸 번호들"""
+        pt = np.asarray(pt, dtype=float)
+        return self.query_bbox(pt - radius, pt + radius)
+
+
+def get_cell_entries(
+    mins: np.ndarray, maxs: np.ndarray, cell_size: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """바운딩박스들이 걸치는 (박스 번호 (M,), 격자 칸 (M, 2)) 쌍"""
+    lo = np.floor(mins / cell_size).astype(np.int64)
+    hi = np.floor(maxs / cell_size).astype(np.int64)
+
+    ids, keys_i, keys_j = [], [], []
+    span = hi - lo
+    for di in range(int(span[:, 0].max()) + 1):
+        for dj in range(int(span[:, 1].max()) + 1):
+            idx = np.flatnonzero((span[:, 0] >= di) & (span[:, 1] >= dj))
+            ids.append(idx)
+            keys_i.append(lo[idx, 0] + di)
+            keys_j.append(lo[idx, 1] + dj)
+    return np.concatenate(ids), np.column_stack(
+        [np.concatenate(keys_i), np.concatenate(keys_j)]
+    )
+
+
+def get_dist_pt_to_stalls(pt: np.ndarray, corners: np.ndarray) -> np.ndarray:
+    """점과 각 주차칸 경계(네 변) 사이의 거리 (N,)"""
+    pt = np.asarray(pt, dtype=float)
+    seg_a = corners
+    seg_b = np.roll(corners, -1, axis=1)
+    edge = seg_b - seg_a
+    length_sq = np.einsum("nkd,nkd->nk", edge, edge)
+    t = np.einsum("nkd,nkd->nk", pt - seg_a, edge) / np.where(
+        length_sq == 0, 1, length_sq
+    )
+    t = np.clip(t, 0.0, 1.0)
+    closest = seg_a + edge * t[..., None]
+    return np.linalg.norm(closest - pt, axis=2).min(axis=1)
+
+
+def get_entrance_mask(
+    corners: np.ndarray,
+    entrance_pt: np.ndarray,
+    clearance: float,
+    index: Optional[StallIndex] = None,
+) -> np.ndarray:
+    """진입점에서 경계까지 거리가 clearance 이하인 주차칸을 제외하는 마스크
+
+    격자 인덱스로 진입점 주변 주차칸만 거리 계산을 하므로 O(주변 주차칸 수).
+    """
+    keep = np.ones(len(corners), dtype=bool)
+    if not len(corners):
+        return keep
+
+    index = index or StallIndex(corners)
+    # 반올림 후 비교하므로 질의 반경을 조금 넉넉하게 잡는다
+    nearby = index.query_radius(
+        entrance_pt, clearance + math.pow(10, -ROUNDING_PRECISION)
+    )
+    if not len(nearby):
+        return keep
+
+    dists = np.round(
+        get_dist_pt_to_stalls(entrance_pt, corners[nearby]), ROUNDING_PRECISION
+    )
+    keep[nearby[dists <= clearance]] = False
+    return keep
+
+
+def _cross(o: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (
+        a[..., 1] - o[..., 1]
+    ) * (b[..., 0] - o[..., 0])
+
+
+def get_winding_numbers(points: np.ndarray, ring: np.ndarray) -> np.ndarray:
+    """점들의 다각형에 대한 winding number (M,) - 0이 아니면 내부"""
+    a = ring[None, :, :]
+    b = np.roll(ring, -1, axis=0)[None, :, :]
+    p = points[:, None, :]
+    is_left = _cross(a, b, p)
+    upward = (a[..., 1] <= p[..., 1]) & (b[..., 1] > p[..., 1]) & (is_left > 0)
+    downward = (a[..., 1] > p[..., 1]) & (b[..., 1] <= p[..., 1]) & (is_left < 0)
+    return upward.sum(axis=1) - downward.sum(axis=1)
+
+
+def get_dist_pts_to_segments(
+    points: np.ndarray, seg_a: np.ndarray, seg_b: np.ndarray
+) -> np.ndarray:
+    """점(M)과 선분(K) 사이 거리 행렬 (M, K)"""
+    edge = seg_b - seg_a
+    length_sq = np.einsum("kd,kd->k", edge, edge)
+    rel = points[:, None, :] - seg_a[None, :, :]
+    t = np.einsum("mkd,kd->mk", rel, edge) / np.where(length_sq == 0, 1, length_sq)
+    t = np.clip(t, 0.0, 1.0)
+    return np.linalg.norm(rel - edge[None] * t[..., None], axis=2)
+
+
+def get_crossing_mask(
+    seg_a: np.ndarray, seg_b: np.ndarray, other_a: np.ndarray, other_b: np.ndarray
+) -> np.ndarray:
+    """선분들(M)이 다른 선분들(K) 중 하나라도 관통하는지 (M,)"""
+    a1, a2 = seg_a[:, None, :], seg_b[:, None, :]
+    b1, b2 = other_a[None, :, :], other_b[None, :, :]
+    d1 = _cross(b1, b2, a1)
+    d2 = _cross(b1, b2, a2)
+    d3 = _cross(a1, a2, b1)
+    d4 = _cross(a1, a2, b2)
+    straddle_a = ((d1 > 0) & (d2 < 0)) | ((d1 < 0) & (d2 > 0))
+    straddle_b = ((d3 > 0) & (d4 < 0)) | ((d3 < 0) & (d4 > 0))
+    return (straddle_a & straddle_b).any(axis=1)
+
+
+def get_inside_ring_mask(
+    corners: np.ndarray, ring: np.ndarray, tol: float = 0.01, chunk_size: int = 2048
+) -> np.ndarray:
+    """주차칸이 다각형 내부에 완전히 들어가는지 (N,)
+
+    PlanarClosedCurveRelationship의 AInsideB와 같이 경계가 tol 이내로
+    닿거나 교차하는 경우는 내부로 보지 않는다.
+    1. 네 꼭짓점의 winding number가 모두 0이 아니고
+    2. 꼭짓점과 다각형 경계, 다각형 꼭짓점과 주차칸 경계가 tol보다 멀고
+    3. 주차칸 변과 다각형 변이 교차하지 않아야 한다.
+    """
+    inside = np.zeros(len(corners), dtype=bool)
+    if not len(corners):
+        return inside
+
+    # 다각형 바운딩박스 안에 있는 주차칸만 검사
+    lo, hi = ring.min(axis=0) - tol, ring.max(axis=0) + tol
+    candidates = np.flatnonzero(
+        np.all(corners.min(axis=1) >= lo, axis=1)
+        & np.all(corners.max(axis=1) <= hi, axis=1)
+    )
+
+    ring_b = np.roll(ring, -1, axis=0)
+    for start in range(0, len(candidates), chunk_size):
+        idx = candidates[start : start + chunk_size]
+        quads = corners[idx]
+        pts = quads.reshape(-1, 2)
+
+        ok = (get_winding_numbers(pts, ring) != 0).reshape(-1, 4).all(axis=1)
+        ok &= (
+            (get_dist_pts_to_segments(pts, ring, ring_b).min(axis=1) > tol)
+            .reshape(-1, 4)
+            .all(axis=1)
+        )
+
+        edges_a = pts
+        edges_b = np.roll(quads, -1, axis=1).reshape(-1, 2)
+        ok &= (
+            ~get_crossing_mask(edges_a, edges_b, ring, ring_b)
+            .reshape(-1, 4)
+            .any(axis=1)
+        )
+        ok &= (
+            (get_dist_pts_to_segments(ring, edges_a, edges_b) > tol)
+            .reshape(len(ring), -1, 4)
+            .all(axis=(0, 2))
+        )
+
+        inside[idx] = ok
+    return inside
+
+
+def get_inside_mask(
+    corners: np.ndarray, rings: Sequence[np.ndarray], tol: float = 0.01
+) -> np.ndarray:
+    """주차칸이 다각형들 중 하나의 내부에 완전히 들어가는지 (N,)"""
+    inside = np.zeros(len(corners), dtype=bool)
+    for ring in rings:
+        remaining = np.flatnonzero(~inside)
+        if not len(remaining):
+            break
+        inside[remaining] = get_inside_ring_mask(corners[remaining], ring, tol)
+    return inside
@@ -0,0 +1,140 @@
+"""주차칸 겹침 검사와 우선순위 정리
+
+1. broad phase: 바운딩박스 구간을 한 축으로 정렬하는 sweep-and-prune (O(n log n + 후보 쌍))
+2. narrow phase: 회전된 사각형의 분리축(SAT) 검사
+3. 정리: 겹치는 쌍에서 우선순위가 낮은 주차칸을 제거
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+EMPTY_PAIRS = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+
+def sweep_and_prune(
+    mins: np.ndarray, maxs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """바운딩박스 (N, 2)가 겹치는 (i, j) 쌍 (i < j)
+
+    박스 중심이 더 넓게 퍼진 축으로 시작 좌표를 정렬하고, 각 박스의 끝 좌표보다
+    앞에서 시작하는 뒤쪽 박스들만 후보로 삼은 뒤 다른 축 구간을 확인한다.
+    """
+    n = len(mins)
+    if n < 2:
+        return EMPTY_PAIRS
+
+    centers = (mins + maxs) / 2
+    axis = int(np.argmax(centers.var(axis=0)))
+    other = 1 - axis
+
+    order = np.argsort(mins[:, axis], kind="stable")
+    starts = mins[order, axis]
+    ends = np.searchsorted(starts, maxs[order, axis], side="right")
+    counts = np.maximum(ends - np.arange(n) - 1, 0)
+    total = int(counts.sum())
+    if not total:
+        return EMPTY_PAIRS
+
+    # 정렬 순서 기준으로 (k, k+1 .. ends[k]-1) 쌍을 펼친다
+    first = np.repeat(np.arange(n), counts)
+    step = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + 1 + step
+    i, j = order[first], order[second]
+
+    keep = (mins[i, other] <= maxs[j, other]) & (mins[j, other] <= maxs[i, other])
+    i, j = i[keep], j[keep]
+    return np.minimum(i, j), np.maximum(i, j)
+
+
+def get_bbox_pairs(
+    corners_a: np.ndarray, corners_b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """두 주차칸 집합 사이에서 바운딩박스가 겹치는 (a 번호, b 번호) 쌍"""
+    if not len(corners_a) or not len(corners_b):
+        return EMPTY_PAIRS
+    corners = np.concatenate([corners_a, corners_b])
+    i, j = sweep_and_prune(corners.min(axis=1), corners.max(axis=1))
+
+    # i < j 이므로 서로 다른 집합의 쌍은 i가 a, j가 b
+    n_a = len(corners_a)
+    cross = (i < n_a) & (j >= n_a)
+    return i[cross], j[cross] - n_a
+
+
+def get_quad_overlap_mask(
+    quads_a: np.ndarray, quads_b: np.ndarray, tol: float = 0.01
+) -> np.ndarray:
+    """볼록 사각형 쌍 (P, 4, 2)이 tol보다 깊게 겹치는지 (P,) - 분리축(SAT) 검사
+
+    두 사각형 변의 법선 8개에 투영한 구간이 하나라도 tol 이상 겹치지 않으면
+    분리된 것으로 본다 (변이 맞닿은 이웃 주차칸은 겹치지 않음).
+    """
+    if not len(quads_a):
+        return np.zeros(0, dtype=bool)
+    edges = np.concatenate(
+        [
+            np.roll(quads_a, -1, axis=1) - quads_a,
+            np.roll(quads_b, -1, axis=1) - quads_b,
+        ],
+        axis=1,
+    )
+    axes = np.stack([-edges[..., 1], edges[..., 0]], axis=-1)
+    norms = np.linalg.norm(axes, axis=-1, keepdims=True)
+    axes = axes / np.where(norms == 0, 1, norms)
+
+    proj_a = np.einsum("pkd,pad->pka", quads_a, axes)
+    proj_b = np.einsum("pkd,pad->pka", quads_b, axes)
+    separated = (proj_a.max(axis=1) <= proj_b.min(axis=1) + tol) | (
+        proj_b.max(axis=1) <= proj_a.min(axis=1) + tol
+    )
+    return ~separated.any(axis=1)
+
+
+def find_overlaps(
+    corners: np.ndarray, tol: float = 0.01
+) -> Tuple[np.ndarray, np.ndarray]:
+    """한 주차칸 집합 안에서 겹치는 (i, j) 쌍 (i < j)"""
+    if len(corners) < 2:
+        return EMPTY_PAIRS
+    i, j = sweep_and_prune(corners.min(axis=1), corners.max(axis=1))
+    hit = get_quad_overlap_mask(corners[i], corners[j], tol)
+    return i[hit], j[hit]
+
+
+def find_cross_overlaps(
+    corners_a: np.ndarray, corners_b: np.ndarray, tol: float = 0.01
+) -> Tuple[np.ndarray, np.ndarray]:
+    """두 주차칸 집합 사이에서 겹치는 (a 번호, b 번호) 쌍"""
+    i, j = get_bbox_pairs(corners_a, corners_b)
+    hit = get_quad_overlap_mask(corners_a[i], corners_b[j], tol)
+    return i[hit], j[hit]
+
+
+def resolve_overlaps(
+    corners: np.ndarray, priorities: Optional[np.ndarray] = None, tol: float = 0.01
+) -> np.ndarray:
+    """겹치는 주차칸 중 우선순위가 높은 것만 남기는 마스크 (N,)
+
+    우선순위가 높은 주차칸부터(같으면 번호가 작은 것부터) 차례로 남기며,
+    이미 남긴 주차칸과 겹치는 주차칸은 제거한다. 겹침이 없는 주차칸은 그대로 남는다.
+    """
+    keep = np.ones(len(corners), dtype=bool)
+    i, j = find_overlaps(corners, tol)
+    if not len(i):
+        return keep
+    if priorities is None:
+        priorities = np.zeros(len(corners))
+
+    conflicted = np.unique(np.concatenate([i, j]))
+    neighbors = {int(k): [] for k in conflicted}
+    for a, b in zip(i.tolist(), j.tolist()):
+        neighbors[a].append(b)
+        neighbors[b].append(a)
+
+    order = conflicted[np.lexsort((conflicted, -np.asarray(priorities)[conflicted]))]
+    for k in order.tolist():
+        if not keep[k]:
+            continue
+        for other in neighbors[k]:
+            keep[other] = False
+    return keep
@@ -0,0 +1,342 @@
+"""주차장 설계 규칙과 주차칸 배열 일괄 검증
+
+ParkingRules 하나로 주차칸 형식(크기), 주차 각도, 차로 폭, 형식별 최소 대수를 묶어
+01_parking_design.py의 상수(CELL_WIDTH, CELL_LENGTH, ROAD_WIDTH, 5-5-6 패턴)를 대신한다.
+
+    rules = ParkingRules(STANDARD, angle=60, extra_types=[ACCESSIBLE.with_min_count(2)])
+    corners, type_ids = assign_stall_types(corners, rules, entrance_pt)
+    result = validate(corners, rules, region_ring, type_ids)
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lauslecture import clipping, planar
+from lauslecture.parking import filters, overlap, stalls
+
+ANGLES = (0.0, 45.0, 60.0, 90.0)
+# 주차 각도별 차로 폭 (주차장법 시행규칙, 출입구가 1개인 경우)
+AISLE_WIDTHS = {0.0: 3.5, 45.0: 5.0, 60.0: 5.5, 90.0: 6.0}
+
+
+class StallType:
+    """주차칸 형식 (크기와 최소 대수)"""
+
+    def __init__(
+        self, name: str, width: float, length: float, min_count: int = 0
+    ) -> None:
+        self.name = name
+        self.width = width
+        self.length = length
+        self.min_count = min_count
+
+    def with_min_count(self, min_count: int) -> "StallType":
+        return StallType(self.name, self.width, self.length, min_count)
+
+    def __repr__(self) -> str:
+        return "StallType({}, {}x{}, min={})".format(
+            self.name, self.width, self.length, self.min_count
+        )
+
+
+# 주차장법 시행규칙의 주차단위구획
+STANDARD = StallType("standard", 2.5, 5.0)  # 일반형
+EXTENDED = StallType("extended", 2.6, 5.2)  # 확장형
+COMPACT = StallType("compact", 2.0, 3.6)  # 경형
+ACCESSIBLE = StallType("accessible", 3.3, 5.0)  # 장애인전용
+PARALLEL = StallType("parallel", 2.0, 6.0)  # 평행주차 일반형
+
+STALL_TYPES = {t.name: t for t in (STANDARD, EXTENDED, COMPACT, ACCESSIBLE, PARALLEL)}
+
+
+class ParkingRules:
+    """주차장 설계 규칙
+
+    Args:
+        stall_type: 배치에 사용하는 기본 주차칸 형식
+        angle: 주차 각도 (ANGLES 중 하나)
+        aisle_width: 차로 폭 (None이면 AISLE_WIDTHS에서 각도로 결정)
+        extra_types: 기본 주차칸 일부를 바꿔 확보할 형식들 (min_count 사용)
+        boundary_clearance: 주차칸과 대지 경계 사이 최소 이격거리
+        tol: 허용 오차
+    """
+
+    def __init__(
+        self,
+        stall_type: StallType = STANDARD,
+        angle: float = 90.0,
+        aisle_width: Optional[float] = None,
+        extra_types: Sequence[StallType] = (),
+        boundary_clearance: float = 0.0,
+        tol: float = 0.01,
+    ) -> None:
+        angle = float(angle)
+        if angle not in ANGLES:
+            raise ValueError(
+                "Unsupported parking angle: {} (choose from {})".format(angle, ANGLES)
+            )
+        self.stall_type = stall_type
+        self.angle = angle
+        self.aisle_width = AISLE_WIDTHS[angle] if aisle_width is None else aisle_width
+        self.extra_types = list(extra_types)
+        self.boundary_clearance = boundary_clearance
+        self.tol = tol
+
+    @property
+    def width(self) -> float:
+        return self.stall_type.width
+
+    @property
+    def length(self) -> float:
+        return self.stall_type.length
+
+    @property
+    def row_depth(self) -> float:
+        """차로에 수직 방향으로 잰 주차칸 열의 깊이"""
+        return stalls.get_row_depth(self.width, self.length, self.angle)
+
+    @property
+    def pattern(self) -> Tuple[float, float, float]:
+        """내부 영역 패턴: 주차칸 열, 주차칸 열(등을 맞댐), 차로"""
+        return (self.row_depth, self.row_depth, self.aisle_width)
+
+    @property
+    def stall_types(self) -> List[StallType]:
+        """type_ids 순서의 형식 리스트 (0번이 기본 형식)"""
+        return [self.stall_type] + self.extra_types
+
+    @property
+    def key(self) -> tuple:
+        """캐시 키 (규칙이 같으면 같은 값)"""
+        return (
+            self.width,
+            self.length,
+            self.angle,
+            self.aisle_width,
+            tuple((t.name, t.width, t.length, t.min_count) for t in self.extra_types),
+            self.boundary_clearance,
+            self.tol,
+        )
+
+    def __repr__(self) -> str:
+        return "ParkingRules({}, angle={}, aisle={})".format(
+            self.stall_type.name, self.angle, self.aisle_width
+        )
+
+
+# ================ 형식 배정 ================
+
+
+def resize_stalls(corners: np.ndarray, width: float, length: float) -> np.ndarray:
+    """주차칸을 기준점(0번 꼭짓점)과 방향은 유지한 채 width x length로 바꾼다"""
+    base = corners[:, 0]
+    width_vec = corners[:, 1] - base
+    length_vec = corners[:, 3] - base
+    return stalls.get_stall_corners(base, length_vec, width_vec, length, width)
+
+
+def assign_stall_types(
+    corners: np.ndarray, rules: ParkingRules, entrance_pt: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """진입점에 가까운 주차칸부터 extra_types의 min_count만큼 형식을 바꾼다
+
+    크기를 바꾼 주차칸끼리는 겹치지 않도록 이미 바꾼 주차칸과 겹치는 후보는 건너뛴다.
+    (바뀐 주차칸과 겹치는 기본 주차칸은 overlap.resolve_overlaps에서 정리)
+
+    Returns:
+        (형식에 맞게 크기를 바꾼 주차칸 배열, 주차칸별 rules.stall_types 번호 (N,))
+    """
+    type_ids = np.zeros(len(corners), dtype=np.int64)
+    if not len(corners) or not rules.extra_types:
+        return corners, type_ids
+
+    corners = corners.copy()
+    dists = filters.get_dist_pt_to_stalls(np.asarray(entrance_pt, dtype=float), corners)
+    order = iter(np.argsort(dists, kind="stable").tolist())
+    assigned = []  # type: List[np.ndarray]
+    for type_id, stall_type in enumerate(rules.extra_types, start=1):
+        count = 0
+        while count < stall_type.min_count:
+            i = next(order, None)
+            if i is None:
+                break
+            resized = resize_stalls(
+                corners[i : i + 1], stall_type.width, stall_type.length
+            )
+            if assigned:
+                others = np.stack(assigned)
+                candidate = np.repeat(resized, len(others), axis=0)
+                if overlap.get_quad_overlap_mask(candidate, others, rules.tol).any():
+                    continue
+            corners[i] = resized[0]
+            type_ids[i] = type_id
+            assigned.append(resized[0])
+            count += 1
+    return corners, type_ids
+
+
+# ================ 검증 ================
+
+
+class ValidationResult:
+    """주차칸별 검증 결과 (각 마스크는 True가 조건 만족)"""
+
+    def __init__(
+        self,
+        no_overlap: np.ndarray,
+        has_aisle: np.ndarray,
+        in_boundary: np.ndarray,
+        type_ids: np.ndarray,
+        stall_types: List[StallType],
+    ) -> None:
+        self.no_overlap = no_overlap
+        self.has_aisle = has_aisle
+        self.in_boundary = in_boundary
+        self.type_ids = type_ids
+        self.stall_types = stall_types
+
+    @property
+    def valid(self) -> np.ndarray:
+        return self.no_overlap & self.has_aisle & self.in_boundary
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """형식별 유효 주차칸 수"""
+        valid_ids = self.type_ids[self.valid]
+        return {
+            t.name: int(np.count_nonzero(valid_ids == i))
+            for i, t in enumerate(self.stall_types)
+        }
+
+    @property
+    def shortages(self) -> Dict[str, int]:
+        """최소 대수에 못 미치는 형식과 부족한 대수"""
+        counts = self.counts
+        return {
+            t.name: t.min_count - counts[t.name]
+            for t in self.stall_types
+            if counts[t.name] < t.min_count
+        }
+
+    @property
+    def is_valid(self) -> bool:
+        return bool(self.valid.all()) and not self.shortages
+
+    def summary(self) -> str:
+        lines = [
+            "stalls: {} valid / {}".format(int(self.valid.sum()), len(self.valid)),
+            "overlap: {}, no aisle: {}, boundary: {}".format(
+                int((~self.no_overlap).sum()),
+                int((~self.has_aisle).sum()),
+                int((~self.in_boundary).sum()),
+            ),
+        ]
+        for name, count in self.counts.items():
+            lines.append("{}: {}".format(name, count))
+        for name, shortage in self.shortages.items():
+            lines.append("{}: {} short".format(name, shortage))
+        return "\n".join(lines)
+
+
+def get_overlap_mask(corners: np.ndarray, tol: float = 0.01) -> np.ndarray:
+    """다른 주차칸과 겹치는 주차칸 (N,)"""
+    mask = np.zeros(len(corners), dtype=bool)
+    pair_a, pair_b = overlap.find_overlaps(corners, tol)
+    mask[pair_a] = True
+    mask[pair_b] = True
+    return mask
+
+
+def get_aisle_strips(
+    corners: np.ndarray, aisle_width: float, parallel: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """주차칸 양쪽 진입 변 앞의 차로 띠 (앞쪽: 0-1번 변, 뒤쪽: 3-2번 변)
+
+    평행 주차는 긴 변으로 진입하므로 꼭짓점 순서를 돌려 긴 변 앞의 띠를 만든다.
+    """
+    if parallel:
+        corners = np.roll(corners, -1, axis=1)
+    length_vec = corners[:, 3] - corners[:, 0]
+    length_vec = length_vec / np.linalg.norm(length_vec, axis=1, keepdims=True)
+    offset = length_vec[:, None, :] * aisle_width
+
+    front = np.empty_like(corners)
+    front[:, 0] = corners[:, 0] - offset[:, 0]
+    front[:, 1] = corners[:, 1] - offset[:, 0]
+    front[:, 2] = corners[:, 1]
+    front[:, 3] = corners[:, 0]
+
+    back = np.empty_like(corners)
+    back[:, 0] = corners[:, 3]
+    back[:, 1] = corners[:, 2]
+    back[:, 2] = corners[:, 2] + offset[:, 0]
+    back[:, 3] = corners[:, 3] + offset[:, 0]
+    return front, back
+
+
+def get_clear_strip_mask(
+    strips: np.ndarray,
+    corners: np.ndarray,
+    boundaries: Sequence[np.ndarray],
+    tol: float,
+) -> np.ndarray:
+    """차로 띠가 대지 안에 있고 어떤 주차칸과도 겹치지 않는지 (N,)"""
+    clear = filters.get_inside_mask(strips, boundaries, 0.0)
+    pair_a, _ = overlap.find_cross_overlaps(strips, corners, tol)
+    clear[pair_a] = False
+    return clear
+
+
+def get_boundary_rings(region_ring: np.ndarray, distance: float) -> List[np.ndarray]:
+    """대지 경계를 distance만큼 offset한 검사용 경계들 (양수: 바깥쪽)
+
+    miter offset이 갈라지거나 스스로 교차하면 불리언 offset으로 계산한다
+    (backends.python.Backend.offset과 같은 방식). 영역이 사라지면 빈 리스트.
+    """
+    vertices = [tuple(pt) for pt in region_ring]
+    ring = planar.offset_ring(vertices, distance)
+    if ring is not None:
+        return [np.array(ring)]
+    return [
+        np.array(polygon.outer) for polygon in clipping.offset([vertices], distance)
+    ]
+
+
+def validate(
+    corners: np.ndarray,
+    rules: ParkingRules,
+    region_ring: np.ndarray,
+    type_ids: Optional[np.ndarray] = None,
+) -> ValidationResult:
+    """모든 주차칸을 배열 연산으로 한 번에 검증
+
+    1. 겹침: 다른 주차칸과 tol보다 깊게 겹치지 않을 것 (sweep-and-prune + SAT)
+    2. 차로: 짧은 변 중 하나 앞에 차로 폭만큼의 띠가 대지 안에 비어 있을 것
+    3. 경계: 대지 경계에서 boundary_clearance 이상 떨어져 대지 안에 있을 것
+    """
+    corners = np.asarray(corners, dtype=float)
+    if type_ids is None:
+        type_ids = np.zeros(len(corners), dtype=np.int64)
+    if not len(corners):
+        empty = np.zeros(0, dtype=bool)
+        return ValidationResult(empty, empty, empty, type_ids, rules.stall_types)
+
+    region_ring = stalls.as_ring(region_ring)
+    tol = rules.tol
+
+    # 경계에 맞닿은 주차칸도 통과하도록 검사용 경계를 tol만큼 넓힌다
+    inflated = get_boundary_rings(region_ring, tol)
+    clearance_rings = get_boundary_rings(region_ring, tol - rules.boundary_clearance)
+    in_boundary = filters.get_inside_mask(corners, clearance_rings, 0.0)
+
+    front, back = get_aisle_strips(corners, rules.aisle_width, rules.angle == 0)
+    has_aisle = get_clear_strip_mask(front, corners, inflated, tol)
+    has_aisle |= get_clear_strip_mask(back, corners, inflated, tol)
+
+    return ValidationResult(
+        ~get_overlap_mask(corners, tol),
+        has_aisle,
+        in_boundary,
+        type_ids,
+        rules.stall_types,
+    )
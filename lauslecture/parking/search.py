@@ -0,0 +1,232 @@
+"""내부 주차칸 배치 최적화 탐색
+
+축(영역의 모든 변 방향 + 각도 스윕), 패턴 위상(시작 여백), 차로 위치(패턴 회전)의
+조합을 평가하여 유효한 주차칸이 가장 많은 배치를 찾는다.
+평가 전에 주차칸 수의 상한을 계산해 현재 최고 기록을 넘을 수 없는 후보는 건너뛴다.
+"""
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lauslecture import primitives
+from lauslecture.parking import filters, stalls
+
+
+class LayoutCandidate:
+    """탐색 후보 하나 (축, 위상, 패턴)와 평가 결과"""
+
+    def __init__(
+        self,
+        origin: np.ndarray,
+        x_axis: np.ndarray,
+        phase: Optional[float],
+        pattern: Tuple[float, ...],
+        label: str,
+    ) -> None:
+        self.origin = origin
+        self.x_axis = x_axis
+        self.phase = phase
+        self.pattern = pattern
+        self.label = label
+        self.upper_bound = 0
+        self.count = None  # type: Optional[int]
+        self.stalls = stalls.EMPTY_STALLS
+        self.pruned = False
+
+    @property
+    def angle(self) -> float:
+        """축 방향 각도 (도, 0~180)"""
+        return math.degrees(math.atan2(self.x_axis[1], self.x_axis[0])) % 180
+
+    def __repr__(self) -> str:
+        return (
+            "LayoutCandidate({}, angle={:.1f}, phase={}, pattern={}, count={})".format(
+                self.label, self.angle, self.phase, self.pattern, self.count
+            )
+        )
+
+
+class SearchResult:
+    """탐색 결과: 최적 배치와 평가 순위 리스트 (가지치기된 후보는 뒤쪽)"""
+
+    def __init__(self, best: Optional[LayoutCandidate], ranked: List[LayoutCandidate]):
+        self.best = best
+        self.ranked = ranked
+
+    @property
+    def evaluated_count(self) -> int:
+        return sum(1 for c in self.ranked if not c.pruned)
+
+
+def get_candidate_axes(
+    ring: np.ndarray, angle_step: float = 5.0
+) -> List[Tuple[np.ndarray, np.ndarray, str]]:
+    """후보 축: 기준 영역의 모든 변 방향 + angle_step(도) 간격 각도 스윕"""
+    axes = []
+    segments = primitives.SegmentArray.from_vertices(ring)
+    directions = segments.directions
+    for i in np.flatnonzero(segments.lengths > 0):
+        axes.append((segments.starts[i], directions[i], "edge{}".format(i)))
+
+    if angle_step:
+        for angle in np.arange(0.0, 180.0, angle_step):
+            rad = math.radians(angle)
+            axes.append((ring[0], np.array([math.cos(rad), math.sin(rad)]), "sweep"))
+    return axes
+
+
+def get_pattern_rotations(pattern: Sequence[float]) -> List[Tuple[float, ...]]:
+    """패턴 회전 (차로 위치 변경): (5, 5, 6) -> (5, 5, 6), (5, 6, 5), (6, 5, 5)"""
+    rotations = []
+    for i in range(len(pattern)):
+        rotation = tuple(pattern[i:]) + tuple(pattern[:i])
+        if rotation not in rotations:
+            rotations.append(rotation)
+    return rotations
+
+
+def get_upper_bound(
+    rings: Sequence[np.ndarray],
+    candidate: LayoutCandidate,
+    width: float,
+    length: float,
+    angle: float = 90.0,
+) -> int:
+    """필터링 전 생성될 주차칸 수 (실제 유효 주차칸 수의 상한)"""
+    depth = stalls.get_row_depth(width, length, angle)
+    bound = 0
+    for ring in rings:
+        _, _, lo, hi = stalls.get_axis_frame(ring, candidate.origin, candidate.x_axis)
+        short_length, long_length = sorted(hi - lo)
+        pattern = stalls.get_pattern_list(
+            long_length, candidate.pattern, candidate.phase
+        )
+        rows = sum(1 for v in pattern if depth - stalls.TOL < v < depth + stalls.TOL)
+        bound += rows * stalls.get_stall_count(short_length, width, length, angle)
+    return bound
+
+
+def evaluate_candidate(
+    rings: Sequence[np.ndarray],
+    candidate: LayoutCandidate,
+    width: float,
+    length: float,
+    tol: float = 0.01,
+    angle: float = 90.0,
+) -> Tuple[int, np.ndarray]:
+    """후보 배치로 주차칸을 생성하고 내부 영역 조건을 만족하는 주차칸만 남긴다"""
+    generated = [
+        stalls.get_stalls_from_inside_ring(
+            ring,
+            candidate.origin,
+            candidate.x_axis,
+            width,
+            length,
+            candidate.pattern,
+            candidate.phase,
+            angle,
+        )
+        for ring in rings
+    ]
+    corners = np.concatenate(generated) if generated else stalls.EMPTY_STALLS
+    valid = corners[filters.get_inside_mask(corners, rings, tol)]
+    return len(valid), valid
+
+
+def _evaluate_job(args) -> Tuple[int, np.ndarray]:
+    return evaluate_candidate(*args)
+
+
+def create_executor(workers: int, executor: str) -> Optional[Executor]:
+    if workers <= 1:
+        return None
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def search_layouts(
+    rings: Sequence[np.ndarray],
+    width: float = 2.5,
+    length: float = 5.0,
+    pattern: Sequence[float] = stalls.PATTERN_VALUES,
+    axis_ring: Optional[np.ndarray] = None,
+    angle_step: float = 5.0,
+    phase_count: int = 4,
+    workers: int = 1,
+    executor: str = "process",
+    tol: float = 0.01,
+    angle: float = 90.0,
+) -> SearchResult:
+    """내부 영역들(rings)에 대해 주차칸 수가 최대인 배치를 탐색
+
+    Args:
+        rings: 주차칸을 채울 내부 영역들 (K, 2) 배열 리스트
+        axis_ring: 후보 축을 뽑을 영역 (기본: 첫 번째 내부 영역)
+        angle_step: 각도 스윕 간격(도), 0이면 변 방향만 사용
+        phase_count: 패턴 시작 여백 후보 개수 (중앙 정렬 포함)
+        workers: 병렬 작업 수 (1이면 순차 실행)
+        executor: "process" (배치 노드) 또는 "thread" (Rhino 내부)
+        angle: 주차 각도 (pattern은 이 각도의 주차칸 열 깊이로 구성)
+
+    Returns:
+        SearchResult
+    """
+    rings = [np.asarray(ring, dtype=float) for ring in rings]
+    if not rings:
+        return SearchResult(None, [])
+    axis_ring = rings[0] if axis_ring is None else np.asarray(axis_ring, dtype=float)
+
+    # 1. 후보 생성: 축 x 패턴 회전 x 위상 (None = 중앙 정렬)
+    phases = [None] + [
+        sum(pattern) * i / phase_count for i in range(max(phase_count - 1, 0))
+    ]
+    candidates = []
+    for origin, x_axis, label in get_candidate_axes(axis_ring, angle_step):
+        for rotation in get_pattern_rotations(pattern):
+            for phase in phases:
+                candidate = LayoutCandidate(origin, x_axis, phase, rotation, label)
+                candidate.upper_bound = get_upper_bound(
+                    rings, candidate, width, length, angle
+                )
+                candidates.append(candidate)
+
+    # 2. 상한이 큰 후보부터 평가하고, 최고 기록을 넘을 수 없는 후보는 가지치기
+    candidates.sort(key=lambda c: c.upper_bound, reverse=True)
+    pool = create_executor(workers, executor)
+    batch_size = max(workers, 1) * 2
+    best_count = 0
+    try:
+        i = 0
+        while i < len(candidates):
+            batch = [
+                c for c in candidates[i : i + batch_size] if c.upper_bound > best_count
+            ]
+            for c in candidates[i : i + batch_size]:
+                c.pruned = c.upper_bound <= best_count
+            i += batch_size
+            if not batch:
+                # 정렬되어 있으므로 이후 후보도 모두 가지치기 대상
+                for c in candidates[i:]:
+                    c.pruned = True
+                break
+
+            jobs = [(rings, c, width, length, tol, angle) for c in batch]
+            results = (
+                pool.map(_evaluate_job, jobs) if pool else map(_evaluate_job, jobs)
+            )
+            for candidate, (count, valid) in zip(batch, results):
+                candidate.count = count
+                candidate.stalls = valid
+                best_count = max(best_count, count)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    evaluated = [c for c in candidates if not c.pruned]
+    evaluated.sort(key=lambda c: c.count, reverse=True)
+    pruned = [c for c in candidates if c.pruned]
+    best = evaluated[0] if evaluated else None
+    return SearchResult(best, evaluated + pruned)
@@ -0,0 +1,250 @@
+"""주차칸 꼭짓점 배열 생성기
+
+angle은 주차칸 긴 변과 차로(주차칸 열의 기준선)가 이루는 각도(도)이다.
+90이면 직각 주차, 0이면 평행 주차.
+"""
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lauslecture import primitives
+
+TOL = 0.01
+PATTERN_VALUES = (5.0, 5.0, 6.0)  # 주차칸 길이, 주차칸 길이, 차로 폭
+EMPTY_STALLS = np.zeros((0, 4, 2))
+
+
+def as_ring(points: Sequence[Sequence[float]]) -> np.ndarray:
+    """꼭짓점 리스트를 (K, 2) 배열로 변환 (닫는 점이 반복되면 제거)"""
+    ring = np.asarray(points, dtype=float)[:, :2]
+    if len(ring) > 1 and np.allclose(ring[0], ring[-1]):
+        ring = ring[:-1]
+    return ring
+
+
+def get_signed_area(ring: np.ndarray) -> float:
+    """다각형의 부호 있는 면적 (반시계 방향이면 양수)"""
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def get_stall_corners(
+    base_pts: np.ndarray,
+    x_vec: np.ndarray,
+    y_vec: np.ndarray,
+    x_dist: float,
+    y_dist: float,
+) -> np.ndarray:
+    """기준점들에서 x_vec 방향 x_dist, y_vec 방향 y_dist 크기의 사각형 꼭짓점 생성
+
+    x_vec, y_vec는 (2,) 또는 기준점마다 하나씩인 (N, 2) 배열.
+    """
+    x_vec = np.asarray(x_vec, dtype=float)
+    y_vec = np.asarray(y_vec, dtype=float)
+    x_off = x_vec / np.linalg.norm(x_vec, axis=-1, keepdims=True) * x_dist
+    y_off = y_vec / np.linalg.norm(y_vec, axis=-1, keepdims=True) * y_dist
+
+    base_pts = np.asarray(base_pts, dtype=float)
+    corners = np.empty((len(base_pts), 4, 2))
+    corners[:, 0] = base_pts
+    corners[:, 1] = base_pts + y_off
+    corners[:, 2] = base_pts + y_off + x_off
+    corners[:, 3] = base_pts + x_off
+    return corners
+
+
+def get_row_depth(width: float, length: float, angle: float = 90.0) -> float:
+    """기준선에서 수직 방향으로 잰 주차칸 열의 깊이"""
+    rad = math.radians(angle)
+    return length * math.sin(rad) + width * math.cos(rad)
+
+
+def get_row_pitch(width: float, length: float, angle: float = 90.0) -> float:
+    """기준선 방향으로 이웃한 주차칸 사이 간격"""
+    if angle <= 0:
+        return length
+    return width / math.sin(math.radians(angle))
+
+
+def get_row_footprint(width: float, length: float, angle: float = 90.0) -> float:
+    """주차칸 하나가 기준선 방향으로 차지하는 길이"""
+    rad = math.radians(angle)
+    return width * math.sin(rad) + length * math.cos(rad)
+
+
+def get_stall_count(
+    segment_length: float, width: float, length: float, angle: float = 90.0
+) -> int:
+    """segment_length 길이의 기준선에 놓을 수 있는 주차칸 수"""
+    if angle >= 90:
+        return int(segment_length // width)
+    footprint = get_row_footprint(width, length, angle)
+    if segment_length < footprint:
+        return 0
+    return int((segment_length - footprint) // get_row_pitch(width, length, angle)) + 1
+
+
+def get_stalls_from_segment(
+    start: np.ndarray,
+    end: np.ndarray,
+    vec: np.ndarray,
+    width: float,
+    length: float,
+    angle: float = 90.0,
+) -> np.ndarray:
+    """선분을 따라 vec 방향 주차칸 생성
+
+    직각 주차는 width 간격, 경사 주차는 주차칸 긴 변이 선분과 angle을 이루도록
+    기울여 get_row_pitch 간격으로 놓는다. 모든 주차칸은 선분에서 vec 방향으로
+    get_row_depth 폭의 띠 안에 들어간다.
+    """
+    start = np.asarray(start, dtype=float)
+    tangent = np.asarray(end, dtype=float) - start
+    segment_length = float(np.linalg.norm(tangent))
+    num_cells = get_stall_count(segment_length, width, length, angle)
+    if num_cells < 1:
+        return EMPTY_STALLS
+
+    tangent /= segment_length
+    if angle >= 90:
+        base_pts = start + np.outer(np.arange(num_cells) * width, tangent)
+        return get_stall_corners(base_pts, vec, tangent, length, width)
+
+    normal = np.asarray(vec, dtype=float)
+    normal = normal / np.linalg.norm(normal)
+    rad = math.radians(angle)
+    length_vec = math.cos(rad) * tangent + math.sin(rad) * normal
+    width_vec = math.sin(rad) * tangent - math.cos(rad) * normal
+
+    # 폭 방향 변이 기준선 아래로 내려가지 않도록 기준점을 띠 안쪽으로 올린다
+    pitch = get_row_pitch(width, length, angle)
+    base_pts = start + width * math.cos(rad) * normal
+    base_pts = base_pts + np.outer(np.arange(num_cells) * pitch, tangent)
+    return get_stall_corners(base_pts, length_vec, width_vec, length, width)
+
+
+def get_outward_normals(ring: np.ndarray) -> np.ndarray:
+    """다각형 각 변의 바깥쪽 단위 법선 (K, 2), 길이가 0인 변은 (0, 0)"""
+    normals = primitives.SegmentArray.from_vertices(ring).normals
+    if get_signed_area(ring) < 0:
+        normals = -normals
+    return normals
+
+
+def get_stalls_from_outside(
+    offset_rings: Sequence[np.ndarray], width: float, length: float, angle: float = 90.0
+) -> np.ndarray:
+    """안쪽으로 주차칸 열 깊이만큼 offset된 영역의 각 변에서 바깥쪽을 향한 주차칸 생성"""
+    stalls = []
+    for ring in offset_rings:
+        segments = primitives.SegmentArray.from_vertices(ring)
+        normals = segments.normals
+        if get_signed_area(ring) < 0:
+            normals = -normals
+        for i in np.flatnonzero(segments.lengths // length >= 1):
+            stalls.append(
+                get_stalls_from_segment(
+                    segments.starts[i],
+                    segments.ends[i],
+                    normals[i],
+                    width,
+                    length,
+                    angle,
+                )
+            )
+    return np.concatenate(stalls) if stalls else EMPTY_STALLS
+
+
+def get_pattern_list(
+    total_length: float,
+    values: Sequence[float] = PATTERN_VALUES,
+    phase: Optional[float] = None,
+) -> List[float]:
+    """주차칸-주차칸-차로 반복 패턴과 양 끝 여백 리스트
+
+    phase가 None이면 남는 길이를 양 끝에 똑같이 나누고,
+    아니면 시작 여백을 phase로 두고(남는 길이 이내로 제한) 나머지를 끝에 둔다.
+    """
+    if total_length < min(values):
+        return []
+
+    pattern, pattern_sum = [], 0.0
+    i = 0
+    while pattern_sum + values[i % len(values)] <= total_length:
+        val = values[i % len(values)]
+        pattern.append(val)
+        pattern_sum += val
+        i += 1
+
+    remain = total_length - pattern_sum
+    if phase is None:
+        return [remain / 2] + pattern + [remain / 2]
+    start = min(max(phase, 0.0), remain)
+    return [start] + pattern + [remain - start]
+
+
+def get_axis_frame(
+    ring: np.ndarray, origin: np.ndarray, x_axis: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """축 좌표계에서 본 다각형의 바운딩박스
+
+    Returns:
+        (x 단위벡터, y 단위벡터, 최소 좌표(2,), 최대 좌표(2,)) - 좌표는 축 좌표계 기준
+    """
+    x_axis = np.asarray(x_axis, dtype=float)
+    x_axis = x_axis / np.linalg.norm(x_axis)
+    y_axis = np.array([-x_axis[1], x_axis[0]])
+    local = (ring - origin) @ np.column_stack([x_axis, y_axis])
+    return x_axis, y_axis, local.min(axis=0), local.max(axis=0)
+
+
+def get_stalls_from_inside_ring(
+    ring: np.ndarray,
+    origin: np.ndarray,
+    x_axis: np.ndarray,
+    width: float,
+    length: float,
+    pattern_values: Sequence[float] = PATTERN_VALUES,
+    phase: Optional[float] = None,
+    angle: float = 90.0,
+) -> np.ndarray:
+    """내부 영역의 축 방향 바운딩박스를 패턴에 따라 주차칸 열로 채운다
+
+    바운딩박스의 짧은 변을 긴 변 방향으로 패턴 길이만큼 옮겨가며,
+    주차칸 열 깊이 값 위치마다 짧은 변을 따라 한 줄씩 주차칸을 만든다.
+    """
+    depth = get_row_depth(width, length, angle)
+    origin = np.asarray(origin, dtype=float)
+    x_axis, y_axis, lo, hi = get_axis_frame(ring, origin, x_axis)
+    size_x, size_y = hi - lo
+
+    def to_world(u: float, v: float) -> np.ndarray:
+        return origin + u * x_axis + v * y_axis
+
+    if size_x > size_y:
+        # 짧은 변: 오른쪽 변(아래→위), 안쪽 방향은 -x
+        short_start, short_end = to_world(hi[0], lo[1]), to_world(hi[0], hi[1])
+        inward, long_length = -x_axis, size_x
+    else:
+        # 짧은 변: 아래 변(왼쪽→오른쪽), 안쪽 방향은 +y
+        short_start, short_end = to_world(lo[0], lo[1]), to_world(hi[0], lo[1])
+        inward, long_length = y_axis, size_y
+
+    stalls = []
+    moved = 0.0
+    for value in get_pattern_list(long_length, pattern_values, phase):
+        moved += value
+        if depth - TOL < value < depth + TOL:
+            shift = inward * moved
+            stalls.append(
+                get_stalls_from_segment(
+                    short_start + shift,
+                    short_end + shift,
+                    -inward,
+                    width,
+                    length,
+                    angle,
+                )
+            )
+    return np.concatenate(stalls) if stalls else EMPTY_STALLS
@@ -0,0 +1,553 @@
+"""Rhino 없이 동작하는 2D 평면 기하 함수들
+
+좌표는 (x, y) 튜플, 다각형(ring)은 닫는 점을 반복하지 않는 꼭짓점 리스트로 다룬다.
+"""
+import math
+from typing import List, Optional, Sequence, Tuple
+
+Point = Tuple[float, float]
+Ring = Sequence[Point]
+BBox = Tuple[float, float, float, float]  # (min_x, min_y, max_x, max_y)
+
+TOL = 0.001
+
+
+# ================ 다각형 속성 ================
+
+
+def get_signed_area(ring: Ring) -> float:
+    """다각형의 부호 있는 면적 (반시계 방향이면 양수)"""
+    area = 0.0
+    n = len(ring)
+    for i in range(n):
+        x1, y1 = ring[i]
+        x2, y2 = ring[(i + 1) % n]
+        area += x1 * y2 - x2 * y1
+    return area / 2
+
+
+def get_area(ring: Ring) -> float:
+    """다각형의 면적"""
+    return abs(get_signed_area(ring))
+
+
+def get_centroid(ring: Ring) -> Point:
+    """다각형의 무게중심 (면적이 0이면 꼭짓점 평균)"""
+    area2 = 0.0
+    cx = cy = 0.0
+    n = len(ring)
+    for i in range(n):
+        x1, y1 = ring[i]
+        x2, y2 = ring[(i + 1) % n]
+        cross = x1 * y2 - x2 * y1
+        area2 += cross
+        cx += (x1 + x2) * cross
+        cy += (y1 + y2) * cross
+    if area2 == 0:
+        return (sum(pt[0] for pt in ring) / n, sum(pt[1] for pt in ring) / n)
+    return (cx / (3 * area2), cy / (3 * area2))
+
+
+def get_perimeter(ring: Ring, closed: bool = True) -> float:
+    """다각형(또는 폴리라인)의 둘레 길이"""
+    return sum(math.dist(a, b) for a, b in get_segments(ring, closed))
+
+
+def get_bbox(points: Sequence[Point]) -> BBox:
+    """점들의 축 정렬 바운딩박스"""
+    xs = [pt[0] for pt in points]
+    ys = [pt[1] for pt in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def inflate_bbox(bbox: BBox, dist: float) -> BBox:
+    """바운딩박스를 dist만큼 확장"""
+    return (bbox[0] - dist, bbox[1] - dist, bbox[2] + dist, bbox[3] + dist)
+
+
+def bbox_intersects(bbox_a: BBox, bbox_b: BBox) -> bool:
+    """두 바운딩박스가 교차하는지 확인"""
+    return not (
+        bbox_a[2] < bbox_b[0]
+        or bbox_a[0] > bbox_b[2]
+        or bbox_a[3] < bbox_b[1]
+        or bbox_a[1] > bbox_b[3]
+    )
+
+
+def get_segments(
+    points: Sequence[Point], closed: bool = True
+) -> List[Tuple[Point, Point]]:
+    """꼭짓점 리스트를 선분 리스트로 분해"""
+    n = len(points)
+    count = n if closed else n - 1
+    return [(points[i], points[(i + 1) % n]) for i in range(count)]
+
+
+# ================ 거리 / 교차 ================
+
+
+def get_closest_pt_on_segment(pt: Point, seg_a: Point, seg_b: Point) -> Point:
+    """선분 위에서 pt에 가장 가까운 점"""
+    dx = seg_b[0] - seg_a[0]
+    dy = seg_b[1] - seg_a[1]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return seg_a
+    t = ((pt[0] - seg_a[0]) * dx + (pt[1] - seg_a[1]) * dy) / length_sq
+    t = min(1.0, max(0.0, t))
+    return (seg_a[0] + t * dx, seg_a[1] + t * dy)
+
+
+def get_dist_pt_to_segment(pt: Point, seg_a: Point, seg_b: Point) -> float:
+    """점과 선분 사이의 거리"""
+    return math.dist(pt, get_closest_pt_on_segment(pt, seg_a, seg_b))
+
+
+def _cross(o: Point, a: Point, b: Point) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def segments_intersect(a1: Point, a2: Point, b1: Point, b2: Point) -> bool:
+    """두 선분이 교차(접촉 포함)하는지 확인"""
+    d1 = _cross(b1, b2, a1)
+    d2 = _cross(b1, b2, a2)
+    d3 = _cross(a1, a2, b1)
+    d4 = _cross(a1, a2, b2)
+    if ((d1 > 0 > d2) or (d1 < 0 < d2)) and ((d3 > 0 > d4) or (d3 < 0 < d4)):
+        return True
+
+    # 한 끝점이 다른 선분 위에 있는 경우
+    def on_segment(p: Point, q: Point, r: Point) -> bool:
+        return min(p[0], q[0]) <= r[0] <= max(p[0], q[0]) and min(p[1], q[1]) <= r[
+            1
+        ] <= max(p[1], q[1])
+
+    return (
+        (d1 == 0 and on_segment(b1, b2, a1))
+        or (d2 == 0 and on_segment(b1, b2, a2))
+        or (d3 == 0 and on_segment(a1, a2, b1))
+        or (d4 == 0 and on_segment(a1, a2, b2))
+    )
+
+
+def get_dist_segment_to_segment(a1: Point, a2: Point, b1: Point, b2: Point) -> float:
+    """두 선분 사이의 최소 거리"""
+    if segments_intersect(a1, a2, b1, b2):
+        return 0.0
+    return min(
+        get_dist_pt_to_segment(a1, b1, b2),
+        get_dist_pt_to_segment(a2, b1, b2),
+        get_dist_pt_to_segment(b1, a1, a2),
+        get_dist_pt_to_segment(b2, a1, a2),
+    )
+
+
+def get_dist_pt_to_ring(pt: Point, ring: Ring, closed: bool = True) -> float:
+    """점과 다각형 경계 사이의 거리"""
+    return min(get_dist_pt_to_segment(pt, a, b) for a, b in get_segments(ring, closed))
+
+
+def is_ring_near_ring(ring_a: Ring, ring_b: Ring, tol: float = TOL) -> bool:
+    """두 다각형 경계가 tol 거리 이내로 접근하는지 확인"""
+    segs_b = get_segments(ring_b)
+    for a1, a2 in get_segments(ring_a):
+        # 선분 바운딩박스로 먼저 거른다
+        bbox_a = inflate_bbox(get_bbox((a1, a2)), tol)
+        for b1, b2 in segs_b:
+            if not bbox_intersects(bbox_a, get_bbox((b1, b2))):
+                continue
+            if get_dist_segment_to_segment(a1, a2, b1, b2) <= tol:
+                return True
+    return False
+
+
+def is_pt_inside_ring(pt: Point, ring: Ring) -> bool:
+    """점이 다각형 내부에 있는지 확인 (ray crossing)"""
+    x, y = pt
+    inside = False
+    n = len(ring)
+    for i in range(n):
+        x1, y1 = ring[i]
+        x2, y2 = ring[(i + 1) % n]
+        if (y1 > y) != (y2 > y):
+            x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+            if x < x_cross:
+                inside = not inside
+    return inside
+
+
+def rings_intersect(ring_a: Ring, ring_b: Ring, tol: float = TOL) -> bool:
+    """두 다각형 영역이 만나는지 확인 (경계가 tol 이내로 접근하거나 한쪽이 다른 쪽을 포함)"""
+    bbox_a = get_bbox(ring_a)
+    bbox_b = get_bbox(ring_b)
+    if not bbox_intersects(inflate_bbox(bbox_a, tol), bbox_b):
+        return False
+
+    # 두 바운딩박스가 겹치는 범위 밖의 변은 상대 경계에 닿을 수 없다
+    common = inflate_bbox(
+        (
+            max(bbox_a[0], bbox_b[0]),
+            max(bbox_a[1], bbox_b[1]),
+            min(bbox_a[2], bbox_b[2]),
+            min(bbox_a[3], bbox_b[3]),
+        ),
+        tol,
+    )
+    segs_a = [
+        seg for seg in get_segments(ring_a) if bbox_intersects(get_bbox(seg), common)
+    ]
+    segs_b = [
+        (seg, inflate_bbox(get_bbox(seg), tol))
+        for seg in get_segments(ring_b)
+        if bbox_intersects(get_bbox(seg), common)
+    ]
+    for a1, a2 in segs_a:
+        bbox_seg = get_bbox((a1, a2))
+        for (b1, b2), bbox_other in segs_b:
+            if bbox_intersects(bbox_seg, bbox_other) and (
+                get_dist_segment_to_segment(a1, a2, b1, b2) <= tol
+            ):
+                return True
+    return is_pt_inside_ring(ring_a[0], ring_b) or is_pt_inside_ring(ring_b[0], ring_a)
+
+
+# ================ 분할 ================
+
+
+def divide_by_length(
+    points: Sequence[Point], length: float, include_start: bool = True
+) -> List[Point]:
+    """폴리라인을 주어진 길이 간격으로 나누는 점들 (Curve.DivideByLength 대응)"""
+    result = [tuple(points[0])] if include_start else []
+    remain = length
+    for a, b in get_segments(points, closed=False):
+        seg_length = math.dist(a[:2], b[:2])
+        pos = 0.0
+        while seg_length - pos >= remain - 1e-9:
+            pos += remain
+            t = pos / seg_length
+            result.append(tuple(pa + (pb - pa) * t for pa, pb in zip(a, b)))
+            remain = length
+        remain -= seg_length - pos
+    return result
+
+
+def get_line_x_ray(
+    origin: Point, direction: Point, seg_a: Point, seg_b: Point
+) -> Optional[float]:
+    """반직선과 선분의 교차 거리 (교차하지 않으면 None, direction은 단위벡터)"""
+    ex = seg_b[0] - seg_a[0]
+    ey = seg_b[1] - seg_a[1]
+    denom = direction[0] * ey - direction[1] * ex
+    if denom == 0:
+        return None
+    wx = seg_a[0] - origin[0]
+    wy = seg_a[1] - origin[1]
+    t = (wx * ey - wy * ex) / denom
+    u = (wx * direction[1] - wy * direction[0]) / denom
+    if t < 0 or u < 0 or u > 1:
+        return None
+    return t
+
+
+# ================ 오프셋 ================
+
+
+def _get_miter_velocities(ring: List[Point], sign: float) -> List[Point]:
+    """꼭짓점마다 offset 거리 1당 이동 벡터 (인접 두 변의 평행 이동선 교점 방향)"""
+    normals = []
+    for a, b in get_segments(ring):
+        dx = b[0] - a[0]
+        dy = b[1] - a[1]
+        length = math.hypot(dx, dy)
+        if length == 0:
+            normals.append((0.0, 0.0))
+            continue
+        normals.append((sign * dy / length, -sign * dx / length))
+
+    velocities = []
+    for i in range(len(ring)):
+        n_prev = normals[i - 1]
+        n_next = normals[i]
+        # 두 법선의 합 방향으로 1 / cos(θ/2) 만큼 이동
+        mx = n_prev[0] + n_next[0]
+        my = n_prev[1] + n_next[1]
+        dot = 1 + n_prev[0] * n_next[0] + n_prev[1] * n_next[1]
+        if dot < 1e-12:
+            # 되돌아가는 꼭짓점(180도)은 법선 방향으로만 이동
+            mx, my, dot = n_next[0], n_next[1], 1.0
+        velocities.append((mx / dot, my / dot))
+    return velocities
+
+
+def _remove_duplicate_pts(pts: Sequence[Point], tol: float) -> List[Point]:
+    """연속해서 tol 이내로 겹치는 꼭짓점을 하나로 (처음/끝 점 포함)"""
+    result = [pts[0]] if pts else []
+    for pt in pts[1:]:
+        if math.dist(pt, result[-1]) > tol:
+            result.append(pt)
+    while len(result) > 1 and math.dist(result[0], result[-1]) <= tol:
+        result.pop()
+    return result
+
+
+def _remove_spikes(pts: List[Point], tol: float) -> List[Point]:
+    """되돌아가는 꼭짓점(인접 두 변이 같은 직선에서 반대 방향)과 겹친 점을 제거"""
+    result = _remove_duplicate_pts(pts, tol)
+    i = 0
+    while len(result) >= 3 and i < len(result):
+        prev_pt, pt, next_pt = result[i - 1], result[i], result[(i + 1) % len(result)]
+        ax, ay = pt[0] - prev_pt[0], pt[1] - prev_pt[1]
+        bx, by = next_pt[0] - pt[0], next_pt[1] - pt[1]
+        scale = math.hypot(ax, ay) * math.hypot(bx, by)
+        if ax * bx + ay * by < 0 and abs(ax * by - ay * bx) <= 1e-9 * scale:
+            del result[i]
+            result = _remove_duplicate_pts(result, tol)
+            i = max(i - 1, 0)
+        else:
+            i += 1
+    return result
+
+
+def is_simple_ring(ring: Ring) -> bool:
+    """이웃하지 않는 변끼리 교차하지 않는 다각형인지 확인"""
+    segments = get_segments(ring)
+    n = len(segments)
+    bboxes = [get_bbox(segment) for segment in segments]
+    for i in range(n):
+        for j in range(i + 2, n):
+            if i == 0 and j == n - 1:
+                continue
+            if bbox_intersects(bboxes[i], bboxes[j]) and segments_intersect(
+                *segments[i], *segments[j]
+            ):
+                return False
+    return True
+
+
+def offset_ring(
+    ring: Ring, distance: float, tol: float = 1e-9
+) -> Optional[List[Point]]:
+    """닫힌 다각형을 miter 방식으로 offset (양수: 바깥쪽, 음수: 안쪽)
+
+    꼭짓점마다 인접 두 변의 평행 이동선의 교점을 구한다. offset 도중 길이가 0이 되는
+    변(모따기 같은 짧은 변)이 생기면 그 거리까지 offset 한 뒤 변을 지우고 이웃 변의
+    교점으로 이어서 offset 한다. 다각형이 사라지거나 갈라지거나 스스로 교차하는 경우
+    None을 반환한다.
+    """
+    current = _remove_duplicate_pts(ring, tol)
+    if len(current) < 3:
+        return None
+
+    # 반시계 방향 기준으로 바깥쪽 법선이 (dy, -dx)가 되도록 정렬
+    sign = 1.0 if get_signed_area(current) > 0 else -1.0
+    step = 1.0 if distance >= 0 else -1.0
+    remaining = abs(distance)
+    while True:
+        n = len(current)
+        velocities = [
+            (vx * step, vy * step) for vx, vy in _get_miter_velocities(current, sign)
+        ]
+        # 가장 먼저 길이가 0이 되는 변
+        event, event_index = remaining, -1
+        for i, (a, b) in enumerate(get_segments(current)):
+            va, vb = velocities[i], velocities[(i + 1) % n]
+            dx = b[0] - a[0]
+            dy = b[1] - a[1]
+            length = math.hypot(dx, dy)
+            shrink = ((va[0] - vb[0]) * dx + (va[1] - vb[1]) * dy) / length
+            if shrink > 0 and length / shrink <= event:
+                event, event_index = length / shrink, i
+
+        moved = [
+            (pt[0] + vx * event, pt[1] + vy * event)
+            for pt, (vx, vy) in zip(current, velocities)
+        ]
+        if event_index < 0:
+            break
+        # 길이가 0이 된 변(동시에 여러 개일 수 있음)의 끝점을 합치고 남은 거리만큼 이어서 offset
+        current = _remove_spikes(moved, max(tol, abs(distance) * 1e-9))
+        remaining -= event
+        if len(current) < 3:
+            return None
+
+    # 원래 변과 방향이 반대가 된 변이 있으면 유효하지 않은 결과
+    for (a, b), (c, d) in zip(get_segments(current), get_segments(moved)):
+        if (b[0] - a[0]) * (d[0] - c[0]) + (b[1] - a[1]) * (d[1] - c[1]) < 0:
+            return None
+    if get_signed_area(moved) * sign <= tol or not is_simple_ring(moved):
+        return None
+    return moved
+
+
+# ================ 볼록 껍질 / 최소 바운딩박스 ================
+
+
+def get_convex_hull(points: Sequence[Point]) -> List[Point]:
+    """점들의 볼록 껍질 (monotone chain, 반시계 방향, 일직선 위의 점 제외)"""
+    pts = sorted(set((float(pt[0]), float(pt[1])) for pt in points))
+    if len(pts) < 3:
+        return pts
+
+    lower = []  # type: List[Point]
+    for pt in pts:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], pt) <= 0:
+            lower.pop()
+        lower.append(pt)
+
+    upper = []  # type: List[Point]
+    for pt in reversed(pts):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], pt) <= 0:
+            upper.pop()
+        upper.append(pt)
+
+    return lower[:-1] + upper[:-1]
+
+
+def get_bbox_areas_by_edges(ring: Ring) -> List[Optional[float]]:
+    """ring의 각 변 방향으로 정렬한 바운딩박스 면적 (rotating calipers)
+
+    바운딩박스는 볼록 껍질로 결정되므로 변 방향들을 각도 순으로 정렬한 뒤
+    껍질 위의 네 지지점(+x, +y, -x, -y 방향 극점)을 한 방향으로만 전진시키며
+    면적을 구한다. 길이가 0인 변은 None.
+    """
+    hull = get_convex_hull(ring)
+    n = len(ring)
+    areas = [None] * n  # type: List[Optional[float]]
+    directions = []
+    for i, (a, b) in enumerate(get_segments(ring)):
+        dx = b[0] - a[0]
+        dy = b[1] - a[1]
+        length = math.hypot(dx, dy)
+        if length > 0:
+            directions.append(
+                (math.atan2(dy, dx) % (2 * math.pi), i, dx / length, dy / length)
+            )
+    if not directions:
+        return areas
+    directions.sort()
+
+    h = len(hull)
+
+    def dot(k: int, d: Point) -> float:
+        pt = hull[k % h]
+        return pt[0] * d[0] + pt[1] * d[1]
+
+    def advance(k: int, d: Point) -> int:
+        # 볼록 껍질 위에서 d 방향 내적이 커지는 동안 전진
+        for _ in range(h):
+            if dot(k + 1, d) < dot(k, d):
+                break
+            k += 1
+        return k % h
+
+    # 첫 방향에서 네 지지점을 선형 탐색으로 찾고, 이후에는 전진만 한다
+    _, _, ux, uy = directions[0]
+    supports = [(ux, uy), (-uy, ux), (-ux, -uy), (uy, -ux)]
+    calipers = [max(range(h), key=lambda k: dot(k, d)) for d in supports]
+
+    for _, i, ux, uy in directions:
+        supports = [(ux, uy), (-uy, ux), (-ux, -uy), (uy, -ux)]
+        calipers = [advance(k, d) for k, d in zip(calipers, supports)]
+        width = dot(calipers[0], supports[0]) - dot(calipers[2], supports[0])
+        height = dot(calipers[1], supports[1]) - dot(calipers[3], supports[1])
+        areas[i] = width * height
+    return areas
+
+
+def get_min_bbox_edge(ring: Ring, rel_tol: float = 1e-9) -> Optional[int]:
+    """바운딩박스 면적이 가장 작은 변의 인덱스 (같으면 뒤쪽 변)"""
+    areas = get_bbox_areas_by_edges(ring)
+    valid = [area for area in areas if area is not None]
+    if not valid:
+        return None
+    min_area = min(valid)
+    limit = min_area + abs(min_area) * rel_tol
+    return max(i for i, area in enumerate(areas) if area is not None and area <= limit)
+
+
+# ================ 자르기 ================
+
+
+def clip_ring_by_half_plane(ring: Ring, normal: Point, offset: float) -> List[Point]:
+    """normal 방향 투영값이 offset 이하인 쪽만 남긴 다각형 (Sutherland-Hodgman)
+
+    오목 다각형이 여러 조각으로 나뉘면 조각 사이가 폭 0인 변으로 이어지지만
+    면적은 그대로 맞다.
+    """
+    result = []  # type: List[Point]
+    n = len(ring)
+    for i in range(n):
+        a = ring[i]
+        b = ring[(i + 1) % n]
+        da = a[0] * normal[0] + a[1] * normal[1] - offset
+        db = b[0] * normal[0] + b[1] * normal[1] - offset
+        if da <= 0:
+            result.append((a[0], a[1]))
+        if (da < 0 < db) or (db < 0 < da):
+            t = da / (da - db)
+            result.append((a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t))
+    return result
+
+
+def trim_ring_from_edge(
+    ring: Ring,
+    edge_a: Point,
+    edge_b: Point,
+    target_area: float,
+    min_depth: float = 0.0,
+    area_tol: float = 0.01,
+    max_iter: int = 60,
+) -> Optional[List[Point]]:
+    """변(edge_a, edge_b)과 평행한 직선으로 ring을 잘라 변 쪽 면적을 target_area로 맞춘다
+
+    잘린 면적은 자르는 깊이에 대해 단조 증가하므로 이분법으로 깊이를 찾는다.
+    깊이는 min_depth보다 얕아지지 않으며, 이때 면적은 target_area보다 클 수 있다.
+    변의 길이가 0이거나 변 앞쪽에 영역이 없으면 None.
+    """
+    dx = edge_b[0] - edge_a[0]
+    dy = edge_b[1] - edge_a[1]
+    length = math.hypot(dx, dy)
+    if length == 0 or len(ring) < 3:
+        return None
+
+    # 변에서 다각형 안쪽을 향하는 단위 법선 (오목 다각형도 맞도록 변 중점 바로 옆 점으로 판정)
+    normal = (-dy / length, dx / length)
+    eps = max(length * 1e-6, 1e-9)
+    probe = (
+        (edge_a[0] + edge_b[0]) / 2 + normal[0] * eps,
+        (edge_a[1] + edge_b[1]) / 2 + normal[1] * eps,
+    )
+    if not is_pt_inside_ring(probe, ring):
+        normal = (-normal[0], -normal[1])
+    base = edge_a[0] * normal[0] + edge_a[1] * normal[1]
+    # 변 뒤쪽으로 넘어간 부분(오목 다각형의 다른 팔)은 처음부터 제외
+    ring = clip_ring_by_half_plane(ring, (-normal[0], -normal[1]), -base)
+    if len(ring) < 3:
+        return None
+
+    def clip(depth: float) -> List[Point]:
+        return clip_ring_by_half_plane(ring, normal, base + depth)
+
+    lo = max(min_depth, 0.0)
+    hi = max(pt[0] * normal[0] + pt[1] * normal[1] for pt in ring) - base
+    if hi <= lo:
+        return [(pt[0], pt[1]) for pt in ring]
+    trimmed = clip(lo)
+    if get_area(trimmed) >= target_area - area_tol:
+        return trimmed
+
+    for _ in range(max_iter):
+        mid = (lo + hi) / 2
+        trimmed = clip(mid)
+        area = get_area(trimmed)
+        if abs(area - target_area) <= area_tol:
+            break
+        if area < target_area:
+            lo = mid
+        else:
+            hi = mid
+    else:
+        trimmed = clip(hi)
+    return trimmed
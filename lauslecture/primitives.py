@@ -0,0 +1,241 @@
+"""__slots__ 기반 2D 기하 기본 타입과 NumPy 배열 일괄 생성
+
+헤드리스 경로에서 Rhino의 Point3d, Vector3d, LineCurve 대신 쓰는 가벼운 타입이다.
+인스턴스마다 __dict__를 만들지 않으므로 요소별로 객체를 많이 만드는 루프에서
+메모리와 생성 시간이 줄어든다.
+
+- Point: (x, y) 튜플 그대로이므로 planar 함수에 바로 넘길 수 있다.
+- Segment, Ring: 좌표만 slot에 들고 있으며 planar의 (a, b) 선분, 꼭짓점 리스트처럼 동작한다.
+- SegmentArray: 선분 N개를 (N, 2) 배열 두 개로 들고 길이, 방향 등을 한 번에 계산한다.
+  요소 객체가 필요할 때만 Segment로 꺼낸다. 이미 (K, 2) 배열인 주차 영역 꼭짓점에 쓴다.
+  꼭짓점이 적은 튜플 리스트는 배열 변환 비용이 더 크므로 planar 함수를 그대로 쓴다.
+
+    from lauslecture import primitives
+
+    segments = primitives.SegmentArray.from_vertices(vertices, closed=True)
+    longest = segments[int(segments.lengths.argmax())]
+    rings = primitives.rings_from_array(stall_corners)  # (N, 4, 2)
+"""
+import functools
+import math
+from typing import Iterator, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from lauslecture import planar
+from lauslecture.planar import BBox
+
+
+class Point(NamedTuple):
+    """2D 점 (튜플이므로 인스턴스 __dict__가 없다)"""
+
+    x: float
+    y: float
+
+    def distance_to(self, other: Sequence[float]) -> float:
+        return math.hypot(other[0] - self.x, other[1] - self.y)
+
+
+class Segment:
+    """두 점으로 된 선분 (a, b = segment 로 풀 수 있다)"""
+
+    __slots__ = ("a", "b")
+
+    def __init__(self, a: Point, b: Point) -> None:
+        self.a = a
+        self.b = b
+
+    def __iter__(self) -> Iterator[Point]:
+        yield self.a
+        yield self.b
+
+    @property
+    def length(self) -> float:
+        return math.hypot(self.b.x - self.a.x, self.b.y - self.a.y)
+
+    @property
+    def midpoint(self) -> Point:
+        return Point((self.a.x + self.b.x) / 2, (self.a.y + self.b.y) / 2)
+
+    @property
+    def direction(self) -> Tuple[float, float]:
+        """a -> b 단위 방향 (길이가 0이면 (0, 0))"""
+        length = self.length
+        if length == 0:
+            return (0.0, 0.0)
+        return ((self.b.x - self.a.x) / length, (self.b.y - self.a.y) / length)
+
+    @property
+    def bbox(self) -> BBox:
+        return (
+            min(self.a.x, self.b.x),
+            min(self.a.y, self.b.y),
+            max(self.a.x, self.b.x),
+            max(self.a.y, self.b.y),
+        )
+
+    def __repr__(self) -> str:
+        return "Segment({}, {})".format(tuple(self.a), tuple(self.b))
+
+
+class Ring:
+    """닫힌 다각형 (닫는 점을 반복하지 않는 꼭짓점 튜플)
+
+    길이, 인덱스, 반복을 지원하므로 planar의 Ring 인자로 그대로 쓸 수 있다.
+    """
+
+    __slots__ = ("points",)
+
+    def __init__(self, points: Sequence[Sequence[float]]) -> None:
+        self.points = tuple(Point(pt[0], pt[1]) for pt in points)
+
+    @classmethod
+    def _from_points(cls, points: Tuple[Point, ...]) -> "Ring":
+        ring = cls.__new__(cls)
+        ring.points = points
+        return ring
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __getitem__(self, i: int) -> Point:
+        return self.points[i]
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.points)
+
+    @property
+    def signed_area(self) -> float:
+        return planar.get_signed_area(self.points)
+
+    @property
+    def area(self) -> float:
+        return abs(self.signed_area)
+
+    @property
+    def bbox(self) -> BBox:
+        return planar.get_bbox(self.points)
+
+    def get_segments(self) -> List[Segment]:
+        points = self.points
+        n = len(points)
+        return [Segment(points[i], points[(i + 1) % n]) for i in range(n)]
+
+    def to_array(self) -> np.ndarray:
+        return np.array(self.points, dtype=float).reshape(-1, 2)
+
+    def __repr__(self) -> str:
+        return "Ring({} points, area={:.2f})".format(len(self.points), self.area)
+
+
+class SegmentArray:
+    """선분 N개를 시작점/끝점 (N, 2) 배열로 들고 있는 선분 묶음"""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        self.starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+        self.ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+
+    @classmethod
+    def from_vertices(
+        cls, vertices: Sequence[Sequence[float]], closed: bool = True
+    ) -> "SegmentArray":
+        """꼭짓점 (K, 2)를 차례로 잇는 선분들 (closed면 마지막 -> 처음 선분 포함)"""
+        pts = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        if closed:
+            return cls(pts, np.roll(pts, -1, axis=0))
+        return cls(pts[:-1], pts[1:])
+
+    @classmethod
+    def from_array(cls, segments: np.ndarray) -> "SegmentArray":
+        """(N, 2, 2) 배열에서 생성"""
+        segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2)
+        return cls(segments[:, 0], segments[:, 1])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, i: int) -> Segment:
+        (ax, ay), (bx, by) = self.starts[i].tolist(), self.ends[i].tolist()
+        return Segment(Point(ax, ay), Point(bx, by))
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self.ends - self.starts
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.linalg.norm(self.vectors, axis=1)
+
+    @property
+    def midpoints(self) -> np.ndarray:
+        return (self.starts + self.ends) / 2
+
+    @property
+    def directions(self) -> np.ndarray:
+        """단위 방향 (N, 2), 길이가 0인 선분은 (0, 0)"""
+        lengths = self.lengths[:, None]
+        return self.vectors / np.where(lengths == 0, 1, lengths)
+
+    @property
+    def normals(self) -> np.ndarray:
+        """진행 방향 오른쪽 단위 법선 (N, 2) (반시계 방향 다각형이면 바깥쪽)"""
+        directions = self.directions
+        return np.column_stack([directions[:, 1], -directions[:, 0]])
+
+    @property
+    def bboxes(self) -> np.ndarray:
+        """(N, 4) [min_x, min_y, max_x, max_y]"""
+        return np.hstack(
+            [np.minimum(self.starts, self.ends), np.maximum(self.starts, self.ends)]
+        )
+
+    def get_closest_points(self, pt: Sequence[float]) -> np.ndarray:
+        """각 선분 위에서 pt와 가장 가까운 점 (N, 2)"""
+        vectors = self.vectors
+        sq_lengths = np.einsum("ij,ij->i", vectors, vectors)
+        t = np.einsum(
+            "ij,ij->i", np.asarray(pt, dtype=float)[:2] - self.starts, vectors
+        )
+        t = np.clip(t / np.where(sq_lengths == 0, 1, sq_lengths), 0, 1)
+        return self.starts + vectors * t[:, None]
+
+    def to_array(self) -> np.ndarray:
+        return np.stack([self.starts, self.ends], axis=1)
+
+    def to_segments(self) -> List[Segment]:
+        """모든 선분을 Segment 객체로 꺼낸다 (요소 객체가 꼭 필요할 때만)"""
+        return [
+            Segment(Point(ax, ay), Point(bx, by))
+            for (ax, ay), (bx, by) in zip(self.starts.tolist(), self.ends.tolist())
+        ]
+
+
+# ================ 배열 일괄 생성 ================
+
+
+# Point._make는 파이썬 함수를 한 번 더 거치므로 tuple.__new__를 바로 부른다
+_make_point = functools.partial(tuple.__new__, Point)
+
+
+def points_from_array(points: np.ndarray) -> List[Point]:
+    """(N, 2) 이상의 배열에서 앞 두 열을 Point 리스트로"""
+    points = np.asarray(points, dtype=float)
+    return list(map(_make_point, points.reshape(-1, points.shape[-1])[:, :2].tolist()))
+
+
+def segments_from_array(segments: np.ndarray) -> List[Segment]:
+    """(N, 2, 2) 배열을 Segment 리스트로"""
+    return SegmentArray.from_array(segments).to_segments()
+
+
+def rings_from_array(rings: np.ndarray) -> List[Ring]:
+    """꼭짓점 수가 같은 다각형들 (N, K, 2) 배열을 Ring 리스트로 (예: 주차칸 꼭짓점)"""
+    rings = np.asarray(rings, dtype=float)
+    if not len(rings):
+        return []
+    return [
+        Ring._from_points(tuple(map(_make_point, ring)))
+        for ring in rings.reshape(len(rings), -1, 2).tolist()
+    ]
@@ -0,0 +1,114 @@
+"""그래스호퍼 컴포넌트 실행 환경 도구
+
+- lazy_import: ghpythonlib.components, shapefile 등 무거운 모듈을 실제 사용 시점에 import
+- reload_if_dev: LAUS_DEV=1 일 때만 utils 모듈을 매 solve마다 새로고침
+- get_state / cached / trim_state: solve가 반복되어도 유지되는 캐시 (scriptcontext.sticky 사용)
+- cached_file: 파일이 바뀌면 이전 값을 버리는 파일 읽기 캐시
+"""
+import importlib
+import os
+import types
+from typing import Any, Callable, Dict, Hashable, Sequence
+
+# 개발 모드: utils 수정 사항을 매 solve마다 반영
+DEV_MODE = os.environ.get("LAUS_DEV", "") == "1"
+
+
+class LazyModule(types.ModuleType):
+    """첫 속성 접근 시 실제 모듈을 import 하는 대리 모듈"""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+
+def lazy_import(name: str) -> LazyModule:
+    """모듈을 지연 import (이미 import 된 모듈도 같은 방식으로 감싼다)"""
+    return LazyModule(name)
+
+
+def reload_if_dev(*modules: types.ModuleType) -> None:
+    """개발 모드일 때만 모듈을 새로고침"""
+    if not DEV_MODE:
+        return
+    for module in modules:
+        importlib.reload(module)
+
+
+def _get_store() -> Dict[str, Any]:
+    try:
+        import scriptcontext as sc  # type: ignore
+
+        return sc.sticky
+    except ImportError:
+        return _LOCAL_STORE
+
+
+_LOCAL_STORE = {}  # type: Dict[str, Any]
+
+
+def get_state(namespace: str) -> Dict[Hashable, Any]:
+    """namespace별 상태 딕셔너리 (모듈 새로고침, solve 반복에도 유지)"""
+    store = _get_store()
+    key = "lauslecture." + namespace
+    if key not in store:
+        store[key] = {}
+    return store[key]
+
+
+def clear_state(namespace: str) -> None:
+    get_state(namespace).clear()
+
+
+def trim_state(namespace: str, max_entries: int) -> None:
+    """namespace 상태가 max_entries를 넘으면 가장 먼저 저장된 값부터 제거"""
+    state = get_state(namespace)
+    while len(state) > max_entries:
+        del state[next(iter(state))]
+
+
+def cached(namespace: str, key: Hashable, factory: Callable[[], Any]) -> Any:
+    """key에 해당하는 값이 없을 때만 factory()로 계산하여 저장"""
+    state = get_state(namespace)
+    if key not in state:
+        state[key] = factory()
+    return state[key]
+
+
+def get_file_key(*paths: str) -> tuple:
+    """파일 경로와 수정 시각으로 만든 캐시 키 (파일이 바뀌면 키도 바뀐다)"""
+    return tuple((path, os.path.getmtime(path)) for path in paths)
+
+
+def cached_file(
+    namespace: str,
+    paths: Sequence[str],
+    factory: Callable[[], Any],
+    extra: tuple = (),
+    max_entries: int = 4,
+) -> Any:
+    """파일에서 읽은 값을 캐시 (파일 묶음마다 최신 수정 시각의 값 하나만 유지)
+
+    같은 경로의 파일이 바뀌면 이전 값을 덮어쓰고, 경로 묶음이 max_entries를 넘으면
+    가장 오래 쓰지 않은 것부터 제거한다.
+    """
+    state = get_state(namespace)
+    name = tuple(paths) + tuple(extra)
+    file_key = get_file_key(*paths)
+    entry = state.pop(name, None)
+    if entry is None or entry[0] != file_key:
+        entry = (file_key, factory())
+    # 최근 사용한 값을 뒤로 보낸다
+    state[name] = entry
+    trim_state(namespace, max_entries)
+    return entry[1]
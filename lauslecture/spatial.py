@@ -0,0 +1,136 @@
+"""바운딩박스 기반 공간 인덱스"""
+import math
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from lauslecture import planar
+from lauslecture.planar import BBox
+
+
+class GridIndex:
+    """균일 격자 공간 인덱스
+
+    각 객체의 바운딩박스가 걸치는 격자 칸마다 객체 번호를 등록하고,
+    질의 바운딩박스가 걸치는 칸의 객체들만 후보로 돌려준다.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.cells = {}  # type: Dict[Tuple[int, int], List[int]]
+        self.bboxes = []  # type: List[BBox]
+
+    @classmethod
+    def from_bboxes(cls, bboxes: Iterable[BBox], cell_size: float) -> "GridIndex":
+        index = cls(cell_size)
+        for bbox in bboxes:
+            index.insert(bbox)
+        return index
+
+    def _cell_range(self, bbox: BBox) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            math.floor(bbox[0] / size),
+            math.floor(bbox[1] / size),
+            math.floor(bbox[2] / size),
+            math.floor(bbox[3] / size),
+        )
+
+    def insert(self, bbox: BBox) -> int:
+        """바운딩박스를 등록하고 객체 번호를 반환"""
+        idx = len(self.bboxes)
+        self.bboxes.append(bbox)
+        min_i, min_j, max_i, max_j = self._cell_range(bbox)
+        for i in range(min_i, max_i + 1):
+            for j in range(min_j, max_j + 1):
+                self.cells.setdefault((i, j), []).append(idx)
+        return idx
+
+    def query(self, bbox: BBox) -> List[int]:
+        """bbox와 바운딩박스가 겹치는 객체 번호들 (오름차순)"""
+        found = set()  # type: Set[int]
+        min_i, min_j, max_i, max_j = self._cell_range(bbox)
+        for i in range(min_i, max_i + 1):
+            for j in range(min_j, max_j + 1):
+                found.update(self.cells.get((i, j), ()))
+
+        return sorted(
+            idx
+            for idx in found
+            if not (
+                self.bboxes[idx][2] < bbox[0]
+                or self.bboxes[idx][0] > bbox[2]
+                or self.bboxes[idx][3] < bbox[1]
+                or self.bboxes[idx][1] > bbox[3]
+            )
+        )
+
+
+def _merge_bboxes(bboxes: Sequence[BBox]) -> BBox:
+    return (
+        min(b[0] for b in bboxes),
+        min(b[1] for b in bboxes),
+        max(b[2] for b in bboxes),
+        max(b[3] for b in bboxes),
+    )
+
+
+class BBoxTree:
+    """정적 바운딩박스 트리 (STR 일괄 구성)
+
+    바운딩박스를 중심 x로 정렬해 세로 띠로 나누고, 띠마다 중심 y로 정렬해
+    node_size개씩 묶는 것을 루트 하나가 남을 때까지 반복한다.
+    크기가 제각각인 객체(건물 바닥 등)도 격자 크기 없이 다룰 수 있다.
+    """
+
+    def __init__(self, bboxes: Iterable[BBox], node_size: int = 8) -> None:
+        if node_size < 2:
+            raise ValueError("node_size must be at least 2")
+        self.bboxes = list(bboxes)  # type: List[BBox]
+        self.node_size = node_size
+        # 아래 레벨부터 [(노드 바운딩박스, 자식 번호들)], 가장 아래 자식은 객체 번호
+        self.levels = []  # type: List[List[Tuple[BBox, List[int]]]]
+
+        entries = list(enumerate(self.bboxes))
+        while entries:
+            level = [
+                (_merge_bboxes([bbox for _, bbox in group]), [idx for idx, _ in group])
+                for group in self._pack(entries)
+            ]
+            self.levels.append(level)
+            if len(level) == 1:
+                break
+            entries = [(j, bbox) for j, (bbox, _) in enumerate(level)]
+
+    def _pack(self, entries: List[Tuple[int, BBox]]) -> List[List[Tuple[int, BBox]]]:
+        size = self.node_size
+        node_count = math.ceil(len(entries) / size)
+        slice_size = math.ceil(math.sqrt(node_count)) * size
+
+        entries = sorted(entries, key=lambda e: e[1][0] + e[1][2])
+        groups = []
+        for start in range(0, len(entries), slice_size):
+            vertical = sorted(
+                entries[start : start + slice_size], key=lambda e: e[1][1] + e[1][3]
+            )
+            groups.extend(vertical[i : i + size] for i in range(0, len(vertical), size))
+        return groups
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def query(self, bbox: BBox) -> List[int]:
+        """bbox와 바운딩박스가 겹치는 객체 번호들 (오름차순)"""
+        if not self.levels:
+            return []
+        nodes = range(len(self.levels[-1]))
+        for level in reversed(self.levels):
+            children = []  # type: List[int]
+            for j in nodes:
+                node_bbox, node_children = level[j]
+                if planar.bbox_intersects(node_bbox, bbox):
+                    children.extend(node_children)
+            nodes = children
+        return sorted(
+            idx for idx in nodes if planar.bbox_intersects(self.bboxes[idx], bbox)
+        )
@@ -0,0 +1,19 @@
+"""Lecture3 지형 처리의 Rhino 비의존 구현"""
+from typing import List, Sequence, Tuple
+
+from lauslecture import planar
+
+Point3 = Tuple[float, float, float]
+
+
+def create_points_for_mesh(
+    contours: Sequence[Sequence[Point3]], resolution: float
+) -> List[Point3]:
+    """등고선 폴리라인들을 resolution 간격으로 나눈 메시 생성용 점들"""
+    points = []
+    for contour in contours:
+        # 분할 길이보다 짧은 등고선은 Curve.DivideByLength처럼 건너뛴다
+        if len(contour) < 2 or planar.get_perimeter(contour, False) < resolution:
+            continue
+        points.extend(planar.divide_by_length(contour, resolution, True))
+    return points
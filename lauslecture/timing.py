@@ -0,0 +1,179 @@
+"""단계별 실행 시간 측정 도구
+
+사용 예:
+    from lauslecture import timing
+
+    with timing.stage("delaunay"):
+        mesh = ghcomp.DelaunayMesh(points)
+
+    @timing.timed("contour_build")
+    def create_contour_curves(...):
+        ...
+
+    print(timing.summary())
+    timing.dump_json("trace.json")
+"""
+import functools
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class StageStat:
+    """단계 하나의 누적 통계"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+
+
+class StageTimer:
+    """단계별 소요 시간과 호출 횟수를 기록하는 타이머"""
+
+    def __init__(self) -> None:
+        self.stats = {}  # type: Dict[str, StageStat]
+        self.events = []  # type: List[Dict[str, Any]]
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    def reset(self) -> None:
+        """기록 초기화 (그래스호퍼 solve 시작 시 호출)"""
+        self.stats = {}
+        self.events = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    def record(self, name: str, start: float, elapsed: float) -> None:
+        """측정된 구간 하나를 기록"""
+        if name not in self.stats:
+            self.stats[name] = StageStat(name)
+        self.stats[name].add(elapsed)
+        self.events.append(
+            {
+                "name": name,
+                "start": start - self._origin,
+                "duration": elapsed,
+                "depth": self._depth,
+            }
+        )
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with 블록의 소요 시간을 name 단계로 기록"""
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.record(name, start, time.perf_counter() - start)
+
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """함수 호출 시간을 기록하는 데코레이터 (기본 단계명은 함수명)"""
+
+        def decorator(func: Callable) -> Callable:
+            stage_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(stage_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def summary(self) -> str:
+        """누적 시간이 큰 순서로 정렬된 요약 표"""
+        stats = sorted(self.stats.values(), key=lambda s: s.total, reverse=True)
+        # 최상위 단계들의 합을 전체 시간으로 사용 (중첩 단계 중복 방지)
+        wall = sum(e["duration"] for e in self.events if e["depth"] == 0)
+
+        lines = [
+            "{:<24s} {:>7s} {:>10s} {:>10s} {:>10s} {:>7s}".format(
+                "stage", "calls", "total(s)", "mean(ms)", "max(ms)", "share"
+            ),
+            "-" * 73,
+        ]
+        for stat in stats:
+            share = stat.total / wall * 100 if wall else 0.0
+            lines.append(
+                "{:<24s} {:>7d} {:>10.3f} {:>10.2f} {:>10.2f} {:>6.1f}%".format(
+                    stat.name,
+                    stat.count,
+                    stat.total,
+                    stat.mean * 1000,
+                    stat.max * 1000,
+                    share,
+                )
+            )
+        lines.append("-" * 73)
+        lines.append("{:<24s} {:>7s} {:>10.3f}".format("total", "", wall))
+        return "\n".join(lines)
+
+    def to_trace(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 trace (Chrome trace event 형식 포함)"""
+        return {
+            "stages": {
+                stat.name: {
+                    "count": stat.count,
+                    "total": stat.total,
+                    "mean": stat.mean,
+                    "max": stat.max,
+                }
+                for stat in self.stats.values()
+            },
+            # chrome://tracing, Perfetto 에서 바로 열 수 있는 형식 (단위: us)
+            "traceEvents": [
+                {
+                    "name": event["name"],
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["duration"] * 1e6,
+                    "pid": 0,
+                    "tid": 0,
+                }
+                for event in self.events
+            ],
+        }
+
+    def dump_json(self, path: str) -> None:
+        """trace를 JSON 파일로 저장"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_trace(), f, indent=2)
+
+
+# 모듈 단위 기본 타이머
+TIMER = StageTimer()
+
+
+def stage(name: str):
+    return TIMER.stage(name)
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    return TIMER.timed(name)
+
+
+def reset() -> None:
+    TIMER.reset()
+
+
+def summary() -> str:
+    return TIMER.summary()
+
+
+def dump_json(path: str) -> None:
+    TIMER.dump_json(path)
@@ -0,0 +1,71 @@
+"""lauslecture.offsetting의 메모/묶기/거리별 offset 재사용 확인 (Rhino 없이)"""
+from lauslecture import offsetting, runtime
+
+
+class _Path:
+    def __init__(self, *indices):
+        self.Indices = list(indices)
+
+
+class _Tree:
+    def __init__(self, branches):
+        self.Paths = [_Path(i, 0) for i, _ in branches]
+        self.Branches = [branch for _, branch in branches]
+
+
+class _ShrinkFamily(offsetting.InwardOffsetFamily):
+    CACHE_NAMESPACE = "tests.offset_family"
+
+    def __init__(self, regions, calls):
+        super().__init__(regions, tuple(regions))
+        self.calls = calls
+
+    def offset(self, curves, dist):
+        self.calls.append(dist)
+        return [crv - dist for crv in curves if crv - dist > 0]
+
+    def copy(self, curve):
+        return curve
+
+
+def test_group_tree_by_input():
+    tree = _Tree([(0, ["a"]), (2, ["b", None, "c"])])
+    assert offsetting.group_tree_by_input(tree, 3) == [["a"], [], ["b", "c"]]
+    assert offsetting.group_tree_by_input(["a", None], 1) == [["a"]]
+
+
+def test_memoize_batch_computes_missing_keys_once():
+    runtime.clear_state("tests.memo")
+    computed = []
+
+    def compute(missing):
+        computed.append(list(missing))
+        return [[keys[i]] for i in missing]
+
+    keys = ["a", "b", "a"]
+    values = offsetting.memoize_batch("tests.memo", keys, compute, list, 4)
+    assert values == [["a"], ["b"], ["a"]]
+    assert values[0] is not values[2]
+
+    keys = ["b", "c"]
+    assert offsetting.memoize_batch("tests.memo", keys, compute, list, 4) == [
+        ["b"],
+        ["c"],
+    ]
+    assert computed == [[0, 1, 2], [1]]
+
+
+def test_memoize_batch_trims_least_recently_used():
+    runtime.clear_state("tests.memo")
+    for keys in (["a"], ["b"], ["a"], ["c"]):
+        offsetting.memoize_batch("tests.memo", keys, lambda m: [0] * len(m), int, 2)
+    assert list(runtime.get_state("tests.memo")) == ["a", "c"]
+
+
+def test_inward_offset_family_reuses_smaller_distance():
+    runtime.clear_state(_ShrinkFamily.CACHE_NAMESPACE)
+    calls = []
+    family = _ShrinkFamily([10.0, 4.0], calls)
+    assert family.get([3.0]) == {3.0: [7.0, 1.0]}
+    assert family.get([5.0, 3.0]) == {5.0: [5.0], 3.0: [7.0, 1.0]}
+    assert calls == [3.0, 2.0]
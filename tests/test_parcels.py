@@ -0,0 +1,71 @@
+"""lauslecture.parcels가 Lecture2 스크립트와 같은 필지를 고르는지 확인
+
+Lecture2/01_find_landlocked_parcels.py, 02_find_flaglot_parcels.py는 Rhino에서만
+실행되므로, 작은 대지 배치에서 두 스크립트가 내는 결과를 기대값으로 적어 두고 비교한다.
+(도로 경계는 외부 경계 + 내부 구멍, 접근 판단 거리 0.5, 자루형 offset 4)
+"""
+import pytest
+
+from lauslecture import backends, parcels
+
+# 아래쪽 도로 (y: -10 ~ 0)
+ROADS = [
+    [(0, -10), (100, -10), (100, 0), (0, 0)],
+    # 가운데가 비어 있는 도로 (구멍은 ROAD_HOLES)
+    [(100, 0), (160, 0), (160, 60), (100, 60)],
+]
+ROAD_HOLES = [[(110, 10), (150, 10), (150, 50), (110, 50)]]
+
+LOTS = [
+    # 0: 도로에 접한 정사각형
+    [(0, 0), (20, 0), (20, 20), (0, 20)],
+    # 1: 도로에 접한 폭 6의 좁은 필지 (안쪽 offset이 비어 자루형이 아님)
+    [(20, 0), (26, 0), (26, 30), (20, 30)],
+    # 2: 폭 3의 통로로만 도로에 닿는 자루형
+    [(30, 0), (33, 0), (33, 20), (50, 20), (50, 40), (30, 40)],
+    # 3: 맹지
+    [(60, 30), (80, 30), (80, 50), (60, 50)],
+    # 4: 도로 구멍 안의 자루형 (통로가 구멍 경계에 닿음)
+    [
+        (120, 10),
+        (123, 10),
+        (123, 25),
+        (145, 25),
+        (145, 45),
+        (115, 45),
+        (115, 25),
+        (120, 25),
+    ],
+    # 5: 도로 구멍 경계에 접한 정사각형
+    [(140, 10), (150, 10), (150, 22), (140, 22)],
+]
+
+LECTURE2_LANDLOCKED = [3]
+LECTURE2_FLAG_LOTS = [2, 4]
+
+
+@pytest.fixture
+def backend():
+    return backends.load_backend("python")
+
+
+def test_landlocked_lots_match_lecture2(backend):
+    result = parcels.find_landlocked_lots(LOTS, ROADS, ROAD_HOLES, backend=backend)
+    assert result == LECTURE2_LANDLOCKED
+
+
+def test_flag_lots_match_lecture2(backend):
+    result = parcels.find_flag_lots(LOTS, ROADS, ROAD_HOLES, backend=backend)
+    assert result == LECTURE2_FLAG_LOTS
+
+
+def test_narrow_lot_is_not_flag_shaped():
+    road_rings = [ROADS[0]]
+    index = parcels.create_road_index(road_rings)
+    assert not parcels.is_flag_shaped(LOTS[1], road_rings, index, 4.0)
+
+
+def test_lots_in_road_holes_need_hole_rings(backend):
+    # 구멍을 빼면 구멍 안의 필지는 도로 경계에 닿지 않는다
+    result = parcels.find_landlocked_lots(LOTS, ROADS, backend=backend)
+    assert result == [3, 4, 5]
@@ -0,0 +1,45 @@
+"""lauslecture.parking.rules.validate의 경계 검사 확인"""
+import numpy as np
+
+from lauslecture import planar
+from lauslecture.parking import rules
+
+# 폭 2의 목으로 이어진 두 방 (이격거리 1.5로 안쪽 offset 하면 둘로 갈라진다)
+DUMBBELL = np.array(
+    [
+        (0, 0),
+        (20, 0),
+        (20, 9),
+        (30, 9),
+        (30, 0),
+        (50, 0),
+        (50, 20),
+        (30, 20),
+        (30, 11),
+        (20, 11),
+        (20, 20),
+        (0, 20),
+    ],
+    dtype=float,
+)
+
+
+def get_stall(x: float, y: float, width: float = 2.5, length: float = 5.0):
+    return [(x, y), (x + width, y), (x + width, y + length), (x, y + length)]
+
+
+def test_split_clearance_keeps_stalls_in_both_parts():
+    assert planar.offset_ring([tuple(pt) for pt in DUMBBELL], -1.5) is None
+    corners = np.array([get_stall(5, 2), get_stall(40, 2), get_stall(0.5, 10)])
+    result = rules.validate(
+        corners, rules.ParkingRules(boundary_clearance=1.5), DUMBBELL
+    )
+    assert result.in_boundary.tolist() == [True, True, False]
+    assert result.has_aisle[:2].all()
+
+
+def test_vanished_clearance_invalidates_stalls():
+    region = np.array([(0, 0), (4, 0), (4, 6), (0, 6)], dtype=float)
+    corners = np.array([get_stall(0.5, 0.5)])
+    result = rules.validate(corners, rules.ParkingRules(boundary_clearance=3.0), region)
+    assert not result.in_boundary.any()